@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+'''
+Benchmark of the Launch Rate of the `Command` launchers in a large parent process
+
+Usage: launch_benchmark.py [ballast_mb] [launch_count]
+
+It allocates `ballast_mb` MiB of touched memory to simulate a large supervisor process
+and launches `launch_count` short child processes with each launcher,
+one by one with `Command` objects and all at once with a `CommandGroup`
+
+@version: 2026-10-18
+
+@author: Bodo Hugo Barwich
+'''
+import sys
+import time
+
+sys.path.append("./")
+sys.path.append("../")
+
+from libcommand import Command
+from libcommand import CommandGroup
+
+
+
+sballastmb = 1024
+ilaunchcount = 200
+scommand = 'true'
+arrlaunchers = ['popen', 'spawn', 'forkserver']
+
+if len(sys.argv) > 1 :
+  sballastmb = int(sys.argv[1])
+
+if len(sys.argv) > 2 :
+  ilaunchcount = int(sys.argv[2])
+
+
+
+def runCommands(slauncher):
+  itmstrt = time.perf_counter()
+
+  for icmd in range(0, ilaunchcount) :
+    cmd = Command(scommand, {'launcher': slauncher})
+
+    if cmd.Launch() :
+      cmd.Wait()
+
+    cmd.freeResources()
+
+  #for icmd in range(0, ilaunchcount)
+
+  return ilaunchcount / (time.perf_counter() - itmstrt)
+
+
+def runGroup(slauncher):
+  grp = CommandGroup({'launcher': slauncher, 'quiet': True})
+
+  for icmd in range(0, ilaunchcount) :
+    grp.addsCommandLine(scommand)
+
+  itmstrt = time.perf_counter()
+
+  grp.Launch()
+
+  itmlaunch = time.perf_counter() - itmstrt
+
+  grp.Wait()
+  grp.freeResources()
+
+  return ilaunchcount / itmlaunch
+
+
+
+print("Ballast: '{}' MiB; Launches: '{}'".format(sballastmb, ilaunchcount))
+
+#Touch every Page to make the Memory resident
+ballast = bytearray(sballastmb * 1048576)
+
+for ipos in range(0, len(ballast), 4096) :
+  ballast[ipos] = 1
+
+for slauncher in arrlaunchers :
+  print("Launcher '{}': Command {:.1f} launches/s; CommandGroup {:.1f} launches/s"\
+  .format(slauncher, runCommands(slauncher), runGroup(slauncher)))
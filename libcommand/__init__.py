@@ -1,12 +1,19 @@
 '''
 Definition of the `libcommand` Package
 
-@version: 2021-04-03
+@version: 2026-10-18
 
 @author: Bodo Hugo Barwich
 '''
-__all__ = ['Command', 'CommandGroup', 'runCommand', 'runCommandWithOptions']
+__all__ = ['Command', 'CommandGroup', 'CommandPool', 'Pipeline', 'WorkerPool', 'PythonCommand', 'AsyncCommand', 'AsyncCommandGroup'\
+, 'ForkServer', 'CorePlacement', 'runCommand', 'runCommandWithOptions']
 
 from .command import Command
+from .forkserver import ForkServer
+from .placement import CorePlacement
 from .util import *
 from .commandgroup import CommandGroup
+from .commandpool import CommandPool
+from .pipeline import Pipeline
+from .workerpool import WorkerPool, PythonCommand
+from .asynccommand import AsyncCommand, AsyncCommandGroup
@@ -0,0 +1,710 @@
+'''
+This Module provides the `AsyncCommand` and `AsyncCommandGroup` Classes which launch and watch
+Child Processes within an `asyncio` Event Loop.
+They offer the same Results as the `Command` and `CommandGroup` Classes.
+
+:version: 2026-10-18
+
+:author: Bodo Hugo Barwich
+'''
+__docformat__ = "restructuredtext en"
+
+import sys
+import asyncio
+import time
+from datetime import datetime
+
+from .command import Command
+from .commandgroup import CommandGroup
+
+
+
+#==============================================================================
+# The AsyncCommand Class
+
+
+class AsyncCommand(Command):
+  '''
+  This is a Class launches a Child Process within the running `asyncio` Event Loop.
+  The STDOUT and STDERR pipes are read by the Pipe Transports of the Event Loop
+  and the exit of the child process is notified by the Child Watcher of the Event Loop
+
+  The Methods `Launch()`, `Wait()` and `Run()` are Coroutines.
+  The Results are accessed as with the `Command` Class
+
+  The Child Watcher reaps the child process itself. So for a child process in its own session
+  only the signals sent while it is running reach its process group and
+  processes of the group which survive the child process are not killed
+
+  :see: `Command.report`
+  :see: `Command.error`
+  :see: `Command.status`
+  :see: `Command.code`
+  '''
+
+
+
+  #----------------------------------------------------------------------------
+  #Constructors
+
+
+  def __init__(self, scommandline = None, options = {}):
+    '''
+    An `AsyncCommand` Object can be instantiated with a `scommandline`
+    `scommandline` is the executable plus the command line parameters passed to it
+
+    :param scommandline: The commmand and its parameters to be executed in the child process
+    :type scommandline: string
+    :param options: Additional options for the execution as key - value pairs
+    :type options: dictionary
+
+    :see: `Command.setDictOptions`
+    '''
+    self._reader = None
+    self._arr_queues = []
+
+    super().__init__(scommandline, options)
+
+
+
+  #-----------------------------------------------------------------------------------------
+  #Administration Methods
+
+
+  async def Launch(self, overrides = None):
+    '''
+    This Method launches the process defined by the `Command.command_line` Property
+    in a separate child process
+
+    :param overrides: Settings which only apply to this launch as key - value pairs
+    :type overrides: dictionary
+    :returns: Returns `True` if the launch of the child process succeeded
+    :rtype: boolean
+
+    :see: `Command.Launch()`
+    '''
+    brs = False
+
+    self._launch_overrides = dict(overrides or {})
+
+    if self._scommand != '' :
+      #------------------------
+      #Execute the configured Command
+
+      sprcnm = self.getNameComplete()
+      #Parse the Command Line once
+      arrcmd = self._parseCommand()
+
+      if self._bdebug :
+        self._arr_rpt.append("cmd arr: '{}'\n".format(str(arrcmd)))
+
+      self._pid = -1
+      self._process_status = -1
+      self._bkilled = False
+
+      if self._bprofiling :
+        #The Wall Clock Time is only recorded for the Logs
+        self._time_start = time.time()
+        self._itm_start_ns = time.perf_counter_ns()
+
+      #The Execution Timeout is counted on the Monotonic Clock
+      self._itm_launch_ns = time.monotonic_ns()
+
+      try :
+        #Open the Output Targets
+        self._openTargets()
+
+        #Launch the Child Process
+        self._process = await asyncio.create_subprocess_exec(*arrcmd\
+        , stdin = self._openInput()\
+        , stdout = self._getTargetArgument(self._tee_rpt)\
+        , stderr = self._getTargetArgument(self._tee_err)\
+        , start_new_session = self._bnew_session)
+
+        self._pid = self._process.pid
+
+        self._applyLimits()
+
+        #The Child Process holds its own Copy of the redirected Targets
+        self._releaseTargets()
+
+        #Read both Pipes and write the Input concurrently
+        self._reader = asyncio.ensure_future(asyncio.gather(\
+          self._readPipe(self._process.stdout, self._arr_rpt, 1, self._tee_rpt)\
+          , self._readPipe(self._process.stderr, self._arr_err, 2, self._tee_err)\
+          , self._writePipe(self._process.stdin)))
+        self._reader.add_done_callback(self._closeStreams)
+
+        brs = True
+
+        if self._bdebug :
+          self._arr_rpt.append("Sub Process {}: Launch OK - PID ({})\n"\
+          .format(sprcnm, self._pid))
+
+      except Exception as e :
+        self._arr_err.addNote("Command '{}': Launch failed with {}!\n".format(sprcnm, e.__class__.__name__))
+        self._arr_err.addNote("Exception [{}] Message: {}\n".format(e.errno, str(e)))
+        self._err_code = 1
+        self._process_status = e.errno
+        self._process = None
+
+        self._closeTargets()
+
+    #if self._scommand != ''
+
+    self._launch_overrides = {}
+
+    return brs
+
+
+  async def _readPipe(self, stream, arrbuffer, ifd, tee = None):
+    '''
+    This Method reads the pipe `stream` until the transmission has finished.
+    Each chunk is stored in `arrbuffer` and passed on to the running `Stream()` iterators.
+    In Tee Mode each chunk is also written to the output target `tee`
+
+    :param stream: The pipe of the child process
+    :type stream: asyncio.StreamReader
+    :param arrbuffer: The buffer in which the chunks are stored
+    :type arrbuffer: CaptureBuffer
+    :param ifd: The file descriptor number of the pipe in the child process
+    :type ifd: integer
+    :param tee: The state of the output target in Tee Mode
+    :type tee: dictionary
+    '''
+    if stream is None :
+      #The Output is redirected to a Target
+      return
+
+    brd = True
+    decoder = self._createDecoder()
+
+    if tee is not None :
+      #The Output is copied through Memory
+      tee['splice'] = False
+
+    while brd :
+      scnk = await stream.read(self._package_size)
+
+      if not scnk :
+        #The Transmission has finished
+        brd = False
+      elif ifd == 1 :
+        self._irpt_size += len(scnk)
+      else :
+        self._ierr_size += len(scnk)
+
+      if tee is not None \
+      and scnk :
+        self._writeTarget(tee, scnk)
+
+      if not self._bbinary :
+        #Incomplete Characters are kept until the next Read
+        scnk = decoder.decode(scnk, not brd)
+
+      if scnk :
+        arrbuffer.append(scnk)
+
+        self._emitChunk(ifd, scnk)
+
+      #if scnk
+
+      if not brd :
+        if tee is not None :
+          self._finishTarget(tee, arrbuffer)
+
+        if self._bdebug :
+          self._arr_rpt.append("pipe ({}): transmission done.\n".format(ifd))
+
+    #while brd
+
+
+  async def _writePipe(self, stream):
+    '''
+    This Method writes the input into the STDIN pipe `stream` and waits
+    whenever the pipe is full. The pipe is closed when all chunks are written
+
+    :param stream: The STDIN pipe of the child process
+    :type stream: asyncio.StreamWriter
+    '''
+    if stream is None :
+      #The Input is not written through a Pipe
+      return
+
+    try :
+      for scnk in self._input_iter :
+        if isinstance(scnk, str) :
+          scnk = scnk.encode(self.getEncoding(), self._encoding_errors)
+
+        stream.write(scnk)
+
+        await stream.drain()
+
+      #for scnk in self._input_iter
+
+      stream.close()
+    except (BrokenPipeError, ConnectionResetError) :
+      #The Child Process does not read any more Input
+      if self._bdebug :
+        self._arr_rpt.append("pipe (0): input closed by child.\n")
+
+    finally :
+      self._input_iter = None
+
+
+  def _emitChunk(self, ifd, scnk):
+    '''
+    This Method passes a chunk of received output to the output handlers
+    and to the running `Stream()` iterators
+    '''
+    super()._emitChunk(ifd, scnk)
+
+    for queue in self._arr_queues :
+      queue.put_nowait((ifd, scnk))
+
+
+  def _closeStreams(self, future):
+    '''
+    This Method notifies all running `Stream()` iterators that the transmission has finished
+    '''
+    if not future.cancelled() :
+      #Interrupted Transmissions are not reported as Error
+      future.exception()
+
+    for queue in self._arr_queues :
+      queue.put_nowait(None)
+
+
+  def Check(self):
+    '''
+    This Method checks whether the child process is still running without waiting.
+    The output is read by the Event Loop as long as it is running
+
+    :returns: Returns `True` if the child process is still running
+    :rtype: boolean
+    '''
+    return self._checkStatus()
+
+
+  def _checkStatus(self):
+    brng = False
+
+    if self._process is not None :
+      if self._process.returncode is not None :
+        #------------------------
+        #Child Process has finished
+
+        if self._process_status == -1 :
+          #Read the Process Status Code
+          self._process_status = self._process.returncode
+
+          if self._bdebug :
+            self._arr_rpt.append("prc ({}): finished with [{}].\n".format(self._pid, self._process_status))
+
+          if self._bprofiling :
+            self._recordExecutionTime()
+
+        #if self._process_status == -1
+
+      else :
+        #------------------------
+        #The Child Process is running
+
+        brng = True
+
+      #if self._process.returncode is not None
+    #if self._process is not None
+
+    return brng
+
+
+  async def _waitProcess(self):
+    '''
+    This Method waits until the child process has finished and all its output is read
+    '''
+    await asyncio.gather(asyncio.shield(self._reader), self._process.wait())
+
+
+  async def Wait(self):
+    '''
+    This Method waits until the child process has finished and all its output is read.
+    If an Execution Timeout is established the child process is terminated when the time limit is reached
+
+    :returns: Returns `True` if the child process has finished correctly
+    :rtype: boolean
+    '''
+    brs = True
+
+    sprcnm = self.getNameComplete()
+
+    if self.isRunning() :
+      try :
+        if self._execution_timeout > -1 :
+          #The Execution Timeout is counted from the Launch
+          await asyncio.wait_for(self._waitProcess()\
+          , max(self.getDeadline() - time.monotonic_ns(), 0) / 1000000000)
+        else :
+          await self._waitProcess()
+
+      except asyncio.TimeoutError :
+        self._arr_err.addNote("Sub Process {}: Execution timed out!\n".format(sprcnm))
+        self._arr_err.addNote("Execution Time '{} / {}'\n"\
+        .format((time.monotonic_ns() - self._itm_launch_ns) / 1000000000, self._execution_timeout))
+        self._arr_err.addNote("Process will be terminated.\n")
+
+        if(self._err_code < 4):
+          self._err_code = 4
+
+        #Terminate the Timed Out Sub Process
+        self.Terminate()
+
+        try :
+          #Give the Sub Process Time to exit
+          await asyncio.wait_for(asyncio.shield(self._process.wait()), self._grace_period)
+        except asyncio.TimeoutError :
+          #Kill the blocked Sub Process
+          self.Kill()
+
+        #Reap the Sub Process
+        await self._process.wait()
+
+        #Read the Last Messages from the Sub Process
+        await asyncio.wait({self._reader}, timeout = max(self._read_timeout, 1))
+
+        if not self._reader.done() :
+          #The Pipes are kept open by other Processes
+          self._reader.cancel()
+
+        #Mark the Sub Process as finished with Error
+        brs = False
+
+      #try
+
+      self._checkStatus()
+
+    #if self.isRunning()
+
+    return brs
+
+
+  async def Run(self):
+    '''
+    This Method launches the child process and waits until it has finished
+
+    :returns: Returns `True` if the child process has finished correctly
+    :rtype: boolean
+    '''
+    brs = False
+
+    if await self.Launch() :
+      brs = await self.Wait()
+
+    return brs
+
+
+  async def Stream(self):
+    '''
+    This Method is an asynchronous iterator over the output of the child process
+    as it is received. It yields tuples of the file descriptor number of the pipe,
+    "1" for STDOUT and "2" for STDERR, and the chunk of data.
+    The output is still stored and available with the `Command.report` and `Command.error` Properties.
+    Only output received after the iteration has started is yielded
+
+    :returns: Tuples of the file descriptor number and the chunk of data
+    :rtype: tuple
+    '''
+    if self._reader is not None \
+    and not self._reader.done() :
+      queue = asyncio.Queue()
+
+      self._arr_queues.append(queue)
+
+      try :
+        item = await queue.get()
+
+        while item is not None :
+          yield item
+
+          item = await queue.get()
+
+      finally :
+        self._arr_queues.remove(queue)
+
+    #if self._reader is not None and not self._reader.done()
+
+
+  def _freeSelector(self):
+    #The Pipes are owned by the Pipe Transports of the Event Loop
+    pass
+
+
+  def freeResources(self):
+    if self._bdebug :
+      self._arr_rpt.append("'{}' : Signal to '{}'\n"\
+      .format(sys._getframe(1).f_code.co_name, sys._getframe(0).f_code.co_name))
+
+    if self.isRunning() :
+      #Kill a still running Sub Process
+      self.Kill()
+
+    if self._reader is not None :
+      if not self._reader.done() :
+        self._reader.cancel()
+
+      self._reader = None
+
+    #Close the Targets of interrupted Transmissions
+    self._closeTargets()
+
+    #Free the Sub Process Object
+    self._process = None
+
+
+
+#==============================================================================
+# The AsyncCommandGroup Class
+
+
+class AsyncCommandGroup(CommandGroup):
+  '''
+  This is a Class to manage multiple `AsyncCommand` objects within the running `asyncio` Event Loop.
+
+  The Methods `Launch()`, `Wait()` and `Run()` are Coroutines.
+  The Results are accessed as with the `CommandGroup` Class
+  '''
+
+
+
+  #----------------------------------------------------------------------------
+  #Administration Methods
+
+
+  def Add(self, ocommand = None):
+    ors = None
+
+    if ocommand is not None :
+      ors = ocommand
+
+      if not isinstance(ors, AsyncCommand) :
+        ors = None
+
+    #if ocommand is not None
+
+    if ors is None :
+      #Create a new AsyncCommand Object
+      #Pass the Read Timeout to the new Object
+      ors = AsyncCommand(None, {'readtimeout': self._read_timeout})
+
+    #Add the Command Object to the List
+    self._arr_commands.append(ors)
+
+    return ors
+
+
+  def addsCommandLine(self, scommandline = '', options = {}):
+    #Create a new AsyncCommand Object
+    ors = AsyncCommand(scommandline, options)
+
+    #Add the Command Object to the List
+    self._arr_commands.append(ors)
+
+    return ors
+
+
+  async def Launch(self):
+    irs = 0
+    icmdcnt = len(self._arr_commands)
+
+    if self._bdebug :
+      self._arr_rpt.append("{} - go ...\n".format(sys._getframe(0).f_code.co_name))
+      self._arr_rpt.append("arr cmd cnt: '{}'\n".format(icmdcnt))
+
+    if icmdcnt > 0 :
+      cmd = None
+      scmdnm = ''
+      icmdidx = -1
+
+      stmnow = None
+
+      #Keep track of the Start Time
+      self._recordStart()
+
+      for icmdidx in range(0, icmdcnt):
+        cmd = self._arr_commands[icmdidx]
+
+        if cmd is not None :
+          scmdnm = "No. '{}' - {}".format(icmdidx, cmd.getNameComplete())
+
+          stmnow = datetime.now().strftime('%F %T')
+
+          self._arr_rpt.append("{} : Sub Process {}: Launching ...\n".format(stmnow, scmdnm))
+
+          overrides, splacement = self._prepareLaunch(icmdidx, cmd)
+
+          if await cmd.Launch(overrides) :
+            stmnow  = datetime.now().strftime('%F %T')
+
+            self._arr_rpt.append("{} : Sub Process {}: Launch OK - PID ({}){}\n"\
+            .format(stmnow, scmdnm, cmd.getProcessID(), splacement))
+
+            irs += 1
+          else :  #Sub Process Launch failed
+            self._arr_placements.pop(icmdidx, None)
+
+            if cmd.code > self._err_code :
+              #Keep the Child Process Error Code
+              self._err_code = cmd.code
+
+            self._arr_err.append("Sub Process {}: Launch failed!\nMessage: {}\n"\
+            .format(scmdnm, cmd.error))
+
+          #if await cmd.Launch()
+        #if cmd is not None
+      #for icmdidx in range(0, icmdcnt)
+    #if icmdcnt > 0
+
+    return irs
+
+
+  def Check(self):
+    '''
+    This Method checks all `AsyncCommand` objects once without waiting.
+    The output is read by the Event Loop as long as it is running
+
+    :returns: The count of child processes which are still running
+    :rtype: integer
+    '''
+    irs = 0
+
+    for cmd in self._arr_commands :
+      if cmd.isRunning() \
+      and cmd.Check() :
+        #Count the Running Child Processes
+        irs += 1
+
+    #for cmd in self._arr_commands
+
+    return irs
+
+
+  async def Wait(self, options = {}):
+    '''
+    This Method waits until all child processes have finished.
+    If an Execution Timeout is set the child processes are terminated when the time limit is reached
+
+    :returns: Returns `True` if all child processes have finished correctly
+    :rtype: boolean
+    '''
+    brs = True
+    itmwait = None
+    itmrng = -1
+
+    if self._bdebug :
+      self._arr_rpt.append("{} - go ...\n".format(sys._getframe(0).f_code.co_name))
+
+    if len(options) > 0 :
+      self.setDictOptions(options)
+
+    if self._itm_launch_ns < 0 :
+      #Set the Start Time if it is not set yet
+      self._recordStart()
+
+    dcttasks = {}
+
+    for cmd in self._arr_commands :
+      if cmd.isRunning() :
+        dcttasks[asyncio.ensure_future(cmd.Wait())] = cmd
+
+    #for cmd in self._arr_commands
+
+    while len(dcttasks) > 0 :
+      if self._execution_timeout > -1 :
+        itmwait = max(self._execution_timeout\
+        - (time.monotonic_ns() - self._itm_launch_ns) / 1000000000, 0)
+
+      done, pending = await asyncio.wait(set(dcttasks.keys()), timeout = itmwait\
+      , return_when = asyncio.FIRST_COMPLETED)
+
+      for task in done :
+        cmd = dcttasks.pop(task)
+
+        stmnow = datetime.now().strftime('%F %T')
+
+        self._arr_rpt.append("{} : Sub Process {}: finished with [{}]\n"\
+        .format(stmnow, cmd.getNameComplete(), cmd.status))
+
+      #for task in done
+
+      if len(done) == 0 :
+        #The Execution Timeout was reached
+        itmrng = (time.monotonic_ns() - self._itm_launch_ns) / 1000000000
+
+        self._arr_err.append("Sub Processes 'Count: {}': Execution timed out!\n".format(len(pending)))
+        self._arr_err.append("Execution Time '{} / {}'\nProcesses will be terminated.\n"\
+        .format(itmrng, self._execution_timeout))
+
+        if self._err_code < 4 :
+          self._err_code = 4
+
+        for cmd in dcttasks.values() :
+          if cmd.isRunning() :
+            #Terminate all Sub Processes at once
+            cmd._signalTerminate()
+
+        #for cmd in dcttasks.values()
+
+        fgraceseconds = self._grace_period
+
+        if fgraceseconds < 0 :
+          fgraceseconds = max([cmd.getGracePeriod() for cmd in dcttasks.values()])
+
+        #Give the Sub Processes Time to exit
+        done, pending = await asyncio.wait(pending, timeout = fgraceseconds)
+
+        for task in pending :
+          if dcttasks[task].isRunning() :
+            #Kill the blocked Sub Process
+            dcttasks[task].Kill()
+
+        #for task in pending
+
+        if len(pending) > 0 :
+          #Reap the Sub Processes and read their Last Messages
+          done, pending = await asyncio.wait(pending, timeout = max(self._read_timeout, 1))
+
+        for task in pending :
+          #The Pipes are kept open by other Processes
+          task.cancel()
+
+          if dcttasks[task]._reader is not None :
+            dcttasks[task]._reader.cancel()
+
+        #for task in pending
+
+        dcttasks = {}
+        brs = False
+
+      #if len(done) == 0
+    #while len(dcttasks) > 0
+
+    if self._bprofiling :
+      self._recordExecutionTime()
+
+    return brs
+
+
+  async def Run(self, options = {}):
+    brs = False
+
+    if self._bdebug :
+      self._arr_rpt.append("{} - go ...\n".format(sys._getframe(0).f_code.co_name))
+
+    if len(options) > 0 :
+      self.setDictOptions(options)
+
+    if await self.Launch() :
+      brs = await self.Wait()
+    else :  #Child Process Launch failed
+      self._arr_err.append("Sub Processes: Process Launch failed!\n")
+
+    return brs
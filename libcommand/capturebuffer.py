@@ -0,0 +1,635 @@
+'''
+This Module provides the `CaptureBuffer` Class which stores the captured output of a child process
+according to a Retention Policy.
+
+:version: 2026-10-18
+
+:author: Bodo Hugo Barwich
+'''
+__docformat__ = "restructuredtext en"
+
+import os
+import codecs
+import tempfile
+import mmap
+from collections import deque
+
+
+
+#==============================================================================
+# The CaptureBuffer Class
+
+
+class CaptureBuffer(object):
+  '''
+  This is a Class which stores chunks of captured output like a list
+  but limits the retained size according to its Retention Policy.
+  The recognized Retention Policies are:
+  * `all` - keep all chunks
+  * `tail` - keep only the last `CaptureBuffer.tail_size` units in a ring buffer
+  * `headtail` - keep the first `CaptureBuffer.head_size` units and the last `CaptureBuffer.tail_size` units
+
+  The units are bytes for `bytes` chunks and characters for `str` chunks.
+  When chunks were dropped the iteration yields a marker with the count of truncated units
+  between the retained head and tail
+
+  With the "all" policy the chunks can be spooled to a file when they exceed
+  the `CaptureBuffer.spool_threshold`. The spooled output is read back from the file
+  on iteration, so the retained output does not need to be held in memory
+
+  Notes are inserted between the chunks at the position where they were added.
+  They are not limited by the Retention Policy and are not written to the spool file.
+  Notes in dropped output are yielded after the truncation marker
+  '''
+
+
+
+  #----------------------------------------------------------------------------
+  #Constructors
+
+
+  def __init__(self, options = {}):
+    '''
+    A `CaptureBuffer` Object can be instantiated with a set of initial options `options`
+
+    :param options: The Retention Policy as key - value pairs
+    :type options: dictionary
+
+    :see: `CaptureBuffer.setDictOptions`
+    '''
+    self._arr_head = []
+    self._arr_tail = deque()
+    self._spolicy = 'all'
+    self._ihead_size = 0
+    self._itail_size = 0
+    self._ihead = 0
+    self._itail = 0
+    self._itruncated = 0
+    self._sunit = 'bytes'
+    self._ispool_threshold = -1
+    self._sspool_path = None
+    self._sspool_directory = None
+    self._spool = None
+    self._ispool = 0
+    self._encoding = 'utf-8'
+    self._encoding_errors = 'replace'
+    self._igeneration = 0
+    self._iappends = 0
+    self._arr_notes = []
+
+    if len(options) > 0 :
+      self.setDictOptions(options)
+
+
+  def __iter__(self):
+    '''
+    The iteration yields the retained head chunks, the truncation marker
+    and the retained tail chunks in their order together with the notes
+
+    :see: `CaptureBuffer.getChunks()`
+    '''
+    return self.getChunks()
+
+
+
+  #----------------------------------------------------------------------------
+  #Administration Methods
+
+
+  def setDictOptions(self, options = {}):
+    '''
+    This Method configures the `CaptureBuffer` object from a dictionary in the parameter `options`.
+    The recognized keys are:
+    * `policy` - the Retention Policy: "all", "tail" or "headtail"
+    * `head` - the count of units to keep from the beginning with the "headtail" policy
+    * `tail` - the count of units to keep from the end with the "tail" and "headtail" policies
+    * `unit` - the name of the units in the truncation marker
+    * `threshold` - the count of units after which the output is spooled to a file
+    * `path` - the path of the spool file
+    * `directory` - the directory in which an anonymous spool file is created
+
+    :param options: The Retention Policy as key - value pairs
+    :type options: dictionary
+
+    :see: `CaptureBuffer.setSpool()`
+    '''
+    self.setPolicy(options.get('policy', self._spolicy)\
+    , options.get('head', self._ihead_size), options.get('tail', self._itail_size))
+
+    if 'unit' in options :
+      self.setUnit(options['unit'])
+
+    if 'threshold' in options \
+    or 'path' in options \
+    or 'directory' in options :
+      self.setSpool(options.get('threshold', self._ispool_threshold)\
+      , options.get('path', self._sspool_path), options.get('directory', self._sspool_directory))
+
+
+  def setPolicy(self, spolicy = 'all', iheadsize = 0, itailsize = 0):
+    '''
+    This Method sets the Retention Policy.
+    Unknown policies are interpreted as "all". Negative sizes are interpreted as "0"
+
+    :param spolicy: The Retention Policy: "all", "tail" or "headtail"
+    :type spolicy: string
+    :param iheadsize: The count of units to keep from the beginning
+    :type iheadsize: integer
+    :param itailsize: The count of units to keep from the end
+    :type itailsize: integer
+    '''
+    if spolicy in ('all', 'tail', 'headtail') :
+      self._spolicy = spolicy
+    else :  #Unknown Policy
+      self._spolicy = 'all'
+
+    try :
+      self._ihead_size = max(int(iheadsize), 0)
+    except :
+      #The Parameter is not a Number
+      self._ihead_size = 0
+
+    try :
+      self._itail_size = max(int(itailsize), 0)
+    except :
+      #The Parameter is not a Number
+      self._itail_size = 0
+
+
+  def setUnit(self, sunit = 'bytes'):
+    self._sunit = sunit
+
+
+  def setSpool(self, ithreshold = -1, spath = None, sdirectory = None):
+    '''
+    This Method enables spooling the output to a file when the retained output exceeds
+    `ithreshold` units. Spooling only applies to the "all" policy.
+    If `spath` is given the output is written to this file which is kept after use,
+    otherwise an anonymous temporary file is created in `sdirectory`
+    or in the default temporary directory.
+    A negative threshold disables spooling
+
+    :param ithreshold: The count of units which are kept in memory
+    :type ithreshold: integer
+    :param spath: The path of the spool file
+    :type spath: string
+    :param sdirectory: The directory for the anonymous spool file
+    :type sdirectory: string
+    '''
+    try :
+      self._ispool_threshold = int(ithreshold)
+    except :
+      #The Parameter is not a Number
+      self._ispool_threshold = -1
+
+    self._sspool_path = spath
+    self._sspool_directory = sdirectory
+
+
+  def setEncoding(self, sencoding = 'utf-8', serrors = 'replace'):
+    '''
+    This Method sets the encoding with which `str` chunks are written to the spool file
+    and are read back from it
+
+    :param sencoding: The name of the encoding
+    :type sencoding: string
+    :param serrors: The name of the error handler
+    :type serrors: string
+    '''
+    self._encoding = sencoding
+    self._encoding_errors = serrors
+
+
+  def append(self, chunk):
+    '''
+    This Method adds a chunk of output and drops the oldest tail data
+    which exceeds the Retention Policy.
+    If the policy was changed to "all" after tail data was retained
+    the chunks are kept behind the retained tail
+
+    :param chunk: The chunk of output
+    :type chunk: string or bytes
+    '''
+    self._iappends += 1
+
+    if self._spolicy == 'all' :
+      if len(self._arr_tail) > 0 :
+        #Keep the Order behind the Truncation Marker
+        self._arr_tail.append(chunk)
+        self._itail += len(chunk)
+
+        return
+
+      if self._spool is not None :
+        self._writeSpool(chunk)
+
+        return
+
+      self._arr_head.append(chunk)
+      self._ihead += len(chunk)
+
+      if self._ispool_threshold > -1 \
+      and self._ihead > self._ispool_threshold :
+        self._openSpool()
+
+      return
+
+    if self._spolicy == 'headtail' \
+    and self._ihead < self._ihead_size :
+      #------------------------
+      #Fill the Head first
+
+      ifree = self._ihead_size - self._ihead
+
+      if len(chunk) <= ifree :
+        self._arr_head.append(chunk)
+        self._ihead += len(chunk)
+
+        return
+
+      self._arr_head.append(chunk[:ifree])
+      self._ihead += ifree
+
+      chunk = chunk[ifree:]
+
+    #if self._spolicy == 'headtail' and self._ihead < self._ihead_size
+
+    #------------------------
+    #Fill the Ring Buffer
+
+    self._arr_tail.append(chunk)
+    self._itail += len(chunk)
+
+    while self._itail > self._itail_size :
+      iexcess = self._itail - self._itail_size
+      chunk = self._arr_tail[0]
+
+      if len(chunk) <= iexcess :
+        #Drop the oldest Chunk
+        self._arr_tail.popleft()
+        self._itail -= len(chunk)
+        self._itruncated += len(chunk)
+      else :  #Cut the oldest Chunk
+        self._arr_tail[0] = chunk[iexcess:]
+        self._itail -= iexcess
+        self._itruncated += iexcess
+
+    #while self._itail > self._itail_size
+
+
+  def addNote(self, note):
+    '''
+    This Method inserts a note behind the chunks added so far.
+    The note is kept regardless of the Retention Policy
+
+    :param note: The note
+    :type note: string
+    '''
+    if self._spool is not None :
+      #The Note is placed by its Offset in the Spool File
+      self._arr_notes.append((self._iappends, self._ispool, note))
+    else :
+      self._arr_notes.append((self._iappends, None, note))
+
+
+  def _openSpool(self):
+    '''
+    This Method creates the spool file and moves the chunks held in memory into it.
+    If the file cannot be created the chunks stay in memory
+    '''
+    try :
+      if self._sspool_path is not None :
+        ifd = os.open(self._sspool_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+      else :  #Anonymous Spool File
+        ifd, spath = tempfile.mkstemp(prefix = 'libcommand-', dir = self._sspool_directory)
+
+        os.unlink(spath)
+
+      self._spool = open(ifd, 'r+b', buffering = 0)
+    except OSError :
+      #Keep the Output in Memory
+      self._ispool_threshold = -1
+      self._spool = None
+
+      return
+
+    arrnotes = []
+    inote = 0
+
+    for ichunk, chunk in enumerate(self._arr_head) :
+      #The Notes in Memory are placed by their Offset in the Spool File
+      while inote < len(self._arr_notes) \
+      and self._arr_notes[inote][0] <= ichunk :
+        arrnotes.append((self._arr_notes[inote][0], self._ispool, self._arr_notes[inote][2]))
+        inote += 1
+
+      self._writeSpool(chunk)
+
+    #for ichunk, chunk in enumerate(self._arr_head)
+
+    for note in self._arr_notes[inote:] :
+      arrnotes.append((note[0], self._ispool, note[2]))
+
+    self._arr_notes = arrnotes
+    self._arr_head = []
+    self._ihead = 0
+
+    #The retained Chunks have moved
+    self._igeneration += 1
+
+
+  def _writeSpool(self, chunk):
+    if isinstance(chunk, str) :
+      chunk = chunk.encode(self._encoding, self._encoding_errors)
+
+    ifd = self._spool.fileno()
+    iwritten = 0
+
+    while iwritten < len(chunk) :
+      #Write at the End independently of the File Position of Readers
+      iwritten += os.pwrite(ifd, chunk[iwritten:], self._ispool + iwritten)
+
+    self._ispool += iwritten
+
+
+  def _readSpool(self, arrnotes = ()):
+    '''
+    This Method reads the spool file in blocks without moving the file position.
+    With the unit "characters" the blocks are decoded.
+    The notes `arrnotes` are yielded at their offsets
+
+    :param arrnotes: The notes placed in the spool file
+    :type arrnotes: list
+    :returns: The chunks of the spool file
+    :rtype: generator
+    '''
+    decoder = None
+    ifd = self._spool.fileno()
+    ipos = 0
+    inote = 0
+
+    if self._sunit == 'characters' :
+      decoder = codecs.getincrementaldecoder(self._encoding)(self._encoding_errors)
+
+    while ipos < self._ispool :
+      iend = self._ispool
+
+      while inote < len(arrnotes) \
+      and arrnotes[inote][1] <= ipos :
+        yield arrnotes[inote][2]
+        inote += 1
+
+      if inote < len(arrnotes) :
+        #Stop reading at the next Note
+        iend = arrnotes[inote][1]
+
+      chunk = os.pread(ifd, min(iend - ipos, 1048576), ipos)
+
+      if len(chunk) == 0 :
+        break
+
+      ipos += len(chunk)
+
+      if decoder is not None :
+        yield decoder.decode(chunk)
+      else :
+        yield chunk
+
+    #while ipos < self._ispool
+
+    if decoder is not None :
+      yield decoder.decode(b'', True)
+
+    for note in arrnotes[inote:] :
+      yield note[2]
+
+
+  def _closeSpool(self):
+    if self._spool is not None :
+      self._spool.close()
+      self._spool = None
+
+    self._ispool = 0
+
+
+  def clear(self):
+    '''
+    This Method removes all chunks but keeps the Retention Policy.
+    A spool file is closed and an anonymous spool file is removed
+    '''
+    self._closeSpool()
+
+    self._igeneration += 1
+    self._iappends = 0
+
+    self._arr_head = []
+    self._arr_tail = deque()
+    self._arr_notes = []
+    self._ihead = 0
+    self._itail = 0
+    self._itruncated = 0
+
+
+
+  #----------------------------------------------------------------------------
+  #Consultation Methods
+
+
+  def getMark(self):
+    '''
+    This Method returns a mark of the current content of the buffer.
+    The mark changes whenever a chunk is added or the buffer is cleared
+
+    :returns: The mark of the current content
+    :rtype: tuple
+
+    :see: `CaptureBuffer.getAppendedChunks()`
+    '''
+    return (self._igeneration, self._iappends, len(self._arr_head), len(self._arr_notes))
+
+
+  def getChunks(self, bnotes = True):
+    '''
+    This Method yields the retained head chunks, the truncation marker
+    and the retained tail chunks in their order.
+    Each note is yielded before the chunk which was added after it
+
+    :param bnotes: Whether the notes are yielded
+    :type bnotes: boolean
+    :returns: The chunks and notes
+    :rtype: generator
+    '''
+    arrnotes = self._arr_notes if bnotes else []
+    inote = 0
+
+    for ichunk, chunk in enumerate(self._arr_head) :
+      while inote < len(arrnotes) \
+      and arrnotes[inote][0] <= ichunk :
+        yield arrnotes[inote][2]
+        inote += 1
+
+      yield chunk
+
+    #for ichunk, chunk in enumerate(self._arr_head)
+
+    if self._spool is not None :
+      ispooled = inote
+
+      while ispooled < len(arrnotes) \
+      and arrnotes[ispooled][1] is not None :
+        ispooled += 1
+
+      for chunk in self._readSpool(arrnotes[inote:ispooled]) :
+        yield chunk
+
+      inote = ispooled
+
+    #if self._spool is not None
+
+    if self._itruncated > 0 :
+      yield "\n[... truncated {} {} ...]\n".format(self._itruncated, self._sunit)
+
+    #Each Chunk of the Ring Buffer was added by its own Append
+    ifirst = self._iappends - len(self._arr_tail)
+
+    for ichunk, chunk in enumerate(self._arr_tail) :
+      while inote < len(arrnotes) \
+      and arrnotes[inote][0] <= ifirst + ichunk :
+        yield arrnotes[inote][2]
+        inote += 1
+
+      yield chunk
+
+    #for ichunk, chunk in enumerate(self._arr_tail)
+
+    for note in arrnotes[inote:] :
+      yield note[2]
+
+
+  def getAppendedChunks(self, mark):
+    '''
+    This Method returns the chunks which were appended since `mark` was taken.
+    This is only possible while all chunks were kept in memory in their order.
+    Otherwise the content must be read completely by iterating the buffer
+
+    :param mark: The mark returned by `CaptureBuffer.getMark()`
+    :type mark: tuple
+    :returns: The appended chunks or `None` if the content has changed otherwise
+    :rtype: list
+    '''
+    igeneration, iappends, ihead, inotes = mark
+
+    if igeneration != self._igeneration \
+    or inotes != len(self._arr_notes) \
+    or self._iappends - iappends != len(self._arr_head) - ihead \
+    or len(self._arr_tail) > 0 :
+      #Chunks were dropped, cut or spooled
+      return None
+
+    return self._arr_head[ihead:]
+
+
+  def getPolicy(self):
+    return self._spolicy
+
+
+  def getHeadSize(self):
+    return self._ihead_size
+
+
+  def getTailSize(self):
+    return self._itail_size
+
+
+  def getSpoolThreshold(self):
+    return self._ispool_threshold
+
+
+  def getSpoolPath(self):
+    return self._sspool_path
+
+
+  def isSpooled(self):
+    '''
+    CaptureBuffer.spooled Property which indicates whether the output was moved to a spool file
+
+    :returns: Whether the output is spooled to a file
+    :rtype: boolean
+    '''
+    return self._spool is not None
+
+
+  def getFile(self):
+    '''
+    This Method opens the spool file for reading from its beginning.
+    The returned file object has its own file descriptor and its own file position,
+    so several readers do not interfere. It must be closed by the caller
+
+    :returns: The spool file opened for reading or `None` if the output is not spooled
+    :rtype: io.BufferedReader
+    '''
+    if self._spool is None :
+      return None
+
+    try :
+      #Reopen the File Descriptor for an independent File Position
+      fspool = open("/proc/self/fd/{}".format(self._spool.fileno()), 'rb')
+    except OSError :
+      if self._sspool_path is None :
+        raise
+
+      fspool = open(self._sspool_path, 'rb')
+
+    return fspool
+
+
+  def getMap(self):
+    '''
+    This Method maps the spool file into memory read-only, so the spooled output
+    can be parsed without copying it into Python objects.
+    The map covers the output written until this call
+
+    :returns: The memory map of the spool file or `None` if the output is not spooled
+    :rtype: mmap.mmap
+    '''
+    if self._spool is None \
+    or self._ispool == 0 :
+      return None
+
+    return mmap.mmap(self._spool.fileno(), self._ispool, access = mmap.ACCESS_READ)
+
+
+  def getSize(self):
+    '''
+    CaptureBuffer.size Property which holds the count of retained units.
+    Spooled output is counted in bytes
+
+    :returns: The count of retained units
+    :rtype: integer
+    '''
+    return self._ihead + self._itail + self._ispool
+
+
+  def getTruncatedSize(self):
+    '''
+    CaptureBuffer.truncated Property which holds the count of dropped units
+
+    :returns: The count of dropped units
+    :rtype: integer
+    '''
+    return self._itruncated
+
+
+
+  #-----------------------------------------------------------------------------------------
+  #Properties
+
+
+  policy = property(getPolicy)
+  head_size = property(getHeadSize)
+  tail_size = property(getTailSize)
+  size = property(getSize)
+  truncated = property(getTruncatedSize)
+  spool_threshold = property(getSpoolThreshold)
+  spool_path = property(getSpoolPath)
+  spooled = property(isSpooled)
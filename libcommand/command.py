@@ -2,17 +2,79 @@
 This Module provides the `Command` Class which launches a Single Child Process
 in asynchronous Mode and captures possible Errors.
 
-:version: 2021-10-17
+:version: 2026-10-18
 
 :author: Bodo Hugo Barwich
 '''
 __docformat__ = "restructuredtext en"
 
 import sys
+import os
 import subprocess
 import selectors
 import time
+import signal
+import io
+import codecs
+import locale
+import stat
+import shutil
 from shlex import split
+from collections import deque
+
+from .capturebuffer import CaptureBuffer
+from .forkserver import getForkServer, isForkServerSupported, ForkServerProcess, decodeWaitStatus
+from .resourceusage import getUsageDict, readProcessSample
+from .limits import applyLimits
+
+try :
+  import fcntl
+except ImportError :
+  #The Pipe Size cannot be changed on this Platform
+  fcntl = None
+
+
+
+#==============================================================================
+# Module Functions
+
+
+def resizePipe(ifd, ipipesize, arrmessages = None):
+  '''
+  This Function enlarges the kernel buffer of the pipe `ifd` to `ipipesize` bytes.
+  If the system does not permit the size the kernel buffer is not changed
+
+  :param ifd: The file descriptor of the pipe
+  :type ifd: integer
+  :param ipipesize: The size of the kernel buffer in bytes
+  :type ipipesize: integer
+  :param arrmessages: The list to which the debug messages are appended
+  :type arrmessages: list
+  :returns: Whether the kernel buffer was resized
+  :rtype: boolean
+  '''
+  isetpipesize = None
+
+  if fcntl is not None :
+    #The Constant is only exported since Python 3.10
+    isetpipesize = getattr(fcntl, 'F_SETPIPE_SZ', 1031 if sys.platform.startswith('linux') else None)
+
+  if isetpipesize is None :
+    if arrmessages is not None :
+      arrmessages.append("pipe ({}): resize is not supported\n".format(ifd))
+
+    return False
+
+  try :
+    fcntl.fcntl(ifd, isetpipesize, ipipesize)
+  except OSError as e :
+    if arrmessages is not None :
+      arrmessages.append("pipe ({}): resize failed with [{}]: {}\n"\
+      .format(ifd, e.errno, str(e)))
+
+    return False
+
+  return True
 
 
 
@@ -55,26 +117,74 @@ class Command(object):
     self._pid = -1
     self._name = ''
     self._scommand = ''
+    self._parsed_command = None
     self._process = None
+    self._pidfd = None
     self._selector = None
+    self._bshared_selector = False
     self._package_size = 8192
+    self._max_package_size = 1048576
+    self._read_size_rpt = 8192
+    self._read_size_err = 8192
+    self._pipe_size = -1
     self._read_timeout = 0
     self._execution_timeout = -1
-    self._arr_rpt = []
-    self._arr_err = []
-    self._sreport = None
-    self._serror = None
+    self._bblocking = True
+    self._arr_rpt = CaptureBuffer({'unit': 'characters'})
+    self._arr_err = CaptureBuffer({'unit': 'characters'})
+    self._irpt_size = 0
+    self._ierr_size = 0
+    self._acc_report = None
+    self._acc_error = None
+    self._acc_report_bytes = None
+    self._acc_error_bytes = None
+    self._acc_error_output = None
+    self._bbinary = False
+    self._encoding = None
+    self._encoding_errors = 'replace'
+    self._decoder_rpt = None
+    self._decoder_err = None
+    self._slauncher = 'popen'
+    self._forkserver = None
+    self._limits = {}
+    self._bnew_session = False
+    self._bgroup_cleaned = False
+    self._grace_period = 1.0
+    self._input = None
+    self._launch_overrides = {}
+    self._input_iter = None
+    self._input_chunk = None
+    self._target_rpt = None
+    self._target_err = None
+    self._itee_tail = 0
+    self._tee_rpt = None
+    self._tee_err = None
+    self._fn_on_stdout = None
+    self._fn_on_stderr = None
+    self._fn_on_deadline = None
+    self._arr_streams = []
     self._err_code = 0
     self._process_status = -1
+    self._bkilled = False
     self._time_execution = -1
     self._time_start = -1
     self._time_end = -1
+    self._itm_launch_ns = -1
+    self._itm_start_ns = -1
+    self._itm_execution_ns = -1
+    self._rusage = {}
+    self._sample_interval = -1
+    self._itm_sample_ns = -1
+    self._sample = {}
+    self._sample_peaks = {}
     self._bprofiling = False
     self._bdebug = False
 
     if scommandline is not None :
       self._scommand = scommandline
 
+    self._setBufferEncoding()
+
     if len(options) > 0 :
       self.setDictOptions(options)
 
@@ -103,16 +213,50 @@ class Command(object):
     * `command` - the command to be run in the child process with its parameters
     * `check`|`read`|`readtimeout` - time in seconds to watch the child process
     * `timeout` - maximal execution time for the child process
+    * `blocking` - whether `Wait()` sleeps until the child process produces output or finishes
     * `debug` - enable debug messages
     * `profiling` - enable time measurements
-
-    The values `command` and `profiling` can only be set when the child process is not running yet
+    * `binary` - capture the output as raw `bytes` without decoding it
+    * `packagesize` - the size in bytes of a single read from the pipes
+    * `maxpackagesize` - the size in bytes up to which the reads grow while the pipes deliver full reads
+    * `pipesize` - the size in bytes of the kernel pipe buffers of the child process
+    * `retention` - the Retention Policy for the STDOUT and STDERR output
+      as dictionary with the keys `policy`, `head` and `tail`
+    * `reportretention` - the Retention Policy for the STDOUT output
+    * `errorretention` - the Retention Policy for the STDERR output
+    * `spool` - the Spool Options for the STDOUT and STDERR output
+      as dictionary with the keys `threshold` and `directory`
+    * `reportspool` - the Spool Options for the STDOUT output
+      as dictionary with the keys `threshold`, `path` and `directory`
+    * `errorspool` - the Spool Options for the STDERR output
+    * `encoding` - the encoding of the output of the child process
+    * `errors` - the handling of invalid output like in `bytes.decode()`
+    * `launcher` - the way the child process is created: "popen", "spawn" or "forkserver"
+    * `forkserver` - the `ForkServer` object which launches the child process
+    * `stdin` - the input for the child process as `bytes`, `str`, file descriptor, file object
+      or iterable of chunks
+    * `stdout` - the file path, file descriptor or file object to which STDOUT is written
+    * `stderr` - the file path, file descriptor or file object to which STDERR is written
+    * `tee` - keep the tail of the output written to `stdout` and `stderr` in memory
+    * `onstdout` - a callable which receives each chunk of STDOUT output
+    * `onstderr` - a callable which receives each chunk of STDERR output
+    * `sampling` - interval in seconds to sample the resource usage of the running child process
+    * `limits` - the resource limits, niceness, CPU affinity and cgroup of the child process
+    * `session` - launch the child process in its own session and process group
+    * `grace` - time in seconds a terminated child process has to exit before it is killed
+
+    The values `command`, `retention`, `reportretention`, `errorretention`, `profiling`, `binary`,
+    `packagesize`, `maxpackagesize`, `pipesize`, `encoding`, `errors`, `launcher`, `forkserver`,
+    `stdin`, `stdout`, `stderr`, `tee`, `limits` and `session` can only be set
+    when the child process is not running yet
 
     :param options: Additional options for the execution as key - value pairs
     :type options: dictionary
 
     :see: `Command.read_timeout`
     :see: `Command.timeout`
+    :see: `Command.setReportRetention()`
+    :see: `Command.setReportSpool()`
     '''
     if('name' in options):
       #Set the Name
@@ -130,6 +274,35 @@ class Command(object):
     if('timeout' in options):
       self.setTimeout(options['timeout'])
 
+    if('blocking' in options):
+      self.setBlocking(options['blocking'])
+
+    if('spool' in options):
+      self.setReportSpool(options['spool'].get('threshold', -1)\
+      , None, options['spool'].get('directory'))
+      self.setErrorSpool(options['spool'].get('threshold', -1)\
+      , None, options['spool'].get('directory'))
+
+    if('reportspool' in options):
+      self.setReportSpool(options['reportspool'].get('threshold', -1)\
+      , options['reportspool'].get('path'), options['reportspool'].get('directory'))
+
+    if('errorspool' in options):
+      self.setErrorSpool(options['errorspool'].get('threshold', -1)\
+      , options['errorspool'].get('path'), options['errorspool'].get('directory'))
+
+    if('onstdout' in options):
+      self.setReportHandler(options['onstdout'])
+
+    if('onstderr' in options):
+      self.setErrorHandler(options['onstderr'])
+
+    if('sampling' in options):
+      self.setSampleInterval(options['sampling'])
+
+    if('grace' in options):
+      self.setGracePeriod(options['grace'])
+
     if('debug' in options):
       self.setDebug(options['debug'])
 
@@ -138,9 +311,61 @@ class Command(object):
       if('command' in options):
         self.setCommand(options['command'])
 
+      if('retention' in options):
+        self._arr_rpt.setDictOptions(options['retention'])
+        self._arr_err.setDictOptions(options['retention'])
+
+      if('reportretention' in options):
+        self._arr_rpt.setDictOptions(options['reportretention'])
+
+      if('errorretention' in options):
+        self._arr_err.setDictOptions(options['errorretention'])
+
       if('profiling' in options):
         self.setProfiling(options['profiling'])
 
+      if('binary' in options):
+        self.setBinary(options['binary'])
+
+      if('packagesize' in options):
+        self.setPackageSize(options['packagesize'])
+
+      if('maxpackagesize' in options):
+        self.setMaxPackageSize(options['maxpackagesize'])
+
+      if('pipesize' in options):
+        self.setPipeSize(options['pipesize'])
+
+      if('encoding' in options):
+        self.setEncoding(options['encoding'])
+
+      if('errors' in options):
+        self.setEncodingErrors(options['errors'])
+
+      if('launcher' in options):
+        self.setLauncher(options['launcher'])
+
+      if('forkserver' in options):
+        self.setForkServer(options['forkserver'])
+
+      if('stdin' in options):
+        self.setInput(options['stdin'])
+
+      if('stdout' in options):
+        self.setReportTarget(options['stdout'])
+
+      if('stderr' in options):
+        self.setErrorTarget(options['stderr'])
+
+      if('tee' in options):
+        self.setTee(options['tee'])
+
+      if('limits' in options):
+        self.setLimits(options['limits'])
+
+      if('session' in options):
+        self.setNewSession(options['session'])
+
     #if(not self.isRunning())
 
 
@@ -156,11 +381,32 @@ class Command(object):
       self._process = None
       self._pid = -1
       self._process_status = -1
+      self._bkilled = False
 
     #unless($self->isRunning)
 
 
 
+  def setSelector(self, oselector = None):
+    '''
+    This Method assigns an external `selectors.BaseSelector` object in which the pipes
+    of the child process will be registered at launch time.
+    This allows a `CommandGroup` to watch all its child processes with a single selector.
+    The selector can only be changed when the child process is not running.
+    If `oselector` is `None` the `Command` object creates its own selector at launch time
+
+    :param oselector: The selector shared with other `Command` objects
+    :type oselector: selectors.BaseSelector
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      #Release an own Selector before replacing it
+      self._freeSelector()
+
+      self._selector = oselector
+      self._bshared_selector = oselector is not None
+
+
   def setReadTimeout(self, ireadtimeout = 1):
     if(ireadtimeout > -1):
       #Enable the Read Timeout
@@ -171,62 +417,626 @@ class Command(object):
 
 
   def setTimeout(self, iexecutiontimeout = -1):
+    '''
+    This Method sets the Execution Timeout in seconds. It is counted from the launch
+    of the child process, so a changed Execution Timeout also applies to a running child process.
+    The value "-1" disables the Execution Timeout
+
+    :param iexecutiontimeout: Time in seconds before forcefully terminating the child process
+    :type iexecutiontimeout: number
+
+    :see: `Command.getDeadline()`
+    '''
     self._execution_timeout = iexecutiontimeout
 
     if(self._execution_timeout < -1):
       #Disable Execution Timeout
       self._execution_timeout = -1
 
+    if self._fn_on_deadline is not None \
+    and self.isRunning() :
+      #The Deadline of the running Child Process has changed
+      self._fn_on_deadline(self)
+
+
+  def setBlocking(self, bisblocking = True):
+    '''
+    This Method enables or disables the Blocking Wait Mode.
+    In Blocking Wait Mode `Wait()` sleeps until the child process produces output or finishes
+    or the Execution Timeout is reached. Otherwise `Wait()` checks the child process
+    continuously within the `Command.read_timeout`
+
+    :param bisblocking: Whether `Wait()` will block until an event occurs
+    :type bisblocking: boolean
+    '''
+    self._bblocking = bisblocking
+
 
   def setProfiling(self, bisprofiling = True):
     self._bprofiling = bisprofiling
 
 
+  def setSampleInterval(self, fsampleinterval = -1):
+    '''
+    This Method sets the interval in seconds at which the resource usage of the running
+    child process is sampled from the `/proc` File System. The samples are taken by the check loop,
+    so `Wait()` wakes up at least at this interval.
+    The value "-1" disables the sampling
+
+    :param fsampleinterval: Time in seconds between two samples
+    :type fsampleinterval: number
+
+    :see: `Command.sample`
+    '''
+    try :
+      self._sample_interval = float(fsampleinterval)
+    except :
+      #The Parameter is not a Number
+      self._sample_interval = -1
+
+    if self._sample_interval <= 0 :
+      #Disable the Sampling
+      self._sample_interval = -1
+
+
+  def setBinary(self, bisbinary = True):
+    '''
+    This Method enables or disables the Binary Capture Mode.
+    In Binary Capture Mode the output of the child process is kept as raw `bytes`
+    and is only decoded when the `Command.report` or `Command.error` Properties are requested.
+    The mode can only be changed when the child process is not running
+
+    :param bisbinary: Whether the output is captured as `bytes`
+    :type bisbinary: boolean
+
+    :see: `Command.report_bytes`
+    :see: `Command.error_bytes`
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      self._bbinary = bisbinary
+
+      if self._bbinary :
+        self._arr_rpt.setUnit('bytes')
+        self._arr_err.setUnit('bytes')
+      else :
+        self._arr_rpt.setUnit('characters')
+        self._arr_err.setUnit('characters')
+
+      self._clearCache()
+
+    #if not self.isRunning()
+
+
+  def setReportRetention(self, policy = 'all', head = 0, tail = 0):
+    '''
+    This Method sets the Retention Policy for the STDOUT output.
+    The recognized policies are:
+    * `all` - keep the whole output
+    * `tail` - keep only the last `tail` units
+    * `headtail` - keep the first `head` units and the last `tail` units
+
+    The units are bytes in Binary Capture Mode and characters otherwise.
+    The dropped output is marked in the `Command.report`.
+    The count of received bytes is always available with `Command.report_size`.
+    The policy can only be changed when the child process is not running
+
+    :param policy: The Retention Policy: "all", "tail" or "headtail"
+    :type policy: string
+    :param head: The count of units to keep from the beginning
+    :type head: integer
+    :param tail: The count of units to keep from the end
+    :type tail: integer
+
+    :see: `CaptureBuffer`
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      self._arr_rpt.setPolicy(policy, head, tail)
+
+
+  def setErrorRetention(self, policy = 'all', head = 0, tail = 0):
+    '''
+    This Method sets the Retention Policy for the STDERR output.
+    The count of received bytes is always available with `Command.error_size`.
+    The Messages of this library about the child process are never dropped
+
+    :see: `Command.setReportRetention()`
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      self._arr_err.setPolicy(policy, head, tail)
+
+
+  def setReportSpool(self, threshold = -1, path = None, directory = None):
+    '''
+    This Method enables spooling the STDOUT output to a file once it exceeds
+    `threshold` units in memory. Spooling applies to the "all" Retention Policy.
+    The output is written to the file at `path` which is kept after use,
+    or to an anonymous temporary file in `directory` which is removed with `Command.clearErrors()`.
+    The units are bytes in Binary Capture Mode and characters otherwise.
+    A negative threshold disables spooling
+
+    :param threshold: The count of units which are kept in memory
+    :type threshold: integer
+    :param path: The path of the spool file
+    :type path: string
+    :param directory: The directory for the anonymous spool file
+    :type directory: string
+
+    :see: `Command.getReportFile()`
+    :see: `Command.getReportMap()`
+    '''
+    self._arr_rpt.setSpool(threshold, path, directory)
+
+
+  def setErrorSpool(self, threshold = -1, path = None, directory = None):
+    '''
+    This Method enables spooling the STDERR output to a file once it exceeds
+    `threshold` units in memory
+
+    :see: `Command.setReportSpool()`
+    '''
+    self._arr_err.setSpool(threshold, path, directory)
+
+
+  def setPackageSize(self, ipackagesize = 8192):
+    '''
+    This Method sets the size in bytes of a single read from the pipes of the child process.
+    This is also the smallest size to which the reads shrink when the pipes become idle.
+    The size can only be changed when the child process is not running
+
+    :param ipackagesize: The size of a single read in bytes
+    :type ipackagesize: integer
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      try :
+        self._package_size = int(ipackagesize)
+      except :
+        #The Parameter is not a Number
+        self._package_size = 8192
+
+      if self._package_size < 1 :
+        self._package_size = 8192
+
+      if self._max_package_size < self._package_size :
+        self._max_package_size = self._package_size
+
+    #if not self.isRunning()
+
+
+  def setMaxPackageSize(self, imaxpackagesize = 1048576):
+    '''
+    This Method sets the size in bytes up to which the reads from the pipes grow
+    while the pipes keep delivering full reads.
+    A size equal to the `Command.package_size` disables the adaptive read size.
+    The size can only be changed when the child process is not running
+
+    :param imaxpackagesize: The maximal size of a single read in bytes
+    :type imaxpackagesize: integer
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      try :
+        self._max_package_size = int(imaxpackagesize)
+      except :
+        #The Parameter is not a Number
+        self._max_package_size = 1048576
+
+      if self._max_package_size < self._package_size :
+        self._max_package_size = self._package_size
+
+    #if not self.isRunning()
+
+
+  def setPipeSize(self, ipipesize = -1):
+    '''
+    This Method sets the size in bytes of the kernel buffers of the STDOUT and STDERR pipes.
+    Bigger pipe buffers let bulk producers write more data between two reads.
+    This is only supported on Linux and the size is limited by "/proc/sys/fs/pipe-max-size".
+    By default this is disabled with the value of "-1".
+    The size can only be changed when the child process is not running
+
+    :param ipipesize: The size of the pipe buffers in bytes
+    :type ipipesize: integer
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      try :
+        self._pipe_size = int(ipipesize)
+      except :
+        #The Parameter is not a Number
+        self._pipe_size = -1
+
+      if self._pipe_size < 1 :
+        #Keep the System Pipe Size
+        self._pipe_size = -1
+
+    #if not self.isRunning()
+
+
+  def setEncoding(self, sencoding = None):
+    '''
+    This Method sets the encoding in which the output of the child process is decoded.
+    If `sencoding` is `None` or not a known encoding the preferred encoding of the locale
+    which is inherited by the child process is used.
+    The encoding can only be changed when the child process is not running
+
+    :param sencoding: The name of the encoding
+    :type sencoding: string
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      try :
+        self._encoding = codecs.lookup(sencoding).name
+      except (LookupError, TypeError) :
+        #Use the Encoding of the Locale
+        self._encoding = None
+
+      self._setBufferEncoding()
+
+
+  def setEncodingErrors(self, serrors = 'replace'):
+    '''
+    This Method sets how invalid output of the child process is handled on decoding.
+    The values are the error handlers of `bytes.decode()` like "strict", "replace" or "ignore".
+    By default invalid output is replaced.
+    The error handler can only be changed when the child process is not running
+
+    :param serrors: The name of the error handler
+    :type serrors: string
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      try :
+        codecs.lookup_error(serrors)
+
+        self._encoding_errors = serrors
+      except (LookupError, TypeError) :
+        #Replace invalid Output by default
+        self._encoding_errors = 'replace'
+
+      self._setBufferEncoding()
+
+
+  def _setBufferEncoding(self):
+    #The Spool Files store decoded Output in the configured Encoding
+    self._arr_rpt.setEncoding(self.getEncoding(), self._encoding_errors)
+    self._arr_err.setEncoding(self.getEncoding(), self._encoding_errors)
+
+    #The joined Messages must be decoded anew
+    self._clearCache()
+
+
+  def setLauncher(self, slauncher = 'popen'):
+    '''
+    This Method sets the way the child process is created.
+    The recognized launchers are:
+    * `popen` - `subprocess.Popen` with its default settings which closes all inherited
+      file descriptors in the child process. Where supported it uses `vfork()`
+    * `spawn` - `subprocess.Popen` configured for its `os.posix_spawn()` fast path.
+      The executable is resolved in the `PATH` beforehand and file descriptors are not closed,
+      so only file descriptors which are marked as inheritable are passed to the child process
+    * `forkserver` - a long-lived helper process launches the child process.
+      The shared `ForkServer` is used unless one is set with `Command.setForkServer()`.
+      It requires Python 3.9 or newer, otherwise the launch fails with an `OSError`
+
+    `os.posix_spawn()` does not copy the page tables of the current process,
+    so the launch time does not grow with the memory size of the current process.
+    A child process with `Command.limits` is launched by the `ForkServer` where it is supported.
+    Unknown launchers are interpreted as "popen".
+    The launcher can only be changed when the child process is not running
+
+    :param slauncher: The name of the launcher
+    :type slauncher: string
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      if slauncher in ('popen', 'spawn', 'forkserver') :
+        self._slauncher = slauncher
+      else :  #Unknown Launcher
+        self._slauncher = 'popen'
+
+    #if not self.isRunning()
+
+
+  def setLimits(self, limits = None):
+    '''
+    This Method sets the limits which are applied to the child process before its command starts.
+    The recognized keys are `rlimits`, `nice`, `ionice`, `affinity` and `cgroup`.
+    A child process with limits is launched by the shared `ForkServer` where it is supported,
+    even when `Command.launcher` is `popen`. The `ForkServer` forks it
+    and applies the limits before the command is executed, so all processes created
+    by the command inherit them. The `AsyncCommand` and all commands on Python versions
+    without `ForkServer` support apply the limits right after the launch,
+    so processes which the command creates in the meantime escape them.
+    Limits which cannot be applied and unknown keys are reported in `Command.error`.
+    The limits can only be changed when the child process is not running
+
+    :param limits: The limits as key - value pairs
+    :type limits: dictionary
+
+    :see: `limits.applyLimits()`
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      if limits is not None :
+        self._limits = dict(limits)
+      else :
+        self._limits = {}
+
+    #if not self.isRunning()
+
+
+  def setNewSession(self, bnewsession = True):
+    '''
+    This Method sets whether the child process is launched in its own session and process group.
+    Then `Terminate()`, `Kill()`, the Execution Timeout and `freeResources()` signal the whole
+    process group. When the child process exits the remaining processes of its process group
+    are killed before the child process is reaped, so processes forked by the child process
+    do not survive it and the Process Group ID is never signalled after it was released.
+    The launchers based on `subprocess.Popen` cannot use `os.posix_spawn()` for a new session.
+    The setting can only be changed when the child process is not running
+
+    :param bnewsession: Whether the child process gets its own session
+    :type bnewsession: boolean
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      self._bnew_session = bool(bnewsession)
+
+
+  def setGracePeriod(self, fgraceperiod = 1):
+    '''
+    This Method sets the time in seconds a child process has to exit after the SIGTERM signal
+    at its Execution Timeout before it is killed with the SIGKILL signal.
+    The value "0" kills the child process right away if it does not exit at once
+
+    :param fgraceperiod: Time in seconds to wait for the exit of the child process
+    :type fgraceperiod: number
+    '''
+    try :
+      self._grace_period = float(fgraceperiod)
+    except :
+      #The Parameter is not a Number
+      self._grace_period = 1.0
+
+    if self._grace_period < 0 :
+      self._grace_period = 0.0
+
+
+  def setForkServer(self, oforkserver = None):
+    '''
+    This Method sets the `ForkServer` object which launches the child process
+    and selects the "forkserver" launcher.
+    If `oforkserver` is `None` the `ForkServer` shared by all `Command` objects is used.
+    The `ForkServer` can only be changed when the child process is not running
+
+    :param oforkserver: The `ForkServer` object
+    :type oforkserver: ForkServer
+
+    :see: `ForkServer`
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      self._forkserver = oforkserver
+      self._slauncher = 'forkserver'
+
+    #if not self.isRunning()
+
+
+  def setInput(self, input = None):
+    '''
+    This Method sets the input for the child process.
+    A file descriptor or a file object is passed to the child process as its STDIN.
+    `bytes`, `str` or an iterable of chunks are written into the STDIN pipe
+    whenever the pipe can take more data, within the same selector loop which reads the output,
+    so large inputs are streamed without blocking the reading of the output.
+    `str` chunks are encoded with the configured encoding.
+    The STDIN pipe is closed when all chunks are written.
+    If `input` is `None` the child process inherits the STDIN of the current process.
+    The input can only be changed when the child process is not running
+
+    :param input: The input for the child process
+    :type input: bytes, string, integer, file object or iterable
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      self._input = input
+
+
+  def setReportTarget(self, target = None):
+    '''
+    This Method sets the target to which the STDOUT output of the child process is written.
+    The target can be a file path, which is created or truncated on launch,
+    a file descriptor or a file object. The child process writes directly to the target,
+    so the output is not captured unless the Tee Mode is enabled.
+    If `target` is `None` the output is captured in memory.
+    The target can only be changed when the child process is not running
+
+    :param target: The target of the STDOUT output
+    :type target: string, integer or file object
+
+    :see: `Command.setTee()`
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      self._target_rpt = target
+
+
+  def setErrorTarget(self, target = None):
+    '''
+    This Method sets the target to which the STDERR output of the child process is written
+
+    :see: `Command.setReportTarget()`
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      self._target_err = target
+
+
+  def setTee(self, tee = True):
+    '''
+    This Method enables or disables the Tee Mode for the output targets.
+    In Tee Mode the output is still read through a pipe and copied into the target.
+    Where the target is a regular file the output is moved with `os.splice()` within the kernel
+    and only the last `tee` units are read back into memory when the transmission has finished.
+    The "all" Retention Policy is limited to the tail of `tee` units in Tee Mode.
+    If `tee` is `True` a tail of 65536 units is kept.
+    The mode can only be changed when the child process is not running
+
+    :param tee: Whether the Tee Mode is enabled or the size of the tail in units
+    :type tee: boolean or integer
+
+    :see: `Command.setReportRetention()`
+    '''
+    #Attributes that cannot be changed in Running State
+    if not self.isRunning() :
+      if tee is True :
+        self._itee_tail = 65536
+      elif not tee :
+        self._itee_tail = 0
+      else :
+        try :
+          self._itee_tail = max(int(tee), 0)
+        except :
+          #The Parameter is not a Number
+          self._itee_tail = 0
+
+    #if not self.isRunning()
+
+
+  def setReportHandler(self, fnhandler = None):
+    '''
+    This Method sets a callable which is called with each chunk of STDOUT output
+    as soon as it is received. The chunks are `str` objects or `bytes` objects
+    in Binary Capture Mode. The output is still stored in the `Command.report`
+
+    :param fnhandler: The callable receiving the chunks or `None` to remove it
+    :type fnhandler: callable
+    '''
+    self._fn_on_stdout = fnhandler
+
+
+  def setErrorHandler(self, fnhandler = None):
+    '''
+    This Method sets a callable which is called with each chunk of STDERR output
+    as soon as it is received
+
+    :see: `Command.setReportHandler()`
+    '''
+    self._fn_on_stderr = fnhandler
+
+
+  def setDeadlineHandler(self, fnhandler = None):
+    '''
+    This Method sets a callable which is called with the `Command` object
+    when the Execution Timeout of the running child process is changed.
+    This allows a `CommandGroup` to schedule the new deadline
+
+    :param fnhandler: The callable receiving the `Command` object or `None` to remove it
+    :type fnhandler: callable
+
+    :see: `Command.getDeadline()`
+    '''
+    self._fn_on_deadline = fnhandler
+
+
   def setDebug(self, bisdebug = True):
     self._bdebug = bisdebug
 
 
-  def Launch(self):
+  def Launch(self, overrides = None):
     '''
     This Method launches the process defined by the `Command.command_line` Property in a separate child process
 
+    :param overrides: Settings which only apply to this launch as key - value pairs.
+      The recognized keys are `stdin`, `stdout` and `limits` like for `Command.setDictOptions()`
+    :type overrides: dictionary
     :returns: Returns `True` if the launch of the child process succeeded
     :rtype: boolean
     '''
     brs = False
 
+    self._launch_overrides = dict(overrides or {})
+
     if self._scommand != '' :
       #------------------------
       #Execute the configured Command
 
       sprcnm = self.getNameComplete()
-      #Parse the Command Line
-      arrcmd = split(self._scommand)
+      #Parse the Command Line once
+      arrcmd = self._parseCommand()
 
       if self._bdebug :
         self._arr_rpt.append("cmd arr: '{}'\n".format(str(arrcmd)))
 
       self._pid = -1
       self._process_status = -1
+      self._bkilled = False
+      self._bgroup_cleaned = False
+
+      #Discard the Resource Usage of a former Launch
+      self._clearUsage()
 
       if self._bdebug :
         self._arr_rpt.append("cmd pfg '{}'\n".format(self._bprofiling))
 
       if self._bprofiling :
+        #The Wall Clock Time is only recorded for the Logs
         self._time_start = time.time()
+        self._itm_start_ns = time.perf_counter_ns()
+
+      #The Execution Timeout is counted on the Monotonic Clock
+      self._itm_launch_ns = time.monotonic_ns()
 
       try :
+        #Open the Output Targets
+        self._openTargets()
+
         #Launch the Child Process
-        self._process = subprocess.Popen(arrcmd, bufsize = self._package_size, stdin = None\
-        , stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+        self._process = self._spawnProcess(arrcmd)
 
         self._pid = self._process.pid
 
-        #Create Pipe IO Selector
-        self._selector = selectors.DefaultSelector()
+        self._applyLimits()
+
+        #The Child Process holds its own Copy of the redirected Targets
+        self._releaseTargets()
+
+        #Each Pipe keeps incomplete Characters until the next Read
+        self._decoder_rpt = self._createDecoder()
+        self._decoder_err = self._createDecoder()
 
-        self._selector.register(self._process.stdout, selectors.EVENT_READ, None)
-        self._selector.register(self._process.stderr, selectors.EVENT_READ, None)
+        #Each Pipe adapts its Read Size to its Data Rate
+        self._read_size_rpt = self._package_size
+        self._read_size_err = self._package_size
+
+        if self._selector is None :
+          #Create an own Pipe IO Selector
+          self._selector = selectors.DefaultSelector()
+          self._bshared_selector = False
+
+        for pp in (self._process.stdout, self._process.stderr) :
+          if pp is not None :
+            if self._pipe_size > 0 :
+              self._resizePipe(pp)
+
+            #The Pipe Events are dispatched back to this Command Object
+            self._selector.register(pp, selectors.EVENT_READ, self)
+
+          #if pp is not None
+        #for pp in (self._process.stdout, self._process.stderr)
+
+        if self._process.stdin is not None :
+          #The Input is written when the Pipe can take more Data
+          os.set_blocking(self._process.stdin.fileno(), False)
+
+          self._selector.register(self._process.stdin, selectors.EVENT_WRITE, self)
+
+        #Get notified about the Exit of the Child Process
+        self._openPidfd()
 
         brs = True
 
@@ -237,33 +1047,543 @@ class Command(object):
           self._arr_rpt.append("prc ({}) - stderr: '{}'\n".format(self._pid, str(self._process.stderr)))
 
       except Exception as e :
-        self._arr_err.append("Command '{}': Launch failed with {}!\n".format(sprcnm, e.__class__.__name__))
-        self._arr_err.append("Exception [{}] Message: {}\n".format(e.errno, str(e)))
+        self._arr_err.addNote("Command '{}': Launch failed with {}!\n".format(sprcnm, e.__class__.__name__))
+        self._arr_err.addNote("Exception [{}] Message: {}\n".format(e.errno, str(e)))
         self._err_code = 1
         self._process_status = e.errno
         self._process = None
 
+        self._closeTargets()
+
     #if self._scommand != ''
 
-    return brs
+    self._launch_overrides = {}
 
+    return brs
 
 
-  def Check(self):
+  def _spawnProcess(self, arrcmd):
     '''
-    This Method checks whether the child process is still running and reads
-    its Output and Errors with the `Read()` Method
+    This Method creates the child process for `arrcmd` with the configured launcher
+    and the configured input and output targets
+
+    :param arrcmd: The parsed command line
+    :type arrcmd: list
+    :returns: The child process
+    :rtype: subprocess.Popen or ForkServerProcess
+    :raises OSError: If the child process could not be created
+    '''
+    if self._slauncher == 'forkserver' \
+    or (len(self._getLaunchLimits()) > 0 \
+    and isForkServerSupported()) :
+      #The Helper Process applies the Limits before the Command starts
+      return self._getForkServer().Spawn(arrcmd, self._package_size\
+      , stdin = self._openInput()\
+      , stdout = self._getTargetArgument(self._tee_rpt)\
+      , stderr = self._getTargetArgument(self._tee_err)\
+      , bsession = self._bnew_session, limits = self._getLaunchLimits())
+
+    return subprocess.Popen(arrcmd, bufsize = self._package_size\
+    , stdin = self._openInput()\
+    , stdout = self._getTargetArgument(self._tee_rpt)\
+    , stderr = self._getTargetArgument(self._tee_err)\
+    , **self._getLaunchOptions(arrcmd))
+
+
+  def _applyLimits(self):
+    '''
+    This Method reports the `Command.limits` which could not be applied to the child process.
+    A child process which was not launched by a `ForkServer` gets the limits applied now
+    '''
+    limits = self._getLaunchLimits()
+
+    if len(limits) > 0 :
+      if isinstance(self._process, ForkServerProcess) :
+        #The Helper Process has applied the Limits before the Launch
+        arrerrors = self._process.limit_errors
+      else :
+        arrerrors = applyLimits(self._pid, limits)
+
+      for serror in arrerrors :
+        self._arr_err.addNote("Sub Process {}: {}\n".format(self.getNameComplete(), serror))
+
+    #if len(limits) > 0
+
+
+  def _getLaunchLimits(self):
+    '''
+    This Method provides the limits for the current launch.
+    The `limits` of the launch overrides replace the `Command.limits`
+
+    :returns: The limits as key - value pairs
+    :rtype: dictionary
+    '''
+    return self._launch_overrides.get('limits', self._limits)
+
+
+  def _getForkServer(self):
+    forkserver = self._forkserver
+
+    if forkserver is None :
+      #Use the shared Fork Server
+      forkserver = getForkServer()
+
+    return forkserver
+
+
+  def _parseCommand(self):
+    '''
+    This Method parses the `Command.command_line` into the executable and its arguments.
+    The result is kept for further launches of the same command line
+
+    :returns: The executable and its arguments
+    :rtype: list
+    '''
+    if self._parsed_command is None \
+    or self._parsed_command[0] != self._scommand :
+      self._parsed_command = (self._scommand, split(self._scommand))
+
+    return self._parsed_command[1]
+
+
+  def _getLaunchOptions(self, arrcmd):
+    '''
+    This Method builds the additional arguments for `subprocess.Popen` for the configured launcher
+
+    :param arrcmd: The parsed command line
+    :type arrcmd: list
+    :returns: The additional arguments as key - value pairs
+    :rtype: dictionary
+    '''
+    options = {}
+
+    if self._bnew_session :
+      #subprocess.Popen does not use os.posix_spawn() for a new Session
+      options['start_new_session'] = True
+
+    if self._slauncher == 'spawn' :
+      #os.posix_spawn() requires an Executable Path and no Descriptor Cleanup
+      options['close_fds'] = False
+
+      if len(arrcmd) > 0 :
+        sexecutable = shutil.which(arrcmd[0])
+
+        if sexecutable is not None :
+          options['executable'] = os.path.abspath(sexecutable)
+
+      #if len(arrcmd) > 0
+    #if self._slauncher == 'spawn'
+
+    return options
+
+
+  def _openInput(self):
+    '''
+    This Method prepares the input for the launch of the child process
+
+    :returns: The `stdin` argument for the child process
+    :rtype: integer, file object or None
+    '''
+    self._input_iter = None
+    self._input_chunk = None
+
+    input = self._launch_overrides.get('stdin', self._input)
+
+    if input is None :
+      return None
+
+    if isinstance(input, int) \
+    or hasattr(input, 'fileno') :
+      #The Child Process reads the Input directly
+      return input
+
+    if isinstance(input, (bytes, bytearray, memoryview, str)) :
+      self._input_iter = iter((input,))
+    else :
+      self._input_iter = iter(input)
+
+    return subprocess.PIPE
+
+
+  def _writeInput(self, pipe):
+    '''
+    This Method writes the input into the STDIN pipe until the pipe is full.
+    A chunk which was written partially is continued with the next event.
+    When all chunks are written or the child process has closed its STDIN the pipe is closed
+
+    :param pipe: The STDIN pipe of the child process
+    :type pipe: io.BufferedWriter
+    '''
+    bwrt = True
+
+    while bwrt :
+      if self._input_chunk is None :
+        try :
+          scnk = next(self._input_iter)
+        except StopIteration :
+          #All Input is written
+          if self._bdebug :
+            self._arr_rpt.append("pipe ({}): input done.\n".format(pipe.fileno()))
+
+          self._closePipe(pipe)
+
+          return
+
+        if isinstance(scnk, str) :
+          scnk = scnk.encode(self.getEncoding(), self._encoding_errors)
+
+        self._input_chunk = memoryview(scnk).cast('B')
+
+      #if self._input_chunk is None
+
+      try :
+        iwritten = os.write(pipe.fileno(), self._input_chunk)
+      except BlockingIOError :
+        #The Pipe is full
+        iwritten = 0
+      except BrokenPipeError :
+        #The Child Process does not read any more Input
+        if self._bdebug :
+          self._arr_rpt.append("pipe ({}): input closed by child.\n".format(pipe.fileno()))
+
+        self._input_chunk = None
+        self._closePipe(pipe)
+
+        return
+
+      if iwritten < len(self._input_chunk) :
+        self._input_chunk = self._input_chunk[iwritten:]
+        bwrt = False
+      else :
+        self._input_chunk = None
+
+    #while bwrt
+
+
+  def _openTarget(self, target):
+    '''
+    This Method opens an output target for the launch of the child process.
+    File paths are opened by the `Command` object and are closed after use
+
+    :param target: The target as file path, file descriptor or file object
+    :type target: string, integer or file object
+    :returns: The state of the opened target or `None` if no target is set
+    :rtype: dictionary
+    '''
+    if target is None :
+      return None
+
+    if isinstance(target, int) :
+      ifd = target
+      bown = False
+    elif hasattr(target, 'fileno') :
+      ifd = target.fileno()
+      bown = False
+    else :  #The Target is a File Path
+      #The Tail is read back from the File in Tee Mode
+      ifd = os.open(os.fspath(target), os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+      bown = True
+
+    return {'fd': ifd, 'own': bown, 'splice': self._canSplice(ifd), 'written': 0, 'failed': False\
+    , 'policy': None}
+
+
+  def _openTargets(self):
+    '''
+    This Method opens the output targets for STDOUT and STDERR and limits the
+    Retention Policy to the tail of the output in Tee Mode.
+    The limit only applies to this launch and the Retention Policy is restored
+    when the target is finished or closed
+    '''
+    self._tee_rpt = self._openTarget(self._launch_overrides.get('stdout', self._target_rpt))
+
+    try :
+      self._tee_err = self._openTarget(self._target_err)
+    except :
+      self._closeTargets()
+
+      raise
+
+    if self._itee_tail > 0 :
+      for tee, arrbuffer in ((self._tee_rpt, self._arr_rpt), (self._tee_err, self._arr_err)) :
+        if tee is not None \
+        and arrbuffer.getPolicy() == 'all' :
+          tee['policy'] = (arrbuffer, arrbuffer.getPolicy(), arrbuffer.getHeadSize()\
+          , arrbuffer.getTailSize())
+
+          arrbuffer.setPolicy('tail', 0, self._itee_tail)
+
+      #for tee, arrbuffer in ((self._tee_rpt, self._arr_rpt), (self._tee_err, self._arr_err))
+    #if self._itee_tail > 0
+
+
+  def _canSplice(self, ifd):
+    '''
+    This Method checks whether the output can be moved into the target with `os.splice()`.
+    This requires a regular file which is opened for reading and writing
+    but not in append mode, so that the tail can be read back
+
+    :param ifd: The file descriptor of the target
+    :type ifd: integer
+    :returns: Whether `os.splice()` can be used
+    :rtype: boolean
+    '''
+    if not hasattr(os, 'splice') \
+    or fcntl is None :
+      return False
+
+    try :
+      iflags = fcntl.fcntl(ifd, fcntl.F_GETFL)
+
+      return stat.S_ISREG(os.fstat(ifd).st_mode) \
+      and iflags & os.O_ACCMODE == os.O_RDWR \
+      and not iflags & os.O_APPEND
+    except OSError :
+      #The File Descriptor is not valid
+      return False
+
+
+  def _getTargetArgument(self, tee):
+    if tee is None \
+    or self._itee_tail > 0 :
+      #The Output is read through a Pipe
+      return subprocess.PIPE
+
+    return tee['fd']
+
+
+  def _releaseTargets(self):
+    '''
+    This Method closes the redirected targets after the launch.
+    The targets are only kept in Tee Mode
+    '''
+    if self._itee_tail == 0 :
+      self._closeTargets()
+
+
+  def _closeTargets(self):
+    for tee in (self._tee_rpt, self._tee_err) :
+      if tee is not None :
+        self._restorePolicy(tee)
+
+        if tee['own'] :
+          os.close(tee['fd'])
+
+      #if tee is not None
+    #for tee in (self._tee_rpt, self._tee_err)
+
+    self._tee_rpt = None
+    self._tee_err = None
+
+
+  def _restorePolicy(self, tee):
+    '''
+    This Method restores the Retention Policy which was limited to the tail for the target
+    '''
+    if tee['policy'] is not None :
+      arrbuffer, spolicy, ihead, itail = tee['policy']
+
+      arrbuffer.setPolicy(spolicy, ihead, itail)
+
+      tee['policy'] = None
+
+    #if tee['policy'] is not None
+
+
+  def _splicePipe(self, pipe, tee, ireadsize):
+    '''
+    This Method moves up to `ireadsize` bytes from the pipe into the target within the kernel
+
+    :returns: The count of moved bytes or "-1" if the target does not support splicing
+    :rtype: integer
+    '''
+    try :
+      icnt = os.splice(pipe.fileno(), tee['fd'], ireadsize)
+    except OSError :
+      #Copy the Output through Memory
+      tee['splice'] = False
+
+      return -1
+
+    tee['written'] += icnt
+
+    return icnt
+
+
+  def _writeTarget(self, tee, scnk):
+    '''
+    This Method writes a chunk of output into the target.
+    When the target fails the error is reported once and further output is not written
+    '''
+    if tee['failed'] :
+      return
+
+    try :
+      iwritten = 0
+
+      while iwritten < len(scnk) :
+        iwritten += os.write(tee['fd'], scnk[iwritten:])
+
+      tee['written'] += iwritten
+    except OSError as e :
+      tee['failed'] = True
+
+      self._arr_err.addNote("Command '{}': Writing the Output failed with {}!\n"\
+      .format(self.getNameComplete(), e.__class__.__name__))
+      self._arr_err.addNote("Exception [{}] Message: {}\n".format(e.errno, str(e)))
+
+
+  def _finishTarget(self, tee, arrbuffer):
+    '''
+    This Method closes the target when the transmission has finished.
+    Output which was moved with `os.splice()` is read back from the target up to the size of the tail.
+    Bytes of a Multi-Byte Character which was cut at the beginning of the tail are skipped.
+    Then the Retention Policy of the launch is restored
+    '''
+    if tee['splice'] \
+    and tee['written'] > 0 :
+      itail = min(self._itee_tail, tee['written'])
+
+      try :
+        iend = os.lseek(tee['fd'], 0, os.SEEK_CUR)
+        scnk = os.pread(tee['fd'], itail, iend - itail)
+      except OSError :
+        #The Target cannot be read
+        scnk = b''
+
+      if scnk != b'' :
+        if not self._bbinary :
+          scnk = self._decodeTail(scnk, itail < tee['written'])
+
+        arrbuffer.append(scnk)
+
+      #if scnk != b''
+    #if tee['splice'] and tee['written'] > 0
+
+    self._restorePolicy(tee)
+
+    if tee['own'] :
+      os.close(tee['fd'])
+
+      tee['own'] = False
+
+
+  def _decodeTail(self, scnk, bcut):
+    '''
+    This Method decodes the tail of the output which was read back from the target.
+    If the tail was cut from the output the beginning of a Multi-Byte Character might be missing,
+    so up to 3 leading bytes which cannot be decoded are skipped
+
+    :param scnk: The tail of the output
+    :type scnk: bytes
+    :param bcut: Whether the tail was cut from the output
+    :type bcut: boolean
+    :returns: The decoded tail
+    :rtype: string
+    '''
+    iskip = 0
+
+    while True :
+      try :
+        return self._createDecoder().decode(scnk[iskip:], True)
+      except UnicodeDecodeError as e :
+        if not bcut \
+        or e.start > 0 \
+        or iskip >= 3 :
+          raise
+
+        #Skip the Rest of the cut Character
+        iskip += 1
+
+    #while True
+
+
+
+  def Check(self):
+    '''
+    This Method checks whether the child process is still running and reads
+    its Output and Errors with the `Read()` Method
 
     :returns: Returns `True` if the child process is still running
     :rtype: boolean
 
     :see: `Command.Read()`
     '''
+    return self._checkProcess(self._read_timeout)
+
 
+  def _recordExecutionTime(self):
+    '''
+    This Method records the end of the child process for the profiling.
+    The Execution Time is measured on the `time.perf_counter_ns()` clock,
+    so it does not change with adjustments of the system time
+    '''
+    self._time_end = time.time()
+
+    if self._itm_start_ns > -1 :
+      self._itm_execution_ns = time.perf_counter_ns() - self._itm_start_ns
+      self._time_execution = self._itm_execution_ns / 1000000000
+
+    #if self._itm_start_ns > -1
+
+
+  def _checkProcess(self, itimeout = 0):
+    '''
+    This Method checks whether the child process is still running and waits up to `itimeout` seconds
+    for its Output and Errors. If the pipes are already closed it waits for the child process to finish.
+    If `itimeout` is `None` it waits until any event occurs
+
+    :param itimeout: Time in seconds to wait for events
+    :type itimeout: number
+    :returns: Returns `True` if the child process is still running
+    :rtype: boolean
+    '''
+    brng = self._checkStatus()
+
+    if brng :
+      if self._hasWatchedFiles() :
+        if self._bdebug :
+          self._arr_rpt.append("prc ({}) [{}]: Read do ...\n".format(self._pid, self._process_status))
+
+        #Read the Messages from the Sub Process
+        self._readEvents(itimeout)
+
+      elif itimeout is None \
+      or itimeout > 0 :
+        if self._bdebug :
+          self._arr_rpt.append("prc ({}) [{}]: Wait do ...\n".format(self._pid, self._process_status))
+
+        #Sleep until the Sub Process finishes
+        self._waitProcess(itimeout)
+
+      #if self._hasWatchedFiles()
+    #if brng
+
+    return brng
+
+
+  def _checkStatus(self):
+    '''
+    This Method checks whether the child process has finished without waiting for its output.
+    When the child process has finished its Exit Code is recorded, the remaining output is read
+    and the pipes are released.
+    While the exit of the child process is watched with a Process File Descriptor
+    the child process is not polled at all
+
+    :returns: Returns `True` if the child process is still running
+    :rtype: boolean
+    '''
     brng = False
 
     if self._process is not None :
-      if self._process.poll() is not None :
+      if self._pidfd is not None \
+      and self._process.returncode is None :
+        #------------------------
+        #The Exit will be notified by the Process File Descriptor
+
+        brng = True
+
+      elif self._pollProcess() is not None :
         #------------------------
         #Child Process has finished
 
@@ -274,9 +1594,7 @@ class Command(object):
           self._arr_rpt.append("prc ({}): finished with [{}].\n".format(self._pid, self._process_status))
 
         if self._bprofiling :
-          self._time_end = time.time()
-
-          self._time_execution = self._time_end - self._time_start
+          self._recordExecutionTime()
 
           if self._bdebug :
             self._arr_rpt.append("Time Execution: '{}' s\n".format(self._time_execution))
@@ -287,7 +1605,7 @@ class Command(object):
           self._arr_rpt.append("prc ({}) [{}]: Read do ...\n".format(self._pid, self._process_status))
 
         #Read the Last Messages from the Sub Process
-        self.Read()
+        self._drainPipes()
 
         #Free the Pipe Selector Resources
         self._freeSelector()
@@ -298,174 +1616,867 @@ class Command(object):
 
         brng = True
 
-        if self._bdebug :
-          self._arr_rpt.append("prc ({}) [{}]: Read do ...\n".format(self._pid, self._process_status))
+      #if self._pollProcess() is not None
+
+      if brng \
+      and self._sample_interval > 0 :
+        self._sampleProcess()
+
+    #if self._process is not None
+
+    return brng
+
+
+  def _pollProcess(self):
+    '''
+    This Method checks whether the child process has exited without waiting.
+    A child process created with `subprocess.Popen` is reaped with `os.wait4()`,
+    so its resource usage is recorded
+
+    :returns: The Exit Code of the child process or `None` if it is still running
+    :rtype: integer
+    '''
+    return self._reapProcess(os.WNOHANG)
+
+
+  def _waitProcess(self, itimeout = None):
+    '''
+    This Method waits up to `itimeout` seconds for the exit of the child process.
+    If `itimeout` is `None` it waits until the child process exits
+
+    :param itimeout: Time in seconds to wait
+    :type itimeout: number
+    '''
+    if itimeout is None :
+      self._reapProcess(0)
+    else :
+      itmend = time.monotonic_ns() + int(itimeout * 1000000000)
+      itmdelay = 0.0005
+
+      #Poll with growing Delays like subprocess.Popen.wait()
+      while self._pollProcess() is None \
+      and time.monotonic_ns() < itmend :
+        itmdelay = min(itmdelay * 2, (itmend - time.monotonic_ns()) / 1000000000, 0.05)
+
+        if itmdelay > 0 :
+          time.sleep(itmdelay)
+
+      #while self._pollProcess() is None and time.monotonic_ns() < itmend
+    #if itimeout is None
+
+
+  def _reapProcess(self, iflags):
+    '''
+    This Method reaps the child process with `os.wait4()` and the flags `iflags`
+    and records its resource usage. Other child processes report their resource usage
+    in their `rusage` Attribute
+
+    :returns: The Exit Code of the child process or `None` if it is still running
+    :rtype: integer
+    '''
+    process = self._process
+
+    if process.returncode is None \
+    and isinstance(process, subprocess.Popen) \
+    and hasattr(os, 'wait4') :
+      if self._bnew_session :
+        self._cleanGroup(iflags)
+
+      try :
+        ipid, istatus, rusage = os.wait4(process.pid, iflags)
+      except ChildProcessError :
+        #The Child Process was already reaped
+        process.poll()
+        ipid = 0
+      except InterruptedError :
+        ipid = 0
+
+      if ipid == process.pid :
+        process.returncode = decodeWaitStatus(istatus)
+
+        self._rusage = getUsageDict(rusage)
+
+    elif process.returncode is None :
+      process.poll()
+
+      if process.returncode is not None \
+      and getattr(process, 'rusage', None) is not None :
+        #The Fork Server has reaped the Child Process
+        self._rusage = getUsageDict(process.rusage)
+
+    #if process.returncode is None and isinstance(process, subprocess.Popen)
+
+    return process.returncode
+
+
+  def _cleanGroup(self, iflags):
+    '''
+    This Method kills the remaining processes of the process group of a child process
+    in its own session as soon as the child process has exited.
+    The child process is not reaped yet, so its Process Group ID cannot be taken
+    by another process group while it is signalled
+
+    :param iflags: The flags for `os.waitid()`. With `os.WNOHANG` it does not wait for the exit
+    :type iflags: integer
+    '''
+    if not self._bgroup_cleaned :
+      try :
+        result = os.waitid(os.P_PID, self._pid, os.WEXITED | os.WNOWAIT | (iflags & os.WNOHANG))
+      except (ChildProcessError, InterruptedError) :
+        result = None
+
+      if result is not None :
+        try :
+          os.killpg(self._pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError) :
+          #The Process Group has no other Members
+          pass
+
+        self._bgroup_cleaned = True
+
+      #if result is not None
+    #if not self._bgroup_cleaned
+
+
+  def _sampleProcess(self):
+    '''
+    This Method samples the resource usage of the running child process when the
+    `Command.sample_interval` has passed since the last sample.
+    The CPU usage is calculated in percent of one CPU since the last sample
+    '''
+    itmnow = time.monotonic_ns()
+
+    if self._itm_sample_ns > -1 \
+    and itmnow - self._itm_sample_ns < self._sample_interval * 1000000000 :
+      return
+
+    sample = readProcessSample(self._pid)
+
+    if len(sample) > 0 :
+      #The first Sample covers the Time since the Launch
+      itmprevious = self._itm_sample_ns if self._itm_sample_ns > -1 else self._itm_launch_ns
+      fcpuprevious = self._sample.get('cputime', 0)
+
+      if itmnow > itmprevious :
+        sample['cpu'] = (sample['cputime'] - fcpuprevious) * 100000000000 / (itmnow - itmprevious)
+      else :
+        sample['cpu'] = 0.0
+
+      sample['time'] = itmnow
+
+      self._sample = sample
+
+      for skey in ('cpu', 'rss') :
+        if skey in sample :
+          self._sample_peaks[skey + '_peak'] = max(self._sample_peaks.get(skey + '_peak', 0), sample[skey])
+
+      #for skey in ('cpu', 'rss')
+    #if len(sample) > 0
+
+    self._itm_sample_ns = itmnow
+
+
+  def _getSampleWait(self):
+    '''
+    This Method calculates the time in seconds until the next sample of the resource usage is due
+
+    :returns: The time until the next sample or `None` if the sampling is disabled
+    :rtype: float
+    '''
+    itmwait = None
+
+    if self._sample_interval > 0 :
+      itmwait = 0
+
+      if self._itm_sample_ns > -1 :
+        itmwait = max(self._itm_sample_ns + self._sample_interval * 1000000000\
+        - time.monotonic_ns(), 0) / 1000000000
+
+    #if self._sample_interval > 0
+
+    return itmwait
+
+
+  def _clearUsage(self):
+    self._rusage = {}
+    self._itm_sample_ns = -1
+    self._sample = {}
+    self._sample_peaks = {}
+
+
+  def Read(self):
+    '''
+    This Method checks whether there is data available on the STDOUT and STDERR pipes
+    and reads any available data.
+    The collected data can be read with the `getReportString()` and `getErrorString()` Methods
+
+    If the selector is shared with other `Command` objects, data available for those objects
+    is dispatched to them as well
+
+    :see: `Command.getReportString()`
+    :see: `Command.getErrorString()`
+    '''
+    self._readEvents(self._read_timeout)
+
+
+  def _readEvents(self, itimeout = 0):
+    '''
+    This Method waits up to `itimeout` seconds for data on the STDOUT and STDERR pipes
+    and reads any available data.
+    If `itimeout` is `None` it waits until any event occurs
+
+    :param itimeout: Time in seconds to wait for events
+    :type itimeout: number
+    '''
+    if self._hasWatchedFiles() :
+      if self._bdebug :
+        self._arr_rpt.append("prc ({}) [{}]: try read ...\n".format(self._pid, self._process_status))
+
+      events = self._selector.select(itimeout)
+
+      if self._bdebug :
+        self._arr_rpt.append("prc ({}): '{}' read events\n".format(self._pid, len(events)))
+
+      for key, mask in events:
+        if self._bdebug :
+          self._arr_rpt.append("prc ({}) - event: '{}'\n".format(self._pid, str(key)))
+
+        #Dispatch the Event to the owning Command Object
+        key.data._processEvent(key, mask)
+
+      #for key, mask in events
+
+      if self._bdebug :
+        self._arr_rpt.append("prc ({}): reading done.\n".format(self._pid))
+
+    #if self._hasWatchedFiles()
+
+
+  def _processEvent(self, key, mask):
+    '''
+    This Method handles an event reported by the selector on one of the pipes
+    of this child process. It reads one package of data from the pipe and closes the pipe
+    when the transmission has finished.
+    An event on the Process File Descriptor notifies the exit of the child process
+    which will be recorded by the next `Check()`
+
+    :param key: The key of the pipe as returned by the selector
+    :type key: selectors.SelectorKey
+    :param mask: The events which are ready on the pipe
+    :type mask: integer
+    '''
+    if self._process is None :
+      return
+
+    if key.fileobj == self._pidfd :
+      #------------------------
+      #Child Process has exited
+
+      if self._bdebug :
+        self._arr_rpt.append("prc ({}): exit notified.\n".format(self._pid))
+
+      #The Exit Code can be read now
+      self._closePidfd()
+
+      return
+
+    elif key.fileobj == self._process.stdin :
+      #------------------------
+      #Write STDIN
+
+      self._writeInput(key.fileobj)
+
+      return
+
+    elif key.fileobj == self._process.stdout :
+      #------------------------
+      #Read STDOUT
+
+      if self._bdebug :
+        self._arr_rpt.append("pipe ({}): reading report ...\n".format(key.fd))
+
+      arrbuffer = self._arr_rpt
+      decoder = self._decoder_rpt
+      ireadsize = self._read_size_rpt
+      tee = self._tee_rpt
+      ifd = 1
+
+    elif key.fileobj == self._process.stderr :
+      #------------------------
+      #Read STDERR
+
+      if self._bdebug :
+        self._arr_rpt.append("pipe ({}): reading error ...\n".format(key.fd))
+
+      arrbuffer = self._arr_err
+      decoder = self._decoder_err
+      ireadsize = self._read_size_err
+      tee = self._tee_err
+      ifd = 2
+
+    else :  #The Pipe does not belong to this Child Process
+      return
+
+    icnt = -1
+    scnk = b''
+
+    if tee is not None \
+    and tee['splice'] :
+      #Move the Output into the Target within the Kernel
+      icnt = self._splicePipe(key.fileobj, tee, ireadsize)
+
+    if icnt == -1 :
+      scnk = key.fileobj.read1(ireadsize)
+
+      if scnk is None :
+        scnk = b''
+
+      icnt = len(scnk)
+
+      if tee is not None \
+      and icnt > 0 :
+        self._writeTarget(tee, scnk)
+
+    #if icnt == -1
+
+    brd = icnt > 0
+
+    if brd :
+      if key.fileobj == self._process.stdout :
+        self._irpt_size += icnt
+        self._read_size_rpt = self._adaptReadSize(ireadsize, icnt)
+      else :
+        self._ierr_size += icnt
+        self._read_size_err = self._adaptReadSize(ireadsize, icnt)
+
+      if scnk != b'' :
+        if not self._bbinary :
+          scnk = decoder.decode(scnk)
+
+        if scnk != '' :
+          arrbuffer.append(scnk)
+
+          self._emitChunk(ifd, scnk)
+
+      #if scnk != b''
+    #if brd
+
+    if not brd :
+      if not self._bbinary :
+        #Flush incomplete Characters at the End of the Transmission
+        scnk = decoder.decode(b'', True)
+
+        if scnk != '' :
+          arrbuffer.append(scnk)
+
+          self._emitChunk(ifd, scnk)
+
+      #if not self._bbinary
+
+      if tee is not None :
+        self._finishTarget(tee, arrbuffer)
+
+        if key.fileobj == self._process.stdout :
+          self._tee_rpt = None
+        else :
+          self._tee_err = None
+
+      #if tee is not None
+
+      if self._bdebug :
+        self._arr_rpt.append("pipe ({}): transmission done.\n".format(key.fd))
+
+      self._closePipe(key.fileobj)
+
+
+  def _emitChunk(self, ifd, scnk):
+    '''
+    This Method passes a chunk of received output to the output handlers
+    and to the running `iterChunks()` iterators
+
+    :param ifd: The file descriptor number of the pipe in the child process
+    :type ifd: integer
+    :param scnk: The chunk of output
+    :type scnk: string or bytes
+    '''
+    if ifd == 1 :
+      fnhandler = self._fn_on_stdout
+    else :
+      fnhandler = self._fn_on_stderr
+
+    if fnhandler is not None :
+      fnhandler(scnk)
+
+    for queue in self._arr_streams :
+      queue.append((ifd, scnk))
+
+
+  def _adaptReadSize(self, ireadsize, ireadcount):
+    '''
+    This Method calculates the size of the next read from a pipe.
+    The size is doubled while the pipe delivers full reads up to the `Command.max_package_size`
+    and halved down to the `Command.package_size` when the pipe delivers less than a quarter of it
+
+    :param ireadsize: The size of the last read in bytes
+    :type ireadsize: integer
+    :param ireadcount: The count of bytes delivered by the last read
+    :type ireadcount: integer
+    :returns: The size of the next read in bytes
+    :rtype: integer
+    '''
+    irs = ireadsize
+
+    if ireadcount >= ireadsize :
+      #The Pipe has more Data
+      irs = min(ireadsize * 2, self._max_package_size)
+    elif ireadcount < ireadsize / 4 :
+      #The Pipe becomes idle
+      irs = max(ireadsize // 2, self._package_size)
+
+    return irs
+
+
+  def _resizePipe(self, pipe):
+    '''
+    This Method enlarges the kernel buffer of the pipe `pipe` to the `Command.pipe_size`
+
+    :param pipe: The pipe of the child process
+    :type pipe: io.BufferedReader
+
+    :see: `resizePipe()`
+    '''
+    resizePipe(pipe.fileno(), self._pipe_size, self._arr_rpt if self._bdebug else None)
+
+
+  def _hasOpenPipes(self):
+    '''
+    This Method reports whether any pipe of the child process is still registered
+    for reading or writing
+
+    :returns: Whether there is any open pipe left
+    :rtype: boolean
+    '''
+    bopn = False
+
+    if self._process is not None \
+    and self._selector is not None :
+      for pp in (self._process.stdout, self._process.stderr, self._process.stdin) :
+        if pp is not None \
+        and not pp.closed :
+          bopn = True
+
+      #for pp in (self._process.stdout, self._process.stderr, self._process.stdin)
+    #if self._process is not None and self._selector is not None
+
+    return bopn
+
+
+  def _hasWatchedFiles(self):
+    '''
+    This Method reports whether any file descriptor of the child process is still registered
+    in the selector and can wake it up
+
+    :returns: Whether there is any open pipe or Process File Descriptor left
+    :rtype: boolean
+    '''
+    return self._pidfd is not None \
+    or self._hasOpenPipes()
+
+
+  def _isExitNotified(self):
+    '''
+    This Method reports whether the exit of the child process wakes up the selector
+
+    :returns: Whether the Process File Descriptor is still registered
+    :rtype: boolean
+    '''
+    return self._pidfd is not None
+
+
+  def _openPidfd(self):
+    '''
+    This Method opens a Process File Descriptor for the child process and registers it
+    in the selector, so that the exit of the child process is notified as an event.
+    Where Process File Descriptors are not supported the exit is polled instead
+    '''
+    self._pidfd = None
+
+    if hasattr(os, 'pidfd_open') :
+      try :
+        self._pidfd = os.pidfd_open(self._pid)
+      except OSError :
+        #Process File Descriptors are not supported by the Kernel
+        self._pidfd = None
+
+      if self._pidfd is not None :
+        self._selector.register(self._pidfd, selectors.EVENT_READ, self)
+
+    #if hasattr(os, 'pidfd_open')
+
+
+  def _closePidfd(self):
+    '''
+    This Method removes the Process File Descriptor from the selector and closes it
+    '''
+    if self._pidfd is not None :
+      if self._selector is not None :
+        try :
+          self._selector.unregister(self._pidfd)
+        except (KeyError, ValueError) :
+          #The Process File Descriptor was not registered
+          pass
+
+      #if self._selector is not None
+
+      os.close(self._pidfd)
+      self._pidfd = None
+
+    #if self._pidfd is not None
+
+
+  def _drainPipes(self):
+    '''
+    This Method reads all data still pending in the pipes of a finished child process.
+    It does not wait for pipes which are kept open by other processes.
+    The remaining input is discarded
+    '''
+    bown = True
+
+    if self._process.stdin is not None \
+    and not self._process.stdin.closed :
+      self._closePipe(self._process.stdin)
+
+    while bown \
+    and self._hasOpenPipes() :
+      bown = False
+
+      for key, mask in self._selector.select(0) :
+        if key.data is self :
+          bown = True
+
+        #Dispatch the Event to the owning Command Object
+        key.data._processEvent(key, mask)
+
+      #for key, mask in self._selector.select(0)
+    #while bown and self._hasOpenPipes()
+
+
+  def _closePipe(self, pipe):
+    '''
+    This Method removes a pipe from the selector and closes it
+
+    :param pipe: The pipe of the child process
+    :type pipe: io.BufferedReader
+    '''
+    if self._selector is not None :
+      try :
+        self._selector.unregister(pipe)
+      except (KeyError, ValueError) :
+        #The Pipe was not registered
+        pass
+
+    #if self._selector is not None
+
+    pipe.close()
+
+  def Wait(self):
+    '''
+    This Method continuously checks whether the child process is still running with the `Check()` Method.
+    If an Execution Timeout is established the child process is terminated when the time limit is reached
+
+    In Blocking Wait Mode it sleeps until the child process produces output or finishes
+    and wakes up at the latest when the Execution Timeout is reached.
+    Otherwise it checks the child process within the `Command.read_timeout`
+
+    :returns: Returns `True` if the child process has finished correctly
+    :rtype: boolean
+
+    :see: `Command.Check()`
+    '''
+    irng = 1
+
+    for irng in self._iterateWait() :
+      pass
+
+    return irng == 0
+
+
+  def _iterateWait(self):
+    '''
+    This Method runs the loop of the `Wait()` Method and yields after each check round,
+    so that the received output can be processed while the child process is running
+
+    :returns: The state of the child process after each check round:
+      "1" if it is running, "0" if it has finished and "-1" if it timed out
+    :rtype: generator
+    '''
+    irng = 1
+
+    itmwait = self._read_timeout
+
+    while(irng > 0):
+      #The Deadline follows Changes of the Execution Timeout
+      itmdeadline = self.getDeadline()
+
+      if self._bblocking :
+        #Sleep until the next Event by default
+        itmwait = None
+
+        if itmdeadline > -1 :
+          #Do not sleep beyond the Execution Timeout
+          itmwait = max(itmdeadline - time.monotonic_ns(), 0) / 1000000000
+
+      #if self._bblocking
+
+      itmsample = self._getSampleWait()
+
+      if itmsample is not None \
+      and (itmwait is None or itmwait > itmsample) :
+        #Wake up for the next Sample of the Resource Usage
+        itmwait = itmsample
+
+      #Check the Sub Process
+      irng = int(self._checkProcess(itmwait))
+
+      if irng > 0 \
+      and itmdeadline > -1 :
+        if self._bdebug :
+          self._arr_rpt.append("wait tm rng: '{}' ns\n".format(time.monotonic_ns() - self._itm_launch_ns))
+
+        if time.monotonic_ns() >= itmdeadline :
+          self._expireTimeout()
+
+          #Mark the Sub Process as finished with Error
+          irng = -1
+
+      #if irng > 0 and itmdeadline > -1
+
+      yield irng
+
+    #while(irng > 0):
+
+
+  def _expireTimeout(self):
+    '''
+    This Method terminates the child process because its Execution Timeout is reached
+    and records the timeout as error. A child process which does not exit
+    within the `Command.grace_period` is killed
+    '''
+    self._recordTimeout()
+
+    self._stopProcess()
+
+
+  def _recordTimeout(self):
+    '''
+    This Method records the reached Execution Timeout as error
+    '''
+    itmrng = (time.monotonic_ns() - self._itm_launch_ns) / 1000000000
+
+    self._arr_err.addNote("Sub Process {}: Execution timed out!\n".format(self.getNameComplete()))
+    self._arr_err.addNote("Execution Time '{} / {}'\n".format(itmrng, self._execution_timeout))
+    self._arr_err.addNote("Process will be terminated.\n")
+
+    if(self._err_code < 4):
+      self._err_code = 4
+
+
+  def _stopProcess(self):
+    '''
+    This Method terminates the child process and waits up to the `Command.grace_period`
+    for its exit. A child process which is still running then is killed
+    '''
+    itmend = time.monotonic_ns() + int(self._grace_period * 1000000000)
+
+    #Terminate the Timed Out Sub Process
+    self.Terminate()
+
+    if self.isRunning() :
+      #Give the Sub Process Time to exit
+      self._waitProcess(max(itmend - time.monotonic_ns(), 0) / 1000000000)
+
+      self.Check()
+
+    #if self.isRunning()
+
+    if self.isRunning() :
+      #Kill the blocked Sub Process
+      self.Kill()
+
+    self._reapKilled()
 
-        #Read the Messages from the Sub Process
-        self.Read()
 
-      #if self._process.poll() is not None
-    #if self._process is not None
+  def _reapKilled(self):
+    '''
+    This Method waits shortly for the exit of a killed child process which is not reaped yet
+    and records its real Exit Code. SIGKILL cannot be caught, so the child process exits
+    right away unless it is blocked in the Kernel
+    '''
+    if self._bkilled \
+    and self._process is not None \
+    and self._process_status == -1 :
+      self._waitProcess(1)
+      self._collectProcess()
 
-    return brng
+    #if self._bkilled and self._process is not None and self._process_status == -1
 
 
-  def Read(self):
+  def _collectProcess(self):
     '''
-    This Method checks whether there is data available on the STDOUT and STDERR pipes
-    and reads any available data.
-    The collected data can be read with the `getReportString()` and `getErrorString()` Methods
+    This Method reaps a killed child process without waiting
+    and then reads the remaining output from its pipes and releases them
 
-    :see: `Command.getReportString()`
-    :see: `Command.getErrorString()`
+    :returns: Returns `True` if the child process has been reaped
+    :rtype: boolean
     '''
-    if(self._sreport is not None):
-      self._sreport = None
+    if self._process is None :
+      return True
 
-    if(self._serror is not None):
-      self._serror = None
+    if self._pollProcess() is None :
+      return False
 
-    if self._process is not None :
-      if self._bdebug :
-        self._arr_rpt.append("prc ({}) [{}]: try read ...\n".format(self._pid, self._process_status))
+    #Read the real Process Status Code
+    self._process_status = self._process.returncode
 
-      events = self._selector.select(self._read_timeout)
-      scnk = None
-      brd = True
+    if self._bprofiling :
+      self._recordExecutionTime()
 
-      if self._bdebug :
-        self._arr_rpt.append("prc ({}): '{}' read events\n".format(self._pid, len(events)))
+    if self._selector is not None :
+      #Read the Last Messages from the Sub Process
+      self._drainPipes()
 
-      for key in events:
-        if self._bdebug :
-          self._arr_rpt.append("prc ({}) - event: '{}'\n".format(self._pid, str(key[0])))
+    #Free the Pipe Selector Resources
+    self._freeSelector()
 
-        if key[0].fileobj == self._process.stdout :
-          #------------------------
-          #Read STDOUT
+    return True
 
-          if self._bdebug :
-            self._arr_rpt.append("pipe ({}): reading report ...\n".format(key[0].fd))
 
-          scnk = self._process.stdout.read1(self._package_size) #-1
+  def _signalTerminate(self):
+    '''
+    This Method sends the SIGTERM signal to the running child process without waiting for its exit
+    '''
+    self._arr_err.addNote("Sub Process {}: Process terminating ...\n".format(self.getNameComplete()))
 
-          if scnk is not None :
-            scnk = str(scnk, sys.stdout.encoding)
+    if self._process is not None :
+      self._signalProcess(signal.SIGTERM)
 
-            if scnk != '' :
-              self._arr_rpt.append(scnk)
-            else :
-              brd = False
-          else :
-            brd = False
 
-          if not brd :
-            if self._bdebug :
-              self._arr_rpt.append("pipe ({}): transmission done.\n".format(key[0].fd))
+  def _signalProcess(self, isignal):
+    '''
+    This Method sends the signal `isignal` to the child process
+    or to its whole process group if it runs in its own session.
+    A child process which has already been reaped is not signalled any more
 
-            self._selector.unregister(self._process.stdout)
-            self._process.stdout.close()
+    :param isignal: The signal number
+    :type isignal: integer
+    '''
+    if isinstance(self._process, subprocess.Popen) \
+    and self._pollProcess() is not None :
+      #The Process ID might be reused
+      return
 
-        elif key[0].fileobj == self._process.stderr :
-          #------------------------
-          #Read STDERR
+    if self._bnew_session \
+    and not self._bgroup_cleaned :
+      if isinstance(self._process, ForkServerProcess) :
+        #The Helper Process signals its Child Processes before reaping them
+        self._process.send_signal(isignal, bgroup = True)
 
-          if self._bdebug :
-            self._arr_rpt.append("pipe ({}): reading error ...\n".format(key[0].fd))
+        return
 
-          scnk = self._process.stderr.read1(self._package_size) # -1
+      if self._process.returncode is None :
+        try :
+          os.killpg(self._pid, isignal)
 
-          if scnk is not None :
-            scnk = str(scnk, sys.stderr.encoding)
+          return
+        except (ProcessLookupError, PermissionError) :
+          #The Process Group was not created yet
+          pass
 
-            if scnk != '' :
-              self._arr_err.append(scnk)
-            else :
-              brd = False
-          else :
-            brd = False
+      #if self._process.returncode is None
+    #if self._bnew_session and not self._bgroup_cleaned
 
-          if not brd :
-            if self._bdebug :
-              self._arr_rpt.append("pipe ({}): transmission done.\n".format(key[0].fd))
+    self._process.send_signal(isignal)
 
-            self._selector.unregister(self._process.stderr)
-            self._process.stderr.close()
 
-      #for key in events
+  def iterChunks(self):
+    '''
+    This Method waits for the launched child process like the `Wait()` Method
+    and yields the output as it is received. It yields tuples of the file descriptor number
+    of the pipe, "1" for STDOUT and "2" for STDERR, and the chunk of data.
+    The output is still stored and available with the `Command.report` and `Command.error` Properties.
+    Output which is moved into a target in Tee Mode is not yielded
 
-      if self._bdebug :
-        self._arr_rpt.append("prc ({}): reading done.\n".format(self._pid))
+    :returns: Tuples of the file descriptor number and the chunk of data
+    :rtype: generator
 
-    #if self._process is not None
+    :see: `Command.Wait()`
+    '''
+    queue = deque()
 
+    self._arr_streams.append(queue)
 
-  def Wait(self):
-    '''
-    This Method continuously checks whether the child process is still running with the `Check()` Method.
-    If an Execution Timeout is established the child process is terminated when the time limit is reached
+    try :
+      if self.isRunning() :
+        for irng in self._iterateWait() :
+          while len(queue) > 0 :
+            yield queue.popleft()
 
-    :returns: Returns `True` if the child process has finished correctly
-    :rtype: boolean
+      #if self.isRunning()
 
-    :see: `Command.Check()`
-    '''
-    irng = 1
-    brs = False
+      while len(queue) > 0 :
+        yield queue.popleft()
 
-    sprcnm = self.getNameComplete()
+    finally :
+      self._arr_streams.remove(queue)
 
-    itmrng = -1
-    itmrngstrt = -1
-    itmrngend = -1
 
-    if(self._execution_timeout > -1):
-      itmrng = 0
-      itmrngstrt = time.time()
+  def iterLines(self):
+    '''
+    This Method waits for the launched child process like `iterChunks()`
+    and yields the output line by line. Lines which are split across chunks are reassembled.
+    It yields tuples of the file descriptor number of the pipe and the line including its line break.
+    The last line of each pipe is yielded when the transmission has finished even without line break
 
-    while(irng > 0):
+    :returns: Tuples of the file descriptor number and the line
+    :rtype: generator
 
-      #Check the Sub Process
-      irng = int(self.Check())
+    :see: `Command.iterChunks()`
+    '''
+    arrpending = {1: [], 2: []}
 
-      if(irng > 0):
-        if(self._execution_timeout > -1):
-          itmrngend = time.time()
+    for ifd, scnk in self.iterChunks() :
+      snl = b'\n' if isinstance(scnk, bytes) else '\n'
+      ipos = 0
+      inl = scnk.find(snl)
 
-          itmrng = itmrngend - itmrngstrt
+      while inl != -1 :
+        arrline = arrpending[ifd]
 
-          if self._bdebug :
-            self._arr_rpt.append("wait tm rng: '{}'\n".format(itmrng))
+        if len(arrline) > 0 :
+          #Complete the Line of the previous Chunks
+          arrline.append(scnk[ipos : inl + 1])
 
-          if itmrng >= self._execution_timeout :
-            self._arr_err.append("Sub Process {}: Execution timed out!\n".format(sprcnm))
-            self._arr_err.append("Execution Time '{} / {}'\n".format(itmrng, self._execution_timeout))
-            self._arr_err.append("Process will be terminated.\n")
+          yield (ifd, scnk[:0].join(arrline))
 
-            if(self._err_code < 4):
-              self._err_code = 4
+          arrpending[ifd] = []
+        else :
+          yield (ifd, scnk[ipos : inl + 1])
 
-            #Terminate the Timed Out Sub Process
-            self.Terminate()
+        ipos = inl + 1
+        inl = scnk.find(snl, ipos)
 
-            #Try to reap the Sub Process again
-            if self.Check() :
-              #Kill the blocked Sub Process
-              self.Kill()
+      #while inl != -1
 
-            #Mark the Sub Process as finished with Error
-            irng = -1
+      if ipos < len(scnk) :
+        arrpending[ifd].append(scnk[ipos:])
 
-          #if(itmrng >= self._execution_timeout)
-        #if(self._execution_timeout > -1)
-      # if(irng > 0)
-    #while(irng > 0):
+    #for ifd, scnk in self.iterChunks()
+
+    for ifd in (1, 2) :
+      if len(arrpending[ifd]) > 0 :
+        yield (ifd, arrpending[ifd][0][:0].join(arrpending[ifd]))
 
-    if(irng == 0):
-      #Mark as Finished correctly
-      brs = True
 
-    return brs
 
 
   def Terminate(self):
@@ -476,14 +2487,11 @@ class Command(object):
       .format(sys._getframe(1).f_code.co_name, sys._getframe(0).f_code.co_name))
 
     if self.isRunning():
-      self._arr_err.append("Sub Process {}: Process terminating ...\n".format(sprcnm))
-
-      if self._process is not None :
-        self._process.terminate()
+      self._signalTerminate()
 
       self.Check()
     else :  #Sub Process is not running
-      self._arr_err.append("Sub Process ${sprcnm}: Process is not running.\n".format(sprcnm))
+      self._arr_err.addNote("Sub Process ${sprcnm}: Process is not running.\n".format(sprcnm))
 
 
   def Kill(self):
@@ -494,20 +2502,20 @@ class Command(object):
       .format(sys._getframe(1).f_code.co_name, sys._getframe(0).f_code.co_name))
 
     if self.isRunning() :
-      self._arr_err.append("Sub Process {}: Process killing ...\n".format(sprcnm))
+      self._arr_err.addNote("Sub Process {}: Process killing ...\n".format(sprcnm))
       print("Sub Process {}: Process killing ...\n".format(sprcnm))
 
       if self._process is not None :
-        self._process.kill()
+        self._signalProcess(signal.SIGKILL)
 
-      #Mark Process as have been killed
-      self._process_status = 4
+      #The Exit Code is read when the Sub Process is reaped
+      self._bkilled = True
 
       if self._err_code < 4 :
         self._err_code = 4
 
     else :  #Sub Process is not running
-      self._arr_err.append("Sub Process ${sprcnm}: Process is not running.\n".format(sprcnm))
+      self._arr_err.addNote("Sub Process ${sprcnm}: Process is not running.\n".format(sprcnm))
 
 
   def _freeSelector(self):
@@ -517,27 +2525,37 @@ class Command(object):
 
     #Resource can only be freed if the Sub Process has terminated
     if not self.isRunning() :
-      if self._selector is not None :
-        pipes = list(self._selector.get_map().keys())
-
-        #print("pipes list: '{}'".format(str(pipes)))
+      self._closePidfd()
 
-        for pp in pipes :
-          key = self._selector.get_key(pp)
+      if self._process is not None :
+        for pp in (self._process.stdout, self._process.stderr, self._process.stdin) :
+          if pp is not None \
+          and not pp.closed :
+            if self._bdebug :
+              self._arr_rpt.append("pipe ({}): not closed. Closing now ...\n".format(pp.fileno()))
 
-          #print("key: '{}'".format(str(key)))
+            self._closePipe(pp)
 
-          if self._bdebug :
-            self._arr_rpt.append("pipe ({}): not closed. Closing now ...\n".format(key.fd))
+          #if pp is not None and not pp.closed
+        #for pp in (self._process.stdout, self._process.stderr, self._process.stdin)
 
-          self._selector.unregister(key.fileobj)
-          key.fileobj.close()
+      #Release the remaining Input
+      self._input_iter = None
+      self._input_chunk = None
+      #if self._process is not None
 
-        #for pp in pipes
+      #Close the Targets of interrupted Transmissions
+      self._closeTargets()
 
+      if self._selector is not None \
+      and not self._bshared_selector :
+        #Only an own Selector can be closed
         self._selector.close()
         self._selector = None
 
+      #if self._selector is not None and not self._bshared_selector
+    #if not self.isRunning()
+
 
 
   def freeResources(self):
@@ -549,6 +2567,8 @@ class Command(object):
       #Kill a still running Sub Process
       self.Kill()
 
+    self._reapKilled()
+
     #Free the Pipe Selector Resources
     self._freeSelector()
 
@@ -560,17 +2580,35 @@ class Command(object):
 
     self._pid = -1
     self._process_status = -1
-
-    self._arr_rpt = []
-    self._arr_err = []
-    self._sreport = None
-    self._serror = None
+    self._bkilled = False
+
+    self._arr_rpt.clear()
+    self._arr_err.clear()
+    self._irpt_size = 0
+    self._ierr_size = 0
+    self._clearCache()
+    self._clearUsage()
     self._err_code = 0
 
     if self._bprofiling :
       self._time_execution = -1
       self._time_start = -1
       self._time_end = -1
+      self._itm_start_ns = -1
+      self._itm_execution_ns = -1
+
+
+  def _clearCache(self):
+    '''
+    This Method discards the joined Report and Error Messages.
+    It is only needed when the joining changes, because new output is detected
+    by the `CaptureBuffer` objects
+    '''
+    self._acc_report = None
+    self._acc_error = None
+    self._acc_report_bytes = None
+    self._acc_error_bytes = None
+    self._acc_error_output = None
 
 
 
@@ -614,6 +2652,21 @@ class Command(object):
     return self._scommand
 
 
+  def getSelector(self):
+    '''
+    This Method returns the selector in which the pipes of the child process are registered.
+    This is `None` when the child process is not running and no selector was assigned
+
+    :returns: The selector watching the pipes of the child process
+    :rtype: selectors.BaseSelector
+    '''
+    return self._selector
+
+
+  def isSharedSelector(self):
+    return self._bshared_selector
+
+
   def getReadTimeout(self):
     '''
     Command.read_timeout Property which represents the time in seconds which the `Command` object
@@ -638,9 +2691,28 @@ class Command(object):
     return self._execution_timeout
 
 
+  def getDeadline(self):
+    '''
+    Command.deadline Property which holds the time in nanoseconds on the `time.monotonic_ns()` clock
+    at which the Execution Timeout of the launched child process is reached.
+    It is "-1" if no Execution Timeout is set or the child process was never launched
+
+    :returns: The Deadline of the child process
+    :rtype: integer
+    '''
+    itmdeadline = -1
+
+    if self._execution_timeout > -1 \
+    and self._itm_launch_ns > -1 :
+      itmdeadline = self._itm_launch_ns + int(self._execution_timeout * 1000000000)
+
+    return itmdeadline
+
+
   def isRunning(self):
     '''
-    This Method reports whether the Child Process is still running
+    This Method reports whether the Child Process is still running.
+    A killed Child Process is not running any more even before it is reaped
 
     :returns: Whether the Child Process is still running
     :rtype: boolean
@@ -648,7 +2720,8 @@ class Command(object):
     brng = False
 
     #The Process got a Process ID but did not get a Process Status Code yet
-    if self._pid > 0 and self._process_status == -1 :
+    if self._pid > 0 and self._process_status == -1 \
+    and not self._bkilled :
       brng = True
 
     return brng
@@ -656,28 +2729,259 @@ class Command(object):
 
   def getReportString(self):
     '''
-    Command.report Property which represents all Report Messages
+    Command.report Property which represents all Report Messages.
+    The joined Messages are kept and only output received since the last request is added
 
     :returns: All Report Messages as single String joined seamlessly
     :rtype: string
     '''
-    if self._sreport is None :
-      self._sreport = ''.join(self._arr_rpt)
+    self._acc_report = self._accumulate(self._arr_rpt, self._acc_report, False)
+
+    return self._acc_report['value']
+
+
+  def getReportBytes(self):
+    '''
+    Command.report_bytes Property which represents all Report Messages as `bytes`.
+    In Binary Capture Mode the output of the child process is returned unchanged
+
+    :returns: All Report Messages as single `bytes` object joined seamlessly
+    :rtype: bytes
+    '''
+    self._acc_report_bytes = self._accumulate(self._arr_rpt, self._acc_report_bytes, True)
 
-    return self._sreport
+    return self._acc_report_bytes['value']
 
 
   def getErrorString(self):
     '''
-    Command.error Property which represents all Error Messages
+    Command.error Property which represents all Error Messages.
+    The joined Messages are kept and only output received since the last request is added.
+    The Messages of this library like launch failures and timeouts are placed
+    in the STDERR output in the order they were recorded and are not limited by the Retention Policy
 
     :returns: All Error Messages as single String joined seamlessly
     :rtype: string
     '''
-    if self._serror is None :
-      self._serror = ''.join(self._arr_err)
+    self._acc_error = self._accumulate(self._arr_err, self._acc_error, False)
+
+    return self._acc_error['value']
+
+
+  def getErrorBytes(self):
+    '''
+    Command.error_bytes Property which represents all Error Messages as `bytes`.
+    In Binary Capture Mode the output of the child process is returned unchanged
+
+    :returns: All Error Messages as single `bytes` object joined seamlessly
+    :rtype: bytes
+    '''
+    self._acc_error_bytes = self._accumulate(self._arr_err, self._acc_error_bytes, True)
+
+    return self._acc_error_bytes['value']
+
+
+  def _getErrorOutputBytes(self):
+    #The File and the Map only hold the STDERR Output
+    self._acc_error_output = self._accumulate(self._arr_err, self._acc_error_output, True, False)
+
+    return self._acc_error_output['value']
+
+
+  def getReportFile(self):
+    '''
+    This Method opens the captured STDOUT output for reading as binary file object.
+    If the output is spooled the spool file is opened without loading it into memory,
+    otherwise the `Command.report_bytes` are wrapped into a file object.
+    The caller must close the returned file object
+
+    :returns: The STDOUT output as binary file object
+    :rtype: io.BufferedIOBase
+    '''
+    return self._openBuffer(self._arr_rpt, self.getReportBytes)
+
+
+  def getErrorFile(self):
+    '''
+    This Method opens the captured STDERR output for reading as binary file object.
+    It does not contain the Messages of this library
+
+    :see: `Command.getReportFile()`
+    '''
+    return self._openBuffer(self._arr_err, self._getErrorOutputBytes)
+
+
+  def getReportMap(self):
+    '''
+    This Method gives access to the captured STDOUT output without copying it.
+    If the output is spooled a read-only memory map of the spool file is returned,
+    otherwise a `memoryview` of the `Command.report_bytes`
+
+    :returns: The STDOUT output as buffer
+    :rtype: mmap.mmap or memoryview
+    '''
+    return self._mapBuffer(self._arr_rpt, self.getReportBytes)
+
+
+  def getErrorMap(self):
+    '''
+    This Method gives access to the captured STDERR output without copying it.
+    It does not contain the Messages of this library
+
+    :see: `Command.getReportMap()`
+    '''
+    return self._mapBuffer(self._arr_err, self._getErrorOutputBytes)
+
+
+  def _openBuffer(self, arrbuffer, fnbytes):
+    fbuffer = arrbuffer.getFile()
+
+    if fbuffer is None :
+      fbuffer = io.BytesIO(fnbytes())
+
+    return fbuffer
+
+
+  def _mapBuffer(self, arrbuffer, fnbytes):
+    mbuffer = arrbuffer.getMap()
+
+    if mbuffer is None :
+      mbuffer = memoryview(fnbytes())
+
+    return mbuffer
+
+
+  def isReportSpooled(self):
+    return self._arr_rpt.isSpooled()
+
+
+  def isErrorSpooled(self):
+    return self._arr_err.isSpooled()
+
+
+  def _createDecoder(self):
+    '''
+    This Method creates an incremental decoder for the configured encoding and error handler.
+    The decoder keeps Multi-Byte Characters which are split across reads until they are complete
+
+    :returns: A new incremental decoder
+    :rtype: codecs.IncrementalDecoder
+    '''
+    return codecs.getincrementaldecoder(self.getEncoding())(self._encoding_errors)
+
+
+  def _accumulate(self, arrbuffer, accumulator, bbytes, bnotes = True):
+    '''
+    This Method joins the Messages in `arrbuffer` into the `accumulator`.
+    If the Messages have not changed the `accumulator` is returned unchanged.
+    If Messages were only appended since the last join they are added to the joined Messages,
+    otherwise all Messages are joined anew.
+    In Binary Capture Mode the raw output is decoded for the String
+    and decoded Messages are encoded with the configured encoding for the `bytes` object
+
+    :param arrbuffer: The captured Messages
+    :type arrbuffer: CaptureBuffer
+    :param accumulator: The state of the last join or `None`
+    :type accumulator: dictionary
+    :param bbytes: Whether the Messages are joined into a `bytes` object
+    :type bbytes: boolean
+    :param bnotes: Whether the Messages of this library are joined
+    :type bnotes: boolean
+    :returns: The state of the join with the joined Messages in the `value` entry
+    :rtype: dictionary
+    '''
+    mark = arrbuffer.getMark()
+    arrchunks = None
+
+    if accumulator is not None :
+      if accumulator['mark'] == mark :
+        #No new Messages
+        return accumulator
+
+      arrchunks = arrbuffer.getAppendedChunks(accumulator['mark'])
+
+    #if accumulator is not None
+
+    if arrchunks is None :
+      #Join all Messages anew
+      accumulator = {'mark': None, 'value': None, 'decoder': None}
+
+      if bbytes :
+        accumulator['buffer'] = bytearray()
+      else :
+        accumulator['buffer'] = io.StringIO()
+
+        if self._bbinary :
+          accumulator['decoder'] = self._createDecoder()
+
+      arrchunks = arrbuffer.getChunks(bnotes)
+
+    #if arrchunks is None
+
+    joined = accumulator['buffer']
+    decoder = accumulator['decoder']
+
+    if bbytes :
+      sencoding = self.getEncoding()
+
+      for scnk in arrchunks :
+        if isinstance(scnk, bytes) :
+          joined.extend(scnk)
+        else :  #Decoded Messages
+          joined.extend(scnk.encode(sencoding, 'replace'))
+
+      #for scnk in arrchunks
+
+      accumulator['value'] = bytes(joined)
+    elif decoder is None :
+      for scnk in arrchunks :
+        joined.write(scnk)
+
+      accumulator['value'] = joined.getvalue()
+    else :  #Decode the raw Output
+      for scnk in arrchunks :
+        if isinstance(scnk, bytes) :
+          joined.write(decoder.decode(scnk))
+        else :  #Messages of the Command Object
+          joined.write(decoder.decode(b'', True))
+          joined.write(scnk)
+
+      #for scnk in arrchunks
+
+      #Flush incomplete Characters without losing them for the next Output
+      state = decoder.getstate()
+
+      accumulator['value'] = joined.getvalue() + decoder.decode(b'', True)
+
+      decoder.setstate(state)
+
+    #if bbytes
+
+    accumulator['mark'] = mark
+
+    return accumulator
+
+
+  def getReportSize(self):
+    '''
+    Command.report_size Property which holds the count of bytes received on STDOUT.
+    This count is exact regardless of the Retention Policy
+
+    :returns: The count of bytes received from the child process on STDOUT
+    :rtype: integer
+    '''
+    return self._irpt_size
+
+
+  def getErrorSize(self):
+    '''
+    Command.error_size Property which holds the count of bytes received on STDERR.
+    This count is exact regardless of the Retention Policy
 
-    return self._serror
+    :returns: The count of bytes received from the child process on STDERR
+    :rtype: integer
+    '''
+    return self._ierr_size
 
 
   def getErrorCode(self):
@@ -708,13 +3012,188 @@ class Command(object):
 
 
   def getExecutionTime(self):
+    '''
+    Command.execution_time Property which holds the Execution Time of the child process
+    in seconds when the Profiling is enabled. It is "-1" if it was not measured
+
+    :returns: The Execution Time in seconds
+    :rtype: float
+    '''
     return self._time_execution
 
 
+  def getResourceUsage(self):
+    '''
+    Command.resource_usage Property which holds the resource usage of the finished child process
+    as reported by `os.wait4()` with the keys `utime`, `stime`, `maxrss`, `minflt`, `majflt`,
+    `nvcsw` and `nivcsw`.
+    If the resource usage was sampled it also holds the keys `cpu_peak`, `rss_peak`
+    and the last `read_bytes` and `write_bytes`.
+    The `os.wait4()` values are missing while the child process is running
+
+    :returns: The resource usage as key - value pairs
+    :rtype: dictionary
+
+    :see: `resourceusage.getUsageDict()`
+    '''
+    usage = dict(self._rusage)
+
+    usage.update(self._sample_peaks)
+
+    for skey in ('read_bytes', 'write_bytes') :
+      if skey in self._sample :
+        usage[skey] = self._sample[skey]
+
+    #for skey in ('read_bytes', 'write_bytes')
+
+    return usage
+
+
+  def getSample(self):
+    '''
+    Command.sample Property which holds the last sample of the resource usage
+    with the keys `cputime`, `cpu`, `rss`, `read_bytes`, `write_bytes` and `time`.
+    `cpu` is the CPU usage in percent of one CPU since the previous sample
+    and `time` is the time of the sample on the `time.monotonic_ns()` clock
+
+    :returns: The last sample as key - value pairs
+    :rtype: dictionary
+
+    :see: `resourceusage.readProcessSample()`
+    '''
+    return dict(self._sample)
+
+
+  def getSampleInterval(self):
+    return self._sample_interval
+
+
+  def getExecutionTimeNs(self):
+    '''
+    Command.execution_time_ns Property which holds the Execution Time of the child process
+    in nanoseconds when the Profiling is enabled. It is "-1" if it was not measured
+
+    :returns: The Execution Time in nanoseconds
+    :rtype: integer
+    '''
+    return self._itm_execution_ns
+
+
+  def getStartTime(self):
+    '''
+    Command.start_time Property which holds the Wall Clock Time of the launch in seconds
+    since the Epoch when the Profiling is enabled. It is only meant for the Logs
+    and is not used to measure the Execution Time
+
+    :returns: The Launch Time as Unix Timestamp
+    :rtype: float
+    '''
+    return self._time_start
+
+
+  def getEndTime(self):
+    '''
+    Command.end_time Property which holds the Wall Clock Time of the exit in seconds
+    since the Epoch when the Profiling is enabled
+
+    :returns: The Exit Time as Unix Timestamp
+    :rtype: float
+    '''
+    return self._time_end
+
+
+  def isBlocking(self):
+    return self._bblocking
+
+
   def isProfiling(self):
     return self._bprofiling
 
 
+  def isBinary(self):
+    return self._bbinary
+
+
+  def getLauncher(self):
+    return self._slauncher
+
+
+  def getForkServer(self):
+    return self._forkserver
+
+
+  def getLimits(self):
+    return dict(self._limits)
+
+
+  def isNewSession(self):
+    return self._bnew_session
+
+
+  def getGracePeriod(self):
+    return self._grace_period
+
+
+  def getInput(self):
+    return self._input
+
+
+  def getReportTarget(self):
+    return self._target_rpt
+
+
+  def getErrorTarget(self):
+    return self._target_err
+
+
+  def getTee(self):
+    return self._itee_tail
+
+
+  def getReportHandler(self):
+    return self._fn_on_stdout
+
+
+  def getErrorHandler(self):
+    return self._fn_on_stderr
+
+
+  def getDeadlineHandler(self):
+    return self._fn_on_deadline
+
+
+  def getPackageSize(self):
+    return self._package_size
+
+
+  def getMaxPackageSize(self):
+    return self._max_package_size
+
+
+  def getPipeSize(self):
+    return self._pipe_size
+
+
+  def getEncoding(self):
+    '''
+    Command.encoding Property which represents the encoding of the output of the child process.
+    By default this is the preferred encoding of the locale which is inherited by the child process
+
+    :returns: The name of the encoding
+    :rtype: string
+    '''
+    sencoding = self._encoding
+
+    if sencoding is None :
+      sencoding = locale.getpreferredencoding(False)
+
+    return sencoding
+
+
+  def getEncodingErrors(self):
+    return self._encoding_errors
+
+
   def isDebug(self):
     return self._bdebug
 
@@ -728,10 +3207,42 @@ class Command(object):
   command_line = property(getCommand, setCommand)
   read_timeout = property(getReadTimeout, setReadTimeout)
   timeout = property(getTimeout, setTimeout)
+  deadline = property(getDeadline)
+  blocking = property(isBlocking, setBlocking)
   execution_time = property(getExecutionTime)
+  execution_time_ns = property(getExecutionTimeNs)
+  resource_usage = property(getResourceUsage)
+  sample = property(getSample)
+  sample_interval = property(getSampleInterval, setSampleInterval)
+  start_time = property(getStartTime)
+  end_time = property(getEndTime)
   profiling = property(isProfiling, setProfiling)
   debug = property(isDebug, setDebug)
+  binary = property(isBinary, setBinary)
+  package_size = property(getPackageSize, setPackageSize)
+  max_package_size = property(getMaxPackageSize, setMaxPackageSize)
+  pipe_size = property(getPipeSize, setPipeSize)
+  encoding = property(getEncoding, setEncoding)
+  encoding_errors = property(getEncodingErrors, setEncodingErrors)
+  launcher = property(getLauncher, setLauncher)
+  forkserver = property(getForkServer, setForkServer)
+  limits = property(getLimits, setLimits)
+  new_session = property(isNewSession, setNewSession)
+  grace_period = property(getGracePeriod, setGracePeriod)
+  input = property(getInput, setInput)
+  report_target = property(getReportTarget, setReportTarget)
+  error_target = property(getErrorTarget, setErrorTarget)
+  tee = property(getTee, setTee)
+  on_stdout = property(getReportHandler, setReportHandler)
+  on_stderr = property(getErrorHandler, setErrorHandler)
+  on_deadline = property(getDeadlineHandler, setDeadlineHandler)
   report = property(getReportString)
   error = property(getErrorString)
+  report_bytes = property(getReportBytes)
+  error_bytes = property(getErrorBytes)
+  report_size = property(getReportSize)
+  report_spooled = property(isReportSpooled)
+  error_spooled = property(isErrorSpooled)
+  error_size = property(getErrorSize)
   code = property(getErrorCode)
   status = property(getProcessStatus)
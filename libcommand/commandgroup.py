@@ -2,18 +2,22 @@
 This Module provides the `CommandGroup` Class which manages multiple `Command` objects.
 It executes and monitores the `Command` objects.
 
-:version: 2021-04-18
+:version: 2026-10-18
 
 :author: Bodo Hugo Barwich
 '''
 __docformat__ = "restructuredtext en"
 
 import sys
-import math
+import selectors
 import time
+import heapq
+import itertools
 from datetime import datetime
 
 from .command import Command
+from .resourceusage import aggregateUsage
+from .placement import CorePlacement
 
 
 
@@ -26,6 +30,28 @@ class CommandGroup(object):
   This is a Class to manage multiple `Command` object whom execution is related in time.
 
   It offers Methods to run, monitor and access the `Command` objects
+
+  The pipes of all launched `Command` objects are registered in a single selector
+  so that all child processes are watched with one system call
+  and the output is dispatched to the owning `Command` object.
+  Where supported the exit of the child processes is notified by Process File Descriptors
+  in the same selector, so idle groups are not woken up at all.
+
+  The Execution Timeouts of the launched `Command` objects are kept in a heap of deadlines
+  on the monotonic clock. The selector only sleeps until the nearest deadline
+  and each `Command` object is terminated when its own Execution Timeout is reached
+
+  Child processes which are terminated at a timeout or by `CommandGroup.Shutdown()` are killed
+  when their grace period has passed. These escalations are scheduled in a second heap of deadlines,
+  so all child processes are shut down concurrently within the same check loop
+
+  With a placement policy each launched child process is pinned to CPU cores or a NUMA node
+  and the assignment is reported by `CommandGroup.getiPlacement()`
+
+  Launching a `Command` object in the group changes its settings: it is registered
+  in the selector of the group, its `Command.on_deadline` handler is set and the launcher, sample interval, new session
+  and grace period of the group are set on it when they are configured.
+  The default limits and the placement only apply to each launch
   '''
 
 
@@ -42,16 +68,37 @@ class CommandGroup(object):
     '''
 
     self._arr_commands = []
+    self._selector = None
     self._check_interval = -1
+    self._slauncher = None
+    self._sample_interval = -1
+    self._limits = {}
+    self._placement = None
+    self._arr_placements = {}
+    self._bnew_session = False
+    self._grace_period = -1
     self._read_timeout = 0
     self._execution_timeout = -1
     self._time_execution = -1
     self._time_start = -1
     self._time_end = -1
+    self._itm_launch_ns = -1
+    self._itm_start_ns = -1
+    self._itm_execution_ns = -1
+    self._arr_deadlines = []
+    self._arr_escalations = []
+    self._arr_killed = []
+    self._deadline_sequence = itertools.count()
+    #The Sequence Number of the current Deadline of each Command Object
+    self._arr_deadline_generations = {}
+    self._itimeouts = 0
+    self._bshutdown = False
     self._arr_rpt = []
     self._arr_err = []
-    self._sreport = None
-    self._serror = None
+    self._sreport = ''
+    self._serror = ''
+    self._irpt_joined = 0
+    self._ierr_joined = 0
     self._err_code = 0
     self._bprofiling = False
     self._bquiet = False
@@ -85,6 +132,24 @@ class CommandGroup(object):
     if 'timeout' in options :
       self.setTimeout(options['timeout'])
 
+    if 'launcher' in options :
+      self.setLauncher(options['launcher'])
+
+    if 'sampling' in options :
+      self.setSampleInterval(options['sampling'])
+
+    if 'limits' in options :
+      self.setLimits(options['limits'])
+
+    if 'placement' in options :
+      self.setPlacement(options['placement'])
+
+    if 'session' in options :
+      self.setNewSession(options['session'])
+
+    if 'grace' in options :
+      self.setGracePeriod(options['grace'])
+
 
   def setCheckInterval(self, icheckinterval = -1):
     try :
@@ -97,14 +162,9 @@ class CommandGroup(object):
       #Disable Check Interval
       self._check_interval = -1
 
-    if self._check_interval > 0 \
-    and len(self._arr_commands) > 0 :
-      irdtmout = math.floor(self._check_interval / len(self._arr_commands))
-
-      #Save the required Read Timeout
-      self.setReadTimeout(irdtmout)
-
-    #if self._check_interval > 0 and len(self._arr_commands) > 0
+    if self._check_interval > 0 :
+      #All Child Processes are watched within the same Read Timeout
+      self.setReadTimeout(self._check_interval)
 
 
   def setReadTimeout(self, ireadtimeout = 1):
@@ -138,6 +198,113 @@ class CommandGroup(object):
       self._execution_timeout = -1
 
 
+  def setLauncher(self, slauncher = None):
+    '''
+    This Method sets the launcher for all `Command` objects of the group.
+    If `slauncher` is `None` each `Command` object uses its own launcher
+
+    :param slauncher: The name of the launcher: "popen" or "spawn"
+    :type slauncher: string
+
+    :see: `Command.setLauncher()`
+    '''
+    self._slauncher = slauncher
+
+
+  def setSampleInterval(self, fsampleinterval = -1):
+    '''
+    This Method sets the interval in seconds at which the resource usage of all child processes
+    launched by the group is sampled. The check loop wakes up at least at this interval.
+    The value "-1" keeps the sampling settings of the `Command` objects
+
+    :param fsampleinterval: Time in seconds between two samples
+    :type fsampleinterval: number
+
+    :see: `Command.setSampleInterval()`
+    '''
+    try :
+      self._sample_interval = float(fsampleinterval)
+    except :
+      #The Parameter is not a Number
+      self._sample_interval = -1
+
+    if self._sample_interval <= 0 :
+      self._sample_interval = -1
+
+
+  def setLimits(self, limits = None):
+    '''
+    This Method sets the default limits for the child processes launched by the group.
+    The limits of a `Command` object take precedence over the defaults with the same key.
+    The defaults only apply to the launches by the group and do not change `Command.limits`
+
+    :param limits: The limits as key - value pairs
+    :type limits: dictionary
+
+    :see: `Command.setLimits()`
+    '''
+    if limits is not None :
+      self._limits = dict(limits)
+    else :
+      self._limits = {}
+
+
+  def setPlacement(self, placement = None):
+    '''
+    This Method sets the policy which pins the launched child processes to CPU cores.
+    The recognized policies are "roundrobin", "pack" and "spread" over the NUMA nodes
+    of the system. Child processes with their own `affinity` limit are not placed.
+    The assigned cores are applied as `affinity` limit before the command starts.
+    `None` disables the placement
+
+    :param placement: The name of the placement policy or a `CorePlacement` object
+    :type placement: string | CorePlacement
+    :raises ValueError: If the placement policy is unknown
+
+    :see: `CorePlacement`
+    '''
+    if placement is None \
+    or isinstance(placement, CorePlacement) :
+      self._placement = placement
+    else :
+      self._placement = CorePlacement(placement)
+
+
+  def setNewSession(self, bnewsession = True):
+    '''
+    This Method sets whether all child processes of the group are launched in their own session
+    and process group, so that terminating and killing them reaches all processes they forked.
+    If it is disabled each `Command` object keeps its own setting
+
+    :param bnewsession: Whether the child processes get their own session
+    :type bnewsession: boolean
+
+    :see: `Command.setNewSession()`
+    '''
+    self._bnew_session = bool(bnewsession)
+
+
+  def setGracePeriod(self, fgraceperiod = -1):
+    '''
+    This Method sets the time in seconds the child processes of the group have to exit
+    after the SIGTERM signal before they are killed.
+    The value "-1" keeps the grace period of the `Command` objects
+
+    :param fgraceperiod: Time in seconds to wait for the exit of the child processes
+    :type fgraceperiod: number
+
+    :see: `Command.setGracePeriod()`
+    '''
+    try :
+      self._grace_period = float(fgraceperiod)
+    except :
+      #The Parameter is not a Number
+      self._grace_period = -1
+
+    if self._grace_period < 0 :
+      self._grace_period = -1
+
+
   def setProfiling(self, bisprofiling = True):
     self._bprofiling = bisprofiling
 
@@ -199,54 +366,168 @@ class CommandGroup(object):
 
     if icmdcnt > 0 :
       cmd = None
-      scmdnm = ''
       icmdidx = -1
 
-      stmnow = None
-
-      if self._check_interval > 0 \
-      and self._read_timeout > 0 \
-      and self._read_timeout * icmdcnt > self._check_interval :
-        #Re-adjust the Check Interval
-        self.setCheckInterval(self._check_interval)
+      if self._selector is None :
+        #Create the Pipe IO Selector shared by all Child Processes
+        self._selector = selectors.DefaultSelector()
 
-      if self._execution_timeout > -1 :
-        #Keep track of the Start Time
-        self._start_time = time.time()
+      #Keep track of the Start Time
+      self._recordStart()
 
       for icmdidx in range(0, icmdcnt):
         cmd = self._arr_commands[icmdidx]
 
         if cmd is not None :
-          scmdnm = "No. '{}' - {}".format(icmdidx, cmd.getNameComplete())
+          if self._launchCommand(icmdidx, cmd) :
+            irs += 1
 
-          stmnow = datetime.now().strftime('%F %T')
+        #if cmd is not None
+      #for icmdidx in range(0, icmdcnt)
+    #if icmdcnt > 0
 
-          self._arr_rpt.append("{} : Sub Process {}: Launching ...\n".format(stmnow, scmdnm))
 
-          #Launch the Sub Process through Process::SubProcess::Launch()
-          if cmd.Launch() :
-            stmnow  = datetime.now().strftime('%F %T')
+    return irs
 
-            self._arr_rpt.append("{} : Sub Process {}: Launch OK - PID ({})\n"\
-            .format(stmnow, scmdnm, cmd.getProcessID()))
 
-            irs += 1
-          else :  #Sub Process Launch failed
-            if cmd.code > self._err_code :
-              #Keep the Child Process Error Code
-              self._err_code = cmd.code
+  def _launchCommand(self, icmdidx, cmd):
+    '''
+    This Method launches the `Command` object `cmd` at the position `icmdidx`
+    with its pipes registered in the shared selector and records the result
+
+    :param icmdidx: The position of the `Command` object in the group
+    :type icmdidx: integer
+    :param cmd: The `Command` object to launch
+    :type cmd: Command
+    :returns: Returns `True` if the launch of the child process succeeded
+    :rtype: boolean
+    '''
+    brs = False
+    scmdnm = "No. '{}' - {}".format(icmdidx, cmd.getNameComplete())
 
-            self._arr_err.append("Sub Process {}: Launch failed!\nMessage: {}\n"\
-            .format(scmdnm, cmd.error))
+    if not cmd.isRunning() :
+      #Register the Pipes in the shared Selector
+      cmd.setSelector(self._selector)
+      #Schedule a changed Execution Timeout again
+      cmd.setDeadlineHandler(self._pushDeadline)
 
-          #if cmd.Launch()
-        #if cmd is not None
-      #for icmdidx in range(0, icmdcnt)
-    #if icmdcnt > 0
+    stmnow = datetime.now().strftime('%F %T')
 
+    self._arr_rpt.append("{} : Sub Process {}: Launching ...\n".format(stmnow, scmdnm))
 
-    return irs
+    overrides, splacement = self._prepareLaunch(icmdidx, cmd)
+
+    #Launch the Sub Process through Process::SubProcess::Launch()
+    blaunched = cmd.Launch(overrides)
+
+    if blaunched :
+      stmnow  = datetime.now().strftime('%F %T')
+
+      self._arr_rpt.append("{} : Sub Process {}: Launch OK - PID ({}){}\n"\
+      .format(stmnow, scmdnm, cmd.getProcessID(), splacement))
+
+      #Schedule the Execution Timeout of the Child Process
+      self._pushDeadline(cmd)
+
+      brs = True
+    else :  #Sub Process Launch failed
+      self._arr_placements.pop(icmdidx, None)
+
+      if cmd.code > self._err_code :
+        #Keep the Child Process Error Code
+        self._err_code = cmd.code
+
+      self._arr_err.append("Sub Process {}: Launch failed!\nMessage: {}\n"\
+      .format(scmdnm, cmd.error))
+
+    #if blaunched
+
+    return brs
+
+
+  def _prepareLaunch(self, icmdidx, cmd):
+    '''
+    This Method applies the group settings to the `Command` object `cmd` at the position `icmdidx`
+    and assigns its cores before it is launched
+
+    :param icmdidx: The position of the `Command` object in the group
+    :type icmdidx: integer
+    :param cmd: The `Command` object to launch
+    :type cmd: Command
+    :returns: The settings for `Command.Launch()` and the placement for the report
+    :rtype: tuple
+    '''
+    if not cmd.isRunning() :
+      if self._slauncher is not None :
+        cmd.setLauncher(self._slauncher)
+
+      if self._sample_interval > 0 :
+        cmd.setSampleInterval(self._sample_interval)
+
+      if self._bnew_session :
+        cmd.setNewSession(True)
+
+      if self._grace_period > -1 :
+        cmd.setGracePeriod(self._grace_period)
+
+    #if not cmd.isRunning()
+
+    overrides = self._getLaunchOverrides(icmdidx, cmd)
+
+    #The Limits of the Command Object take Precedence over the Defaults
+    limits = dict(self._limits)
+
+    limits.update(overrides.get('limits', cmd.getLimits()))
+
+    splacement = self._placeCommand(icmdidx, cmd, limits)
+
+    if icmdidx in self._arr_placements :
+      limits['affinity'] = self._arr_placements[icmdidx]['cpus']
+
+    #The Defaults and the Placement only apply to this Launch
+    overrides['limits'] = limits
+
+    return (overrides, splacement)
+
+
+  def _getLaunchOverrides(self, icmdidx, cmd):
+    '''
+    This Method provides the settings which only apply to the next launch
+    of the `Command` object `cmd` at the position `icmdidx`
+
+    :returns: The settings for `Command.Launch()`
+    :rtype: dictionary
+    '''
+    return {}
+
+
+  def _placeCommand(self, icmdidx, cmd, limits):
+    '''
+    This Method assigns the CPU cores by the placement policy to the `Command` object `cmd`
+    at the position `icmdidx` before it is launched.
+    If the cores cannot be applied the `Command` object reports the `affinity` limit
+
+    :param icmdidx: The position of the `Command` object in the group
+    :type icmdidx: integer
+    :param cmd: The `Command` object which is launched
+    :type cmd: Command
+    :param limits: The limits of this launch
+    :type limits: dictionary
+    :returns: The description of the assignment for the report
+    :rtype: string
+    '''
+    self._arr_placements.pop(icmdidx, None)
+
+    if self._placement is None \
+    or 'affinity' in limits :
+      return ''
+
+    assignment = self._placement.Assign(cmd)
+
+    self._arr_placements[icmdidx] = assignment
+
+    return " - Node {} CPUs {}".format(assignment['node']\
+    , ','.join([str(icpu) for icpu in assignment['cpus']]))
 
 
   def checkiCommand(self, iindex):
@@ -262,25 +543,102 @@ class CommandGroup(object):
 
 
   def Check(self):
+    '''
+    This Method checks all `Command` objects once.
+    It waits at most `CommandGroup.read_timeout` seconds for output of any child process,
+    dispatches the output to the owning `Command` objects and records finished child processes
+
+    :returns: The count of child processes which are still running
+    :rtype: integer
+    '''
+    return self._checkCommands(self._read_timeout)
+
+
+  def _checkCommands(self, itimeout = 0):
+    '''
+    This Method waits up to `itimeout` seconds for events on the shared selector,
+    dispatches them to the `Command` objects and then checks which child processes have finished.
+    If `itimeout` is `None` it waits until any event occurs
+
+    :param itimeout: Time in seconds to wait for events
+    :type itimeout: number
+    :returns: The count of child processes which are still running
+    :rtype: integer
+    '''
     irs = 0
-    icmdcnt = len(self._arr_commands);
+    arrcmds = self._getWatchedCommands()
+    icmdcnt = len(arrcmds)
 
     if self._bdebug :
       self._arr_rpt.append("{} - go ...\n".format(sys._getframe(0).f_code.co_name))
       self._arr_rpt.append("arr cmd cnt: '{}'\n".format(icmdcnt))
 
-    if icmdcnt > 0 :
+    if icmdcnt > 0 \
+    or len(self._arr_killed) > 0 :
       cmd = None
       scmdnm = None
-      icmdidx = 0
-      bchkgo = True
 
       stmnow = None
 
-      while bchkgo \
-      and icmdidx < icmdcnt :
-        cmd = self._arr_commands[icmdidx]
+      itmdeadline = self._getNextDeadline()
+
+      if itmdeadline > -1 :
+        #Do not sleep beyond the nearest Execution Timeout
+        itmnext = max(itmdeadline - time.monotonic_ns(), 0) / 1000000000
+
+        if itimeout is None \
+        or itimeout > itmnext :
+          itimeout = itmnext
+
+      #if itmdeadline > -1
+
+      itmescalation = self._getNextEscalation()
+
+      if itmescalation > -1 :
+        #Do not sleep beyond the nearest Grace Period
+        itmnext = max(itmescalation - time.monotonic_ns(), 0) / 1000000000
+
+        if itimeout is None \
+        or itimeout > itmnext :
+          itimeout = itmnext
+
+      #if itmescalation > -1
+
+      if self._sample_interval > 0 \
+      and (itimeout is None or itimeout > self._sample_interval) :
+        #Wake up for the next Sample of the Resource Usage
+        itimeout = self._sample_interval
+
+      if (itimeout is None or itimeout > 0.05) \
+      and any(not cmd._isExitNotified() for cmd in self._arr_killed) :
+        #Killed Child Processes exit right away but without Process File Descriptor
+        #their Exit is not notified
+        itimeout = 0.05
+
+      if self._selector is not None :
+        #Watch all Child Processes at once
+        events = self._selector.select(itimeout)
+
+        if self._bdebug :
+          self._arr_rpt.append("'{}' read events\n".format(len(events)))
+
+        for key, mask in events :
+          #Dispatch the Event to the owning Command Object
+          key.data._processEvent(key, mask)
 
+      #if self._selector is not None
+
+      if itmdeadline > -1 :
+        self._expireDeadlines()
+
+      if itmescalation > -1 \
+      or len(self._arr_escalations) > 0 :
+        self._escalateCommands()
+
+      if len(self._arr_killed) > 0 :
+        self._collectKilled()
+
+      for cmd in arrcmds :
         if cmd is not None :
           scmdnm = cmd.getNameComplete()
 
@@ -288,7 +646,13 @@ class CommandGroup(object):
             self._arr_rpt.append("Sub Process {}: checking ...\n".format(scmdnm))
 
           if cmd.isRunning():
-            if cmd.Check():
+            if cmd.getSelector() is self._selector :
+              #The Output was already dispatched
+              brng = cmd._checkStatus()
+            else :  #The Child Process was not launched by the Group
+              brng = cmd.Check()
+
+            if brng :
               #Count the Running Child Processes
               irs += 1
             else :  #The Child Process has finished
@@ -298,12 +662,7 @@ class CommandGroup(object):
               .format(stmnow, scmdnm, cmd.status))
 
               #cmd.freeResources()
-            #if cmd.Check()
-
-            if self._execution_timeout > -1 :
-              if time.time() - self._start_time > self._execution_timeout :
-                #Stop the Checks on Execution Timeout
-                bchkgo = False
+            #if brng
 
           else :  #The Sub Process is already finished
             if cmd.getProcessID() > 0 :
@@ -315,27 +674,273 @@ class CommandGroup(object):
             #if cmd.getProcessID() > 0
           #if cmd.isRunning()
         #if cmd is not None
-
-        icmdidx  += 1
-
-      #while bchkgo and icmdidx < icmdcnt
+      #for cmd in arrcmds
     #if icmdcnt > 0
 
     #Count of the Running Child Processes
     return irs
 
 
+  def _pushDeadline(self, cmd):
+    '''
+    This Method adds the deadline of the running `Command` object `cmd` to the heap of deadlines
+    if it has an Execution Timeout. It is also called when the Execution Timeout is changed.
+    Earlier entries of the `Command` object become stale and are discarded
+
+    :param cmd: The launched `Command` object
+    :type cmd: Command
+    '''
+    itmdeadline = cmd.getDeadline()
+    iseq = next(self._deadline_sequence)
+
+    self._arr_deadline_generations[cmd] = iseq
+
+    if itmdeadline > -1 :
+      heapq.heappush(self._arr_deadlines, (itmdeadline, iseq, cmd))
+
+
+  def _getNextDeadline(self):
+    '''
+    This Method finds the nearest deadline of the running `Command` objects.
+    Entries of finished `Command` objects and stale entries of `Command` objects
+    with a changed Execution Timeout are discarded
+
+    :returns: The nearest deadline in nanoseconds on the `time.monotonic_ns()` clock
+      or "-1" if there is none
+    :rtype: integer
+    '''
+    while len(self._arr_deadlines) > 0 :
+      itmdeadline, iseq, cmd = self._arr_deadlines[0]
+
+      if self._arr_deadline_generations.get(cmd) == iseq :
+        if cmd.isRunning() :
+          return itmdeadline
+
+        del self._arr_deadline_generations[cmd]
+
+      #if self._arr_deadline_generations.get(cmd) == iseq
+
+      heapq.heappop(self._arr_deadlines)
+
+    #while len(self._arr_deadlines) > 0
+
+    return -1
+
+
+  def _expireDeadlines(self):
+    '''
+    This Method terminates all `Command` objects whose deadline has passed
+
+    :returns: The count of terminated `Command` objects
+    :rtype: integer
+    '''
+    irs = 0
+    itmnow = time.monotonic_ns()
+    itmdeadline = self._getNextDeadline()
+
+    while itmdeadline > -1 \
+    and itmdeadline <= itmnow :
+      cmd = heapq.heappop(self._arr_deadlines)[2]
+
+      del self._arr_deadline_generations[cmd]
+
+      self._arr_err.append("Sub Process {}: Execution timed out!\n".format(cmd.getNameComplete()))
+
+      cmd._recordTimeout()
+
+      #The Child Process is killed at the End of its Grace Period
+      self._terminateCommand(cmd)
+
+      if cmd.code > self._err_code :
+        #Keep the Child Process Error Code
+        self._err_code = cmd.code
+
+      self._itimeouts += 1
+      irs += 1
+
+      itmdeadline = self._getNextDeadline()
+
+    #while itmdeadline > -1 and itmdeadline <= itmnow
+
+    return irs
+
+
+  def _terminateCommand(self, cmd, fgraceseconds = None):
+    '''
+    This Method sends the SIGTERM signal to the running `Command` object `cmd`
+    and schedules its kill at the end of the grace period
+
+    :param cmd: The running `Command` object
+    :type cmd: Command
+    :param fgraceseconds: Time in seconds for the child process to exit.
+      By default the `Command.grace_period` is used
+    :type fgraceseconds: number
+    '''
+    if fgraceseconds is None :
+      fgraceseconds = cmd.getGracePeriod()
+
+    cmd._signalTerminate()
+
+    heapq.heappush(self._arr_escalations\
+    , (time.monotonic_ns() + int(max(fgraceseconds, 0) * 1000000000), next(self._deadline_sequence), cmd))
+
+
+  def _getNextEscalation(self):
+    '''
+    This Method finds the nearest end of a grace period of the terminated `Command` objects.
+    Entries of finished `Command` objects are discarded
+
+    :returns: The nearest end of a grace period in nanoseconds on the `time.monotonic_ns()` clock
+      or "-1" if there is none
+    :rtype: integer
+    '''
+    while len(self._arr_escalations) > 0 :
+      itmescalation, iseq, cmd = self._arr_escalations[0]
+
+      if cmd.isRunning() :
+        return itmescalation
+
+      heapq.heappop(self._arr_escalations)
+
+    #while len(self._arr_escalations) > 0
+
+    return -1
+
+
+  def _escalateCommands(self):
+    '''
+    This Method kills all terminated `Command` objects whose grace period has passed.
+    For child processes in their own session their whole process group is killed
+
+    :returns: The count of killed child processes
+    :rtype: integer
+    '''
+    irs = 0
+    itmnow = time.monotonic_ns()
+    itmescalation = self._getNextEscalation()
+
+    while itmescalation > -1 \
+    and itmescalation <= itmnow :
+      cmd = heapq.heappop(self._arr_escalations)[2]
+
+      if cmd.isRunning() :
+        #Kill the blocked Sub Process
+        cmd.Kill()
+
+        if cmd.code > self._err_code :
+          self._err_code = cmd.code
+
+        #The killed Sub Process must still be reaped
+        self._arr_killed.append(cmd)
+
+        irs += 1
+
+      itmescalation = self._getNextEscalation()
+
+    #while itmescalation > -1 and itmescalation <= itmnow
+
+    return irs
+
+
+  def _collectKilled(self):
+    '''
+    This Method reaps the killed child processes which have exited
+    and reads their remaining output
+
+    :returns: The count of killed child processes which are not reaped yet
+    :rtype: integer
+    '''
+    arrkilled = []
+
+    for cmd in self._arr_killed :
+      if cmd._collectProcess() :
+        stmnow = datetime.now().strftime('%F %T')
+
+        self._arr_rpt.append("{} : Sub Process {}: killed with [{}]\n"\
+        .format(stmnow, cmd.getNameComplete(), cmd.getProcessStatus()))
+      else :
+        arrkilled.append(cmd)
+
+    #for cmd in self._arr_killed
+
+    self._arr_killed = arrkilled
+
+    return len(arrkilled)
+
+
+  def _recordStart(self):
+    '''
+    This Method records the launch of the group. The Wall Clock Time is only kept for the Logs
+    while the Execution Timeout and the Profiling are measured on the monotonic clocks
+    '''
+    self._time_start = time.time()
+    self._itm_launch_ns = time.monotonic_ns()
+    self._itm_start_ns = time.perf_counter_ns()
+
+
+  def _recordExecutionTime(self):
+    '''
+    This Method records the end of the group for the profiling
+    '''
+    self._time_end = time.time()
+
+    if self._itm_start_ns > -1 :
+      self._itm_execution_ns = time.perf_counter_ns() - self._itm_start_ns
+      self._time_execution = self._itm_execution_ns / 1000000000
+
+    #if self._itm_start_ns > -1
+
+
+  def _getWatchedCommands(self):
+    '''
+    This Method returns the `Command` objects which are checked in each round
+
+    :returns: The list of the `Command` objects to check
+    :rtype: list
+    '''
+    return self._arr_commands
+
+
+  def _hasSilentCommands(self):
+    '''
+    This Method reports whether any running child process cannot wake up the shared selector
+    because all of its pipes are already closed and its exit is not watched
+    with a Process File Descriptor
+
+    :returns: Whether a running child process has no watched files
+    :rtype: boolean
+    '''
+    bslnt = False
+
+    for cmd in self._getWatchedCommands() :
+      if cmd.isRunning() \
+      and not cmd._hasWatchedFiles() :
+        bslnt = True
+
+    #for cmd in self._getWatchedCommands()
+
+    return bslnt
+
+
   def Wait(self, options = {}):
+    '''
+    This Method watches all child processes until they have finished.
+    It sleeps in the shared selector until any child process produces output or closes its pipes.
+    If a Check Interval is set the child processes are checked at least at this interval.
+    If an Execution Timeout is set the child processes are terminated when the time limit is reached.
+    `Command` objects with their own Execution Timeout are terminated at their deadline
+
+    :returns: Returns `True` if all child processes have finished correctly
+      and none of them timed out
+    :rtype: boolean
+    '''
     #At least check the Child Processes once
     irng = 1
     brs = False
+    itimeouts = self._itimeouts
 
-    itmchk = -1
-    itmchkstrt = -1
-    itmchkend = -1
+    itmwait = 0
     itmrng = -1
-    itmrngstrt = -1
-    itmrngend = -1
 
     if self._bdebug :
       self._arr_rpt.append("{} - go ...\n".format(sys._getframe(0).f_code.co_name))
@@ -343,45 +948,30 @@ class CommandGroup(object):
     if len(options) > 0 :
       self.setDictOptions(options)
 
-    if self._time_start < 1 :
+    if self._itm_launch_ns < 0 :
       #Set the Start Time if it is not set yet
-      self._time_start = time.time()
-
-    #As long as there are Running Child Processes
-    while irng > 0 :
-      if self._check_interval > -1 \
-      or self._execution_timeout > -1 :
-        if itmchkstrt < 1 :
-          #Take the Time measured at Launch Time
-          itmchkstrt = self._time_start
-        else :  #It is not the first Check
-          itmchkstrt = time.time()
-
-        if self._execution_timeout > -1 :
-          if itmrngstrt < 1 :
-            itmrng = 0
-            itmrngstrt = itmchkstrt
-
-        #if self._execution_timeout > -1
-      #if self._check_interval > -1 or self._execution_timeout > -1
+      self._recordStart()
 
+    #As long as there are Running or unreaped Child Processes
+    while irng > 0 \
+    or len(self._arr_killed) > 0 :
       #Check the Child Processes
-      irng = self.Check()
+      irng = self._checkCommands(itmwait)
 
       if irng > 0 :
-        if self._check_interval > -1 \
-        or self._execution_timeout > -1 :
-          itmchkend = time.time()
-          itmrngend = itmchkend
+        #Sleep until the next Event by default
+        itmwait = None
 
-          itmchk = itmchkend - itmchkstrt
-          itmrng = itmrngend - itmrngstrt
+        if self._check_interval > -1 :
+          itmwait = self._check_interval
+
+        if self._execution_timeout > -1 :
+          itmrng = (time.monotonic_ns() - self._itm_launch_ns) / 1000000000
 
           if self._bdebug :
-            self._arr_rpt.append("wait - tm rng: '{}'; tm chk: '{}'\n".format(itmrng, itmchk))
+            self._arr_rpt.append("wait - tm rng: '{}'\n".format(itmrng))
 
-          if self._execution_timeout > -1 \
-          and itmrng >= self._execution_timeout :
+          if itmrng >= self._execution_timeout :
             self._arr_err.append("Sub Processes 'Count: {}': Execution timed out!\n".format(irng))
             self._arr_err.append("Execution Time '{} / {}'\nProcesses will be terminated.\n"\
             .format(itmrng, self._execution_timeout))
@@ -389,24 +979,37 @@ class CommandGroup(object):
             if self._err_code < 4 :
               self._err_code = 4
 
-            self.Terminate()
+            self.Shutdown()
             irng = -1
-          #if self._execution_timeout > -1 and itmrng >= self._execution_timeout
+          else :  #Do not sleep beyond the Execution Timeout
+            if itmwait is None \
+            or itmwait > self._execution_timeout - itmrng :
+              itmwait = self._execution_timeout - itmrng
 
-          if irng > 0 \
-          and itmchk < self._check_interval :
-            if self._bdebug :
-              self._arr_rpt.append("wait - sleep '{}' s ...\n".format(self._check_interval - itmchk))
+          #if itmrng >= self._execution_timeout
+        #if self._execution_timeout > -1
 
-            time.sleep(self._check_interval - itmchk)
+        if irng > 0 \
+        and self._hasSilentCommands() :
+          #Running Child Processes without watched Files cannot wake up the Selector
+          #so their Exit must be polled within a short Interval
+          if itmwait is None \
+          or itmwait > 0.05 :
+            itmwait = 0.05
+
+        if self._bdebug \
+        and irng > 0 :
+          self._arr_rpt.append("wait - sleep '{}' s ...\n".format(itmwait))
 
-        #if self._check_interval > -1 or self._execution_timeout > -1
       #if irng > 0
-    #while irng > 1
+    #while irng > 0
+
+    if self._bprofiling :
+      self._recordExecutionTime()
 
     if irng == 0 :
-      #Mark as Finished correctly
-      brs = True
+      #Mark as Finished correctly unless a Child Process timed out
+      brs = self._itimeouts == itimeouts
     elif irng < 0 :
       #Mark as Failed if the Sub Process was Terminated
       brs = False
@@ -431,6 +1034,77 @@ class CommandGroup(object):
     return brs
 
 
+  def Shutdown(self, fgraceseconds = None):
+    '''
+    This Method shuts down all running child processes of the group at once.
+    All of them receive the SIGTERM signal first. Their exits are awaited in the shared selector
+    and the child processes which are still running at the end of the grace period
+    are killed with the SIGKILL signal. Finally all child processes are reaped
+    and the remaining output in their pipes is read.
+    Queued `Command` objects are not launched during the shutdown
+
+    :param fgraceseconds: Time in seconds for the child processes to exit.
+      By default the `Command.grace_period` of each `Command` object is used
+    :type fgraceseconds: number
+    :returns: Returns `True` if all child processes have been reaped
+    :rtype: boolean
+    '''
+    irng = 0
+    itmreap = -1
+
+    if self._bdebug :
+      self._arr_rpt.append("'{}' : Signal to '{}'\n"\
+      .format(sys._getframe(1).f_code.co_name, sys._getframe(0).f_code.co_name))
+
+    self._arr_err.append("Sub Processes: Processes shutting down ...\n")
+
+    self._bshutdown = True
+
+    try :
+      for cmd in self._getWatchedCommands() :
+        if cmd is not None \
+        and cmd.isRunning() :
+          self._terminateCommand(cmd, fgraceseconds)
+
+      #for cmd in self._getWatchedCommands()
+
+      irng = self._checkCommands(0)
+
+      while irng > 0 \
+      or len(self._arr_killed) > 0 :
+        itmwait = None
+
+        if self._getNextEscalation() == -1 :
+          #All remaining Child Processes were killed
+          if itmreap < 0 :
+            itmreap = time.monotonic_ns() + 1000000000
+          elif time.monotonic_ns() >= itmreap :
+            #The Child Processes cannot be reaped
+            break
+
+          itmwait = max(itmreap - time.monotonic_ns(), 0) / 1000000000
+
+        #if self._getNextEscalation() == -1
+
+        if self._hasSilentCommands() \
+        and (itmwait is None or itmwait > 0.05) :
+          #The Exit must be polled within a short Interval
+          itmwait = 0.05
+
+        irng = self._checkCommands(itmwait)
+
+      #while irng > 0
+    finally :
+      self._bshutdown = False
+
+    irng += len(self._arr_killed)
+
+    if irng > 0 :
+      self._arr_err.append("Sub Processes 'Count: {}': Processes could not be reaped!\n".format(irng))
+
+    return irng == 0
+
+
   def Terminate(self):
     if self._bdebug :
       self._arr_rpt.append("'{}' : Signal to '{}'\n"\
@@ -470,8 +1144,29 @@ class CommandGroup(object):
       #Free all Child Processes System Resources
       cmd.freeResources()
 
+      if cmd.getDeadlineHandler() == self._pushDeadline :
+        cmd.setDeadlineHandler(None)
+
     #for cmd in self._arr_commands
 
+    if self._selector is not None :
+      for cmd in self._arr_commands :
+        if cmd.getSelector() is self._selector :
+          #Release the shared Selector
+          cmd.setSelector(None)
+
+      #for cmd in self._arr_commands
+
+      self._selector.close()
+      self._selector = None
+
+    #if self._selector is not None
+
+    self._arr_deadlines = []
+    self._arr_deadline_generations = {}
+    self._arr_escalations = []
+    self._arr_killed = []
+
 
   def clearErrors(self):
     if self._bdebug :
@@ -486,15 +1181,25 @@ class CommandGroup(object):
 
     self._arr_rpt = []
     self._arr_err = []
-    self._sreport = None
-    self._serror = None
+    self._sreport = ''
+    self._serror = ''
+    self._irpt_joined = 0
+    self._ierr_joined = 0
     self._err_code = 0
+    self._itimeouts = 0
+    self._arr_placements = {}
+
+    if self._placement is not None :
+      self._placement.Reset()
 
     self._time_start = -1
+    self._itm_launch_ns = -1
 
     if self._bprofiling :
       self._time_execution = -1
       self._time_end = -1
+      self._itm_start_ns = -1
+      self._itm_execution_ns = -1
 
     if self._bdebug :
       #Readd last Debug Message
@@ -522,10 +1227,36 @@ class CommandGroup(object):
     return rscmd
 
 
+  def getiPlacement(self, iindex):
+    '''
+    This Method returns the CPU cores the child process of the `Command` object
+    at the position `iindex` was pinned to by the placement policy
+
+    :param iindex: The position of the `Command` object in the group
+    :type iindex: integer
+    :returns: The assignment with the keys `node` and `cpus` or `None` if it was not placed
+    :rtype: dictionary
+    '''
+    try :
+      assignment = self._arr_placements.get(int(iindex))
+    except :
+      #Index must be a positive whole Number
+      assignment = None
+
+    if assignment is not None :
+      return dict(assignment)
+
+    return None
+
+
   def getCheckInterval(self):
     return self._check_interval
 
 
+  def getLauncher(self):
+    return self._slauncher
+
+
   def getReadTimeout(self):
     return self._read_timeout
 
@@ -534,6 +1265,17 @@ class CommandGroup(object):
     return self._execution_timeout
 
 
+  def getTimeoutCount(self):
+    '''
+    CommandGroup.timeouts Property which holds the count of `Command` objects
+    which were terminated at their own Execution Timeout
+
+    :returns: The count of timed out `Command` objects
+    :rtype: integer
+    '''
+    return self._itimeouts
+
+
   def getCommandCount(self):
     return len(self._arr_commands)
 
@@ -577,15 +1319,31 @@ class CommandGroup(object):
 
 
   def getReportString(self):
-    if self._sreport is None :
-      self._sreport = ''.join(self._arr_rpt)
+    '''
+    CommandGroup.report Property which represents all Report Messages of the group.
+    Only Messages added since the last request are joined
+
+    :returns: All Report Messages as single String joined seamlessly
+    :rtype: string
+    '''
+    if self._irpt_joined < len(self._arr_rpt) :
+      self._sreport += ''.join(self._arr_rpt[self._irpt_joined:])
+      self._irpt_joined = len(self._arr_rpt)
 
     return self._sreport
 
 
   def getErrorString(self):
-    if self._serror is None :
-      self._serror = ''.join(self._arr_err)
+    '''
+    CommandGroup.error Property which represents all Error Messages of the group.
+    Only Messages added since the last request are joined
+
+    :returns: All Error Messages as single String joined seamlessly
+    :rtype: string
+    '''
+    if self._ierr_joined < len(self._arr_err) :
+      self._serror += ''.join(self._arr_err[self._ierr_joined:])
+      self._ierr_joined = len(self._arr_err)
 
     return self._serror
 
@@ -594,6 +1352,91 @@ class CommandGroup(object):
     return self._err_code
 
 
+  def getExecutionTime(self):
+    '''
+    CommandGroup.execution_time Property which holds the time in seconds from the launch
+    of the group until all child processes have finished when the Profiling is enabled.
+    It is "-1" if it was not measured
+
+    :returns: The Execution Time in seconds
+    :rtype: float
+    '''
+    return self._time_execution
+
+
+  def getResourceUsage(self):
+    '''
+    CommandGroup.resource_usage Property which holds the resource usage of all `Command` objects
+    of the group. CPU times, page faults, context switches and I/O bytes are summed up
+    while `maxrss`, `cpu_peak` and `rss_peak` are the maximum of a single child process
+
+    :returns: The aggregated resource usage as key - value pairs
+    :rtype: dictionary
+
+    :see: `Command.resource_usage`
+    '''
+    return aggregateUsage([cmd.getResourceUsage() for cmd in self._arr_commands])
+
+
+  def getSampleInterval(self):
+    return self._sample_interval
+
+
+  def getLimits(self):
+    return dict(self._limits)
+
+
+  def isNewSession(self):
+    return self._bnew_session
+
+
+  def getGracePeriod(self):
+    return self._grace_period
+
+
+  def getPlacement(self):
+    '''
+    CommandGroup.placement Property which holds the `CorePlacement` object of the group
+
+    :returns: The placement policy or `None` if the child processes are not placed
+    :rtype: CorePlacement
+    '''
+    return self._placement
+
+
+  def getExecutionTimeNs(self):
+    '''
+    CommandGroup.execution_time_ns Property which holds the Execution Time of the group
+    in nanoseconds when the Profiling is enabled
+
+    :returns: The Execution Time in nanoseconds
+    :rtype: integer
+    '''
+    return self._itm_execution_ns
+
+
+  def getStartTime(self):
+    '''
+    CommandGroup.start_time Property which holds the Wall Clock Time of the launch
+    as Unix Timestamp. It is only meant for the Logs
+
+    :returns: The Launch Time as Unix Timestamp
+    :rtype: float
+    '''
+    return self._time_start
+
+
+  def getEndTime(self):
+    '''
+    CommandGroup.end_time Property which holds the Wall Clock Time at which all child processes
+    had finished as Unix Timestamp when the Profiling is enabled
+
+    :returns: The End Time as Unix Timestamp
+    :rtype: float
+    '''
+    return self._time_end
+
+
   def isProfiling(self):
     return self._bprofiling
 
@@ -615,9 +1458,20 @@ class CommandGroup(object):
   free = property(getFreeCount)
   finished = property(getFinishedCount)
   len = property(getCommandCount)
+  launcher = property(getLauncher, setLauncher)
   read_timeout = property(getReadTimeout, setReadTimeout)
   timeout = property(getTimeout, setTimeout)
-  #execution_time = property(getExecutionTime)
+  timeouts = property(getTimeoutCount)
+  execution_time = property(getExecutionTime)
+  execution_time_ns = property(getExecutionTimeNs)
+  resource_usage = property(getResourceUsage)
+  sample_interval = property(getSampleInterval, setSampleInterval)
+  limits = property(getLimits, setLimits)
+  placement = property(getPlacement, setPlacement)
+  new_session = property(isNewSession, setNewSession)
+  grace_period = property(getGracePeriod, setGracePeriod)
+  start_time = property(getStartTime)
+  end_time = property(getEndTime)
   profiling = property(isProfiling, setProfiling)
   debug = property(isDebug, setDebug)
   report = property(getReportString)
@@ -0,0 +1,301 @@
+'''
+This Module provides the `CommandPool` Class which runs a queue of `Command` objects
+with a limited number of concurrent child processes.
+
+:version: 2026-10-18
+
+:author: Bodo Hugo Barwich
+'''
+__docformat__ = "restructuredtext en"
+
+import sys
+import os
+import selectors
+import time
+from collections import deque
+
+from .commandgroup import CommandGroup
+
+
+
+#==============================================================================
+# The CommandPool Class
+
+
+class CommandPool(CommandGroup):
+  '''
+  This is a Class to run any number of `Command` objects with at most `CommandPool.workers`
+  child processes running at the same time.
+
+  The added `Command` objects are queued and launched in the order they were added.
+  When a child process finishes the next queued `Command` object is launched
+  within the same check round, so the pool is refilled as soon as the exit is notified
+
+  It offers Methods to run, monitor and access the `Command` objects like the `CommandGroup` Class
+  and counters for the throughput of the pool
+  '''
+
+
+
+  #----------------------------------------------------------------------------
+  #Constructors
+
+  def __init__(self, options = {}):
+    '''
+    A `CommandPool` Object can be instantiated with a set of initial options `options`
+
+    :param options: Additional options for the execution as key - value pairs
+    :type options: dictionary
+
+    :see: `CommandPool.setDictOptions`
+    '''
+    self._max_workers = os.cpu_count() or 1
+    self._queue = deque()
+    self._arr_running = []
+    self._ilaunched = 0
+    self._ifailed = 0
+    self._icompleted = 0
+
+    super().__init__(options)
+
+
+
+  #----------------------------------------------------------------------------
+  #Administration Methods
+
+
+  def setDictOptions(self, options = {}):
+    '''
+    This Method configures the `CommandPool` object from a dictionary in the parameter `options`.
+    Additionally to the options of the `CommandGroup` Class the recognized keys are:
+    * `workers` - maximal number of concurrently running child processes
+
+    :param options: Additional options for the execution as key - value pairs
+    :type options: dictionary
+    '''
+    super().setDictOptions(options)
+
+    if 'workers' in options :
+      self.setMaxWorkers(options['workers'])
+
+
+  def setMaxWorkers(self, imaxworkers = 1):
+    try :
+      self._max_workers = int(imaxworkers)
+    except :
+      #The Parameter is not a Number
+      self._max_workers = 1
+
+    if self._max_workers < 1 :
+      #At least one Child Process must run
+      self._max_workers = 1
+
+
+  def Add(self, ocommand = None):
+    '''
+    This Method adds a `Command` object to the queue of the pool.
+    If `ocommand` is not a `Command` object a new `Command` object is created
+
+    :param ocommand: The `Command` object to run in the pool
+    :type ocommand: Command
+    :returns: The queued `Command` object
+    :rtype: Command
+    '''
+    ors = super().Add(ocommand)
+
+    #Queue the Command Object with its Position
+    self._queue.append((len(self._arr_commands) - 1, ors))
+
+    return ors
+
+
+  def addsCommandLine(self, scommandline = '', options = {}):
+    '''
+    This Method creates a `Command` object for `scommandline` and adds it to the queue of the pool
+
+    :param scommandline: The commmand and its parameters to be executed in the child process
+    :type scommandline: string
+    :param options: Additional options for the execution as key - value pairs
+    :type options: dictionary
+    :returns: The queued `Command` object
+    :rtype: Command
+    '''
+    ors = super().addsCommandLine(scommandline, options)
+
+    #Queue the Command Object with its Position
+    self._queue.append((len(self._arr_commands) - 1, ors))
+
+    return ors
+
+
+  def Launch(self):
+    '''
+    This Method launches the first queued `Command` objects up to the maximal number of workers
+
+    :returns: The count of launched child processes
+    :rtype: integer
+    '''
+    if self._bdebug :
+      self._arr_rpt.append("{} - go ...\n".format(sys._getframe(0).f_code.co_name))
+      self._arr_rpt.append("arr cmd cnt: '{}'\n".format(len(self._queue)))
+
+    if self._selector is None :
+      #Create the Pipe IO Selector shared by all Child Processes
+      self._selector = selectors.DefaultSelector()
+
+    #Keep track of the Start Time
+    self._recordStart()
+
+    return self._launchQueued()
+
+
+  def _launchQueued(self):
+    '''
+    This Method launches queued `Command` objects until all worker slots are occupied
+    or the queue is empty
+
+    :returns: The count of launched child processes
+    :rtype: integer
+    '''
+    irs = 0
+
+    while len(self._arr_running) < self._max_workers \
+    and len(self._queue) > 0 :
+      icmdidx, cmd = self._queue.popleft()
+
+      if self._launchCommand(icmdidx, cmd) :
+        self._arr_running.append(cmd)
+        self._ilaunched += 1
+
+        irs += 1
+      else :  #Sub Process Launch failed
+        self._ifailed += 1
+
+    #while len(self._arr_running) < self._max_workers and len(self._queue) > 0
+
+    return irs
+
+
+  def _checkCommands(self, itimeout = 0):
+    '''
+    This Method checks the running `Command` objects like `CommandGroup._checkCommands()`
+    and launches queued `Command` objects into the slots of finished child processes
+
+    :param itimeout: Time in seconds to wait for events
+    :type itimeout: number
+    :returns: The count of child processes which are still running
+    :rtype: integer
+    '''
+    irs = super()._checkCommands(itimeout)
+
+    if irs < len(self._arr_running) :
+      #Release the Slots of the finished Child Processes
+      icnt = len(self._arr_running)
+
+      self._arr_running = [cmd for cmd in self._arr_running if cmd.isRunning()]
+
+      self._icompleted += icnt - len(self._arr_running)
+
+    #if irs < len(self._arr_running)
+
+    if len(self._queue) > 0 \
+    and not self._bshutdown :
+      irs += self._launchQueued()
+
+    return irs
+
+
+  def _getWatchedCommands(self):
+    #Only the running Child Processes need to be checked
+    return self._arr_running
+
+
+  def clearErrors(self):
+    super().clearErrors()
+
+    self._ilaunched = 0
+    self._ifailed = 0
+    self._icompleted = 0
+
+
+
+  #----------------------------------------------------------------------------
+  #Consultation Methods
+
+
+  def getMaxWorkers(self):
+    return self._max_workers
+
+
+  def getQueuedCount(self):
+    '''
+    CommandPool.queued Property which holds the count of `Command` objects waiting for a free slot
+
+    :returns: The count of queued `Command` objects
+    :rtype: integer
+    '''
+    return len(self._queue)
+
+
+  def getLaunchedCount(self):
+    '''
+    CommandPool.launched Property which holds the count of successfully launched child processes
+
+    :returns: The count of launched child processes
+    :rtype: integer
+    '''
+    return self._ilaunched
+
+
+  def getFailedCount(self):
+    '''
+    CommandPool.failed Property which holds the count of child processes which could not be launched
+
+    :returns: The count of failed launches
+    :rtype: integer
+    '''
+    return self._ifailed
+
+
+  def getCompletedCount(self):
+    '''
+    CommandPool.completed Property which holds the count of child processes which have finished
+
+    :returns: The count of finished child processes
+    :rtype: integer
+    '''
+    return self._icompleted
+
+
+  def getThroughput(self):
+    '''
+    CommandPool.throughput Property which represents the count of finished child processes
+    per second since the launch of the pool
+
+    :returns: The finished child processes per second
+    :rtype: float
+    '''
+    fthroughput = 0.0
+
+    if self._itm_launch_ns > 0 :
+      itmrng = time.monotonic_ns() - self._itm_launch_ns
+
+      if itmrng > 0 :
+        fthroughput = self._icompleted * 1000000000 / itmrng
+
+    #if self._itm_launch_ns > 0
+
+    return fthroughput
+
+
+
+  #-----------------------------------------------------------------------------------------
+  #Properties
+
+
+  workers = property(getMaxWorkers, setMaxWorkers)
+  queued = property(getQueuedCount)
+  launched = property(getLaunchedCount)
+  failed = property(getFailedCount)
+  completed = property(getCompletedCount)
+  throughput = property(getThroughput)
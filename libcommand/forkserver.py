@@ -0,0 +1,1037 @@
+'''
+This Module provides the `ForkServer` Class which launches child processes
+through a small long-lived helper process.
+
+The helper process is a fresh Python interpreter which only loads this Module,
+so creating a child process from it does not depend on the memory size of the supervisor process.
+The pipes of the child processes are created by the supervisor process and passed
+to the helper process over a Unix socket with `SCM_RIGHTS`.
+
+The helper process can also run Python entry points in forked copies of itself.
+Modules which it imports in advance are already loaded in these child processes,
+so they do not pay for the startup of the interpreter and the imports.
+
+Child processes with limits are forked and wait until the helper process has applied the limits,
+so the limits are in place before the command or the entry point starts.
+
+When this Module is run as script it serves the requests on the socket
+with the file descriptor number given as first argument.
+The optional second argument is a JSON object with the `preload` modules and the module `path`.
+
+:version: 2026-10-18
+
+:author: Bodo Hugo Barwich
+'''
+__docformat__ = "restructuredtext en"
+
+import sys
+import os
+import errno
+import signal
+import socket
+import selectors
+import select
+import subprocess
+import json
+import atexit
+import time
+import resource
+import runpy
+import gc
+import importlib
+import traceback
+
+try :
+  from .limits import applyLimits
+except ImportError :
+  #This Module runs as Script and loads the Limits on Demand
+  applyLimits = None
+
+
+
+#==============================================================================
+# The ForkServer Class
+
+
+class ForkServer(object):
+  '''
+  This is a Class which runs the helper process and sends the launch requests to it.
+
+  The child processes are children of the helper process which reaps them
+  and reports their Exit Codes and resource usage back over the socket.
+  The child processes are started with the current environment
+  and in the current working directory of the supervisor process.
+
+  The modules in `ForkServer.preload` are imported by the helper process at its launch
+  with the module search path of the supervisor process
+  '''
+
+
+
+  #----------------------------------------------------------------------------
+  #Constructors
+
+
+  def __init__(self, arrpreload = None):
+    '''
+    A `ForkServer` Object can be instantiated with a list of modules `arrpreload`
+    which the helper process imports in advance
+
+    :param arrpreload: The names of the modules to import in the helper process
+    :type arrpreload: list
+    '''
+    self._process = None
+    self._socket = None
+    self._arr_statuses = {}
+    self._arr_usages = {}
+    self._arr_preload = []
+
+    if arrpreload is not None :
+      self._arr_preload = [str(smodule) for smodule in arrpreload]
+
+
+  def __del__(self):
+    self.Stop()
+
+
+
+  #----------------------------------------------------------------------------
+  #Administration Methods
+
+
+  def Launch(self):
+    '''
+    This Method launches the helper process if it is not running yet.
+    It is not launched where the `ForkServer` is not supported
+
+    :returns: Returns `True` if the helper process is running
+    :rtype: boolean
+
+    :see: `isForkServerSupported()`
+    '''
+    if self._process is None \
+    and isForkServerSupported() :
+      sockserver, self._socket = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+
+      arrargs = [sys.executable, '-I', os.path.abspath(__file__), str(sockserver.fileno())]
+
+      if len(self._arr_preload) > 0 :
+        arrargs.append(json.dumps({'preload': self._arr_preload, 'path': sys.path}))
+
+      try :
+        self._process = subprocess.Popen(arrargs, stdin = subprocess.DEVNULL\
+        , pass_fds = (sockserver.fileno(),))
+      except OSError :
+        self._socket.close()
+        self._socket = None
+        self._process = None
+      finally :
+        #Only the Helper Process keeps its End of the Socket
+        sockserver.close()
+
+    #if self._process is None
+
+    return self._process is not None
+
+
+  def Stop(self):
+    '''
+    This Method stops the helper process. Running child processes are not affected
+    but their Exit Codes cannot be received any more
+    '''
+    if self._socket is not None :
+      #The Helper Process exits at the End of the Requests
+      self._socket.close()
+      self._socket = None
+
+    if self._process is not None :
+      try :
+        self._process.wait(1)
+      except subprocess.TimeoutExpired :
+        self._process.kill()
+        self._process.wait()
+
+      self._process = None
+
+    #if self._process is not None
+
+
+  def Spawn(self, arrargs, bufsize = -1, stdin = None, stdout = None, stderr = None, bsession = False\
+  , limits = None):
+    '''
+    This Method launches the command `arrargs` through the helper process.
+    The arguments `stdin`, `stdout` and `stderr` are interpreted like in `subprocess.Popen`:
+    `None` inherits the file descriptor of the helper process, `subprocess.PIPE` creates a pipe
+    and a file descriptor or a file object is passed on to the child process.
+    With `limits` the child process is forked and the limits are applied before the command starts.
+    The limits which could not be applied are listed in `ForkServerProcess.limit_errors`
+
+    :param arrargs: The executable and its arguments
+    :type arrargs: list
+    :param bufsize: The buffer size of the pipe file objects
+    :type bufsize: integer
+    :param bsession: Whether the child process is launched in its own session
+      like with `start_new_session` of `subprocess.Popen`
+    :type bsession: boolean
+    :param limits: The limits as key - value pairs
+    :type limits: dictionary
+    :returns: The launched child process
+    :rtype: ForkServerProcess
+    :raises OSError: If the child process could not be launched
+
+    :see: `limits.applyLimits()`
+    '''
+    return self._sendRequest({'type': 'spawn', 'args': list(arrargs), 'session': bool(bsession)\
+    , 'limits': limits or {}}, arrargs\
+    , bufsize, stdin, stdout, stderr)
+
+
+  def SpawnPython(self, sentrypoint, arrargs = [], bufsize = -1, stdin = None, stdout = None, stderr = None\
+  , bsession = False, limits = None):
+    '''
+    This Method runs the Python entry point `sentrypoint` in a forked copy of the helper process.
+    The entry point is either the path of a Python script, the name of a module which is run
+    like with `python -m` or a callable in the format `module:function` which is called
+    without arguments like a console script.
+    `sys.argv` holds the entry point and the arguments `arrargs`.
+    The Exit Code is taken from `SystemExit` or from the return value of the callable.
+    Uncaught exceptions are printed to STDERR and give the Exit Code "1"
+
+    :param sentrypoint: The script, module or callable to run
+    :type sentrypoint: string
+    :param arrargs: The arguments of the entry point
+    :type arrargs: list
+    :param bsession: Whether the child process is launched in its own session
+    :type bsession: boolean
+    :param limits: The limits as key - value pairs
+    :type limits: dictionary
+    :returns: The launched child process
+    :rtype: ForkServerProcess
+    :raises OSError: If the child process could not be launched
+
+    :see: `ForkServer.Spawn`
+    '''
+    arrcmd = [sentrypoint] + list(arrargs)
+
+    return self._sendRequest({'type': 'python', 'args': arrcmd, 'path': sys.path\
+    , 'session': bool(bsession), 'limits': limits or {}}, arrcmd\
+    , bufsize, stdin, stdout, stderr)
+
+
+  def Signal(self, ipid, isignal, bgroup = False):
+    '''
+    This Method lets the helper process send the signal `isignal` to its child process `ipid`.
+    The helper process only signals child processes which it has not reaped yet,
+    so a reused Process ID is never signalled
+
+    :param ipid: The process ID of the child process
+    :type ipid: integer
+    :param isignal: The signal number
+    :type isignal: integer
+    :param bgroup: Whether the whole process group of a child process in its own session is signalled
+    :type bgroup: boolean
+    '''
+    if self._socket is not None :
+      self._socket.send(json.dumps({'type': 'signal', 'pid': ipid, 'signal': int(isignal)\
+      , 'group': bool(bgroup)}).encode())
+
+    #if self._socket is not None
+
+
+  def _sendRequest(self, request, arrargs, bufsize, stdin, stdout, stderr):
+    '''
+    This Method passes the standard file descriptors for the child process with the launch `request`
+    to the helper process and creates the `ForkServerProcess` object from its reply
+
+    :raises OSError: If the child process could not be launched
+    '''
+    if not isForkServerSupported() :
+      raise OSError(errno.ENOSYS, 'The Fork Server requires Python 3.9 or newer')
+
+    if not self.Launch() :
+      raise OSError(errno.EAGAIN, 'Fork Server could not be launched')
+
+    arrfds = []
+    arrtargets = []
+    arrchildfds = []
+    arrpipes = [None, None, None]
+
+    try :
+      for itarget, target in enumerate((stdin, stdout, stderr)) :
+        if target is None :
+          continue
+
+        if target == subprocess.PIPE :
+          ifdread, ifdwrite = os.pipe()
+
+          if itarget == 0 :
+            arrpipes[itarget] = open(ifdwrite, 'wb', buffering = bufsize)
+            ifdchild = ifdread
+          else :
+            arrpipes[itarget] = open(ifdread, 'rb', buffering = bufsize)
+            ifdchild = ifdwrite
+
+          arrchildfds.append(ifdchild)
+        elif isinstance(target, int) :
+          ifdchild = target
+        else :  #The Target is a File Object
+          ifdchild = target.fileno()
+
+        arrfds.append(ifdchild)
+        arrtargets.append(itarget)
+
+      #for itarget, target in enumerate((stdin, stdout, stderr))
+
+      request['fds'] = arrtargets
+      request['cwd'] = os.getcwd()
+      request['env'] = dict(os.environ)
+
+      #Sets of CPU Numbers are sent as Lists
+      socket.send_fds(self._socket, [json.dumps(request, default = list).encode()], arrfds)
+
+      reply = self._readReply()
+    except :
+      for pp in arrpipes :
+        if pp is not None :
+          pp.close()
+
+      raise
+    finally :
+      #Only the Child Process keeps its Ends of the Pipes
+      for ifd in arrchildfds :
+        os.close(ifd)
+
+    if reply['type'] != 'spawned' :
+      for pp in arrpipes :
+        if pp is not None :
+          pp.close()
+
+      raise OSError(reply['errno'], reply['message'], arrargs[0])
+
+    process = ForkServerProcess(self, arrargs, reply['pid'], *arrpipes)
+
+    process.limit_errors = reply.get('errors', [])
+
+    return process
+
+
+  def _receive(self, itimeout = None):
+    '''
+    This Method receives one message from the helper process.
+    If `itimeout` is `None` it waits until a message arrives
+
+    :returns: The message, `None` if no message arrived in time
+      or an empty dictionary if the helper process has exited
+    :rtype: dictionary
+    '''
+    if self._socket is None :
+      return {}
+
+    if itimeout is not None :
+      arrready = select.select([self._socket], [], [], itimeout)[0]
+
+      if len(arrready) == 0 :
+        return None
+
+    #if itimeout is not None
+
+    data = self._socket.recv(1048576)
+
+    if data == b'' :
+      #The Helper Process has exited
+      self._socket.close()
+      self._socket = None
+
+      return {}
+
+    return json.loads(data)
+
+
+  def _readReply(self):
+    '''
+    This Method waits for the reply to a launch request.
+    Exit notifications which arrive in between are recorded
+    '''
+    message = self._receive()
+
+    while message.get('type') == 'exited' :
+      self._recordExit(message)
+
+      message = self._receive()
+
+    if len(message) == 0 :
+      raise OSError(errno.EPIPE, 'Fork Server has exited')
+
+    return message
+
+
+  def readStatus(self, ipid, itimeout = 0):
+    '''
+    This Method waits up to `itimeout` seconds for the exit of the child process `ipid`.
+    If `itimeout` is `None` it waits until the child process exits
+
+    :returns: The Exit Code of the child process or `None` if it is still running
+    :rtype: integer
+    '''
+    itmend = None
+
+    if itimeout is not None :
+      itmend = time.monotonic() + itimeout
+
+    while ipid not in self._arr_statuses :
+      itmwait = None
+
+      if itmend is not None :
+        itmwait = max(itmend - time.monotonic(), 0)
+
+      message = self._receive(itmwait)
+
+      if message is None :
+        #No Exit within the Timeout
+        return None
+
+      if len(message) == 0 :
+        #The Helper Process has exited and the Exit Code is lost
+        if self._isAlive(ipid) :
+          if itmend is not None \
+          and time.monotonic() >= itmend :
+            return None
+
+          time.sleep(0.05)
+
+          continue
+
+        #if self._isAlive(ipid)
+
+        self._arr_statuses[ipid] = 255
+
+      elif message.get('type') == 'exited' :
+        self._recordExit(message)
+
+    #while ipid not in self._arr_statuses
+
+    return self._arr_statuses.pop(ipid)
+
+
+  def _recordExit(self, message):
+    '''
+    This Method records the Exit Code and the resource usage of an exit notification
+    '''
+    self._arr_statuses[message['pid']] = message['status']
+
+    if message.get('rusage') is not None :
+      self._arr_usages[message['pid']] = message['rusage']
+
+
+  def readUsage(self, ipid):
+    '''
+    This Method returns the resource usage of the finished child process `ipid`
+    as reported by `os.wait4()` in the helper process. It can only be read once
+
+    :returns: The resource usage or `None` if it is not known
+    :rtype: resource.struct_rusage
+    '''
+    arrusage = self._arr_usages.pop(ipid, None)
+
+    if arrusage is not None :
+      return resource.struct_rusage(arrusage)
+
+    return None
+
+
+  def _isAlive(self, ipid):
+    try :
+      os.kill(ipid, 0)
+    except ProcessLookupError :
+      return False
+    except PermissionError :
+      #The Process ID was reused
+      return False
+
+    return True
+
+
+
+  #----------------------------------------------------------------------------
+  #Consultation Methods
+
+
+  def getPreload(self):
+    return list(self._arr_preload)
+
+
+  def isRunning(self):
+    return self._process is not None \
+    and self._socket is not None
+
+  def getProcessID(self):
+    pid = -1
+
+    if self._process is not None :
+      pid = self._process.pid
+
+    return pid
+
+
+
+  #-----------------------------------------------------------------------------------------
+  #Properties
+
+
+  preload = property(getPreload)
+  running = property(isRunning)
+  pid = property(getProcessID)
+
+
+
+#==============================================================================
+# The ForkServerProcess Class
+
+
+class ForkServerProcess(object):
+  '''
+  This is a Class which represents a child process launched by a `ForkServer`.
+  It offers the Attributes and Methods of `subprocess.Popen` which are used by the `Command` Class
+  '''
+
+
+  def __init__(self, forkserver, arrargs, ipid, stdin = None, stdout = None, stderr = None):
+    self._forkserver = forkserver
+    self.args = arrargs
+    self.pid = ipid
+    self.stdin = stdin
+    self.stdout = stdout
+    self.stderr = stderr
+    self.returncode = None
+    self.rusage = None
+    self.limit_errors = []
+
+
+  def poll(self):
+    if self.returncode is None :
+      self._setStatus(self._forkserver.readStatus(self.pid, 0))
+
+    return self.returncode
+
+
+  def wait(self, timeout = None):
+    if self.returncode is None :
+      self._setStatus(self._forkserver.readStatus(self.pid, timeout))
+
+      if self.returncode is None :
+        raise subprocess.TimeoutExpired(self.args, timeout)
+
+    #if self.returncode is None
+
+    return self.returncode
+
+
+  def _setStatus(self, istatus):
+    self.returncode = istatus
+
+    if self.returncode is not None :
+      #The Helper Process reaps its Children with os.wait4()
+      self.rusage = self._forkserver.readUsage(self.pid)
+
+
+  def send_signal(self, sig, bgroup = False):
+    #The Helper Process does not signal a Process ID which might be reused
+    if self.poll() is None :
+      self._forkserver.Signal(self.pid, sig, bgroup)
+
+
+  def terminate(self):
+    self.send_signal(signal.SIGTERM)
+
+
+  def kill(self):
+    self.send_signal(signal.SIGKILL)
+
+
+
+#==============================================================================
+# Module Functions
+
+
+_forkserver = None
+
+
+def decodeWaitStatus(istatus):
+  '''
+  This Function converts the wait status of a reaped child process into its Exit Code
+  like `subprocess.Popen.returncode`. It replaces `os.waitstatus_to_exitcode()`
+  which only exists since Python 3.9
+
+  :param istatus: The wait status reported by `os.wait4()` or `os.waitpid()`
+  :type istatus: integer
+  :returns: The Exit Code or the negative signal number if the child process was killed by a signal
+  :rtype: integer
+  '''
+  if os.WIFSIGNALED(istatus) :
+    return -os.WTERMSIG(istatus)
+
+  if os.WIFEXITED(istatus) :
+    return os.WEXITSTATUS(istatus)
+
+  #Stopped Child Processes are not reported as finished
+  return istatus
+
+
+def isForkServerSupported():
+  '''
+  This Function reports whether the `ForkServer` can be used.
+  Passing the file descriptors with `socket.send_fds()` requires Python 3.9 or newer
+
+  :returns: Whether the `ForkServer` is supported
+  :rtype: boolean
+  '''
+  return hasattr(socket, 'send_fds')
+
+
+def getForkServer():
+  '''
+  This Function returns the `ForkServer` shared by all `Command` objects of the process.
+  It is launched on first use and stopped when the process exits
+
+  :returns: The shared `ForkServer` object
+  :rtype: ForkServer
+  '''
+  global _forkserver
+
+  if _forkserver is None :
+    _forkserver = ForkServer()
+
+    atexit.register(_forkserver.Stop)
+
+  return _forkserver
+
+
+def serveForks(ifd, config = {}):
+  '''
+  This Function runs the helper process. It launches the requested child processes
+  with `os.posix_spawnp()` or forks them for Python entry points and for limits,
+  reaps them and reports their Exit Codes.
+  The remaining processes of the process group of a child process in its own session
+  are killed before the child process is reaped.
+  It returns when the supervisor process closes the socket
+
+  :param ifd: The file descriptor of the socket to the supervisor process
+  :type ifd: integer
+  :param config: The `preload` modules and the module search `path` of the supervisor process
+  :type config: dictionary
+  '''
+  if 'path' in config :
+    sys.path[:] = config['path']
+
+  for smodule in config.get('preload', []) :
+    try :
+      importlib.import_module(smodule)
+    except Exception :
+      #The Entry Point will report the Import Error itself
+      pass
+
+  #for smodule in config.get('preload', [])
+
+  #Keep the preloaded Objects out of the Garbage Collection in the forked Child Processes
+  gc.freeze()
+
+  sock = socket.socket(fileno = ifd)
+  selector = selectors.DefaultSelector()
+  ifdwakeread, ifdwakewrite = os.pipe()
+
+  sock.set_inheritable(False)
+  os.set_blocking(ifdwakeread, False)
+  os.set_blocking(ifdwakewrite, False)
+
+  #The Exit of Child Processes wakes up the Selector
+  signal.signal(signal.SIGCHLD, lambda isignal, frame : None)
+  signal.signal(signal.SIGINT, signal.SIG_IGN)
+  signal.set_wakeup_fd(ifdwakewrite)
+
+  selector.register(sock, selectors.EVENT_READ)
+  selector.register(ifdwakeread, selectors.EVENT_READ)
+
+  #The Child Processes which are not reaped yet and whether they run in their own Session
+  arrchildren = {}
+  brun = True
+
+  while brun :
+    for key, mask in selector.select() :
+      if key.fileobj is sock :
+        data, arrfds, iflags, address = socket.recv_fds(sock, 1048576, 3)
+
+        if data == b'' :
+          #The Supervisor Process has finished
+          brun = False
+        else :
+          request = json.loads(data)
+
+          if request.get('type') == 'signal' :
+            _signalRequest(request, arrchildren)
+
+            continue
+
+          if request.get('type') == 'python' \
+          or len(request.get('limits', {})) > 0 :
+            reply = _forkRequest(request, arrfds)
+          else :
+            reply = _spawnRequest(request, arrfds)
+
+          if reply['type'] == 'spawned' :
+            arrchildren[reply['pid']] = bool(request.get('session'))
+
+          sock.send(json.dumps(reply).encode())
+
+      else :  #Signal Notification
+        try :
+          os.read(ifdwakeread, 4096)
+        except BlockingIOError :
+          pass
+
+    #for key, mask in selector.select()
+
+    #Reap the finished Child Processes
+    bwait = True
+
+    while bwait :
+      ipid = 0
+
+      try :
+        #Find an exited Child Process without reaping it
+        result = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+
+        if result is not None :
+          if arrchildren.pop(result.si_pid, False) :
+            try :
+              #The Process Group ID is still held by the exited Child Process
+              os.killpg(result.si_pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError) :
+              pass
+
+          #if arrchildren.pop(result.si_pid, False)
+
+          ipid, istatus, rusage = os.wait4(result.si_pid, 0)
+
+        #if result is not None
+      except ChildProcessError :
+        #No Child Processes left
+        ipid = 0
+
+      if ipid > 0 :
+        sock.send(json.dumps({'type': 'exited', 'pid': ipid\
+        , 'status': decodeWaitStatus(istatus), 'rusage': list(rusage)}).encode())
+      else :
+        bwait = False
+
+    #while bwait
+  #while brun
+
+
+def _signalRequest(request, arrchildren):
+  '''
+  This Function sends the signal of a request to a child process which is not reaped yet
+  or to its process group if it runs in its own session
+  '''
+  ipid = request['pid']
+
+  if ipid in arrchildren :
+    try :
+      if request.get('group') \
+      and arrchildren[ipid] :
+        try :
+          os.killpg(ipid, request['signal'])
+
+          return
+        except ProcessLookupError :
+          #The Process Group was not created yet
+          pass
+
+      #if request.get('group') and arrchildren[ipid]
+
+      os.kill(ipid, request['signal'])
+    except OSError :
+      pass
+
+  #if ipid in arrchildren
+
+
+def _spawnRequest(request, arrfds):
+  '''
+  This Function launches the child process of a request with the received file descriptors
+  as its standard file descriptors
+
+  :returns: The reply to the request
+  :rtype: dictionary
+  '''
+  reply = {}
+
+  try :
+    arrfileactions = []
+
+    for ifd, itarget in zip(arrfds, request['fds']) :
+      #The received File Descriptors must not leak into other Child Processes
+      os.set_inheritable(ifd, False)
+
+      arrfileactions.append((os.POSIX_SPAWN_DUP2, ifd, itarget))
+
+    #for ifd, itarget in zip(arrfds, request['fds'])
+
+    if request.get('cwd') is not None \
+    and request['cwd'] != os.getcwd() :
+      os.chdir(request['cwd'])
+
+    #The Child Process gets the default Signal Handling like with subprocess.Popen
+    ipid = os.posix_spawnp(request['args'][0], request['args'], request.get('env', os.environ)\
+    , file_actions = arrfileactions\
+    , setsigdef = (signal.SIGINT, signal.SIGPIPE, signal.SIGXFSZ)\
+    , setsid = bool(request.get('session')))
+
+    reply = {'type': 'spawned', 'pid': ipid}
+  except Exception as e :
+    reply = {'type': 'failed', 'errno': getattr(e, 'errno', None) or 0\
+    , 'message': getattr(e, 'strerror', None) or str(e)}
+  finally :
+    for ifd in arrfds :
+      os.close(ifd)
+
+  return reply
+
+
+def _forkRequest(request, arrfds):
+  '''
+  This Function forks the helper process for a request to run a Python entry point
+  or to launch a command with limits, with the received file descriptors
+  as its standard file descriptors.
+  The forked child process waits until the limits are applied to it.
+  The limits which could not be applied are listed in the `errors` of the reply
+
+  :returns: The reply to the request
+  :rtype: dictionary
+  '''
+  reply = {}
+  arrpipefds = []
+  ipid = 0
+
+  try :
+    if request.get('cwd') is not None \
+    and request['cwd'] != os.getcwd() :
+      os.chdir(request['cwd'])
+
+    if len(request.get('limits', {})) > 0 :
+      #The Gate holds back the Child Process and the Exec Pipe reports a failed Launch
+      arrpipefds.extend(os.pipe())
+      arrpipefds.extend(os.pipe())
+
+    ipid = os.fork()
+
+    if ipid == 0 :
+      if len(arrpipefds) > 0 :
+        os.close(arrpipefds[1])
+        os.close(arrpipefds[2])
+
+        #Wait until the Limits are applied
+        os.read(arrpipefds[0], 1)
+
+      #The Child Process never returns
+      if request.get('type') == 'python' :
+        _runEntryPoint(request, arrfds)
+      else :
+        _execCommand(request, arrfds, arrpipefds[3])
+
+    #if ipid == 0
+
+    reply = {'type': 'spawned', 'pid': ipid}
+
+    if len(arrpipefds) > 0 :
+      ifdgateread, ifdgatewrite, ifdexecread, ifdexecwrite = arrpipefds
+
+      #Only the Child Process keeps these Ends of the Pipes
+      for ifd in (ifdgateread, ifdexecwrite) :
+        arrpipefds.remove(ifd)
+        os.close(ifd)
+
+      reply['errors'] = _getLimitsFunction()(ipid, request['limits'])
+
+      #Release the Child Process
+      arrpipefds.remove(ifdgatewrite)
+      os.close(ifdgatewrite)
+
+      sdata = b''
+      scnk = os.read(ifdexecread, 64)
+
+      while scnk != b'' :
+        sdata += scnk
+        scnk = os.read(ifdexecread, 64)
+
+      if sdata != b'' :
+        #The Command could not be executed
+        os.waitpid(ipid, 0)
+
+        ierrno = int(sdata)
+
+        reply = {'type': 'failed', 'errno': ierrno, 'message': os.strerror(ierrno)}
+
+      #if sdata != b''
+    #if len(arrpipefds) > 0
+  except Exception as e :
+    if ipid > 0 \
+    and len(arrpipefds) > 0 :
+      #The Child Process must not run without its Limits
+      os.kill(ipid, signal.SIGKILL)
+      os.waitpid(ipid, 0)
+
+    reply = {'type': 'failed', 'errno': getattr(e, 'errno', None) or errno.EAGAIN\
+    , 'message': getattr(e, 'strerror', None) or str(e)}
+  finally :
+    for ifd in arrfds + arrpipefds :
+      os.close(ifd)
+
+  return reply
+
+
+def _getLimitsFunction():
+  '''
+  This Function provides `limits.applyLimits()`. When this Module runs as script
+  the `limits` Module is loaded from its file beside this Module
+  '''
+  global applyLimits
+
+  if applyLimits is None :
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location('_libcommand_limits'\
+    , os.path.join(os.path.dirname(os.path.abspath(__file__)), 'limits.py'))
+    module = importlib.util.module_from_spec(spec)
+
+    spec.loader.exec_module(module)
+
+    applyLimits = module.applyLimits
+
+  #if applyLimits is None
+
+  return applyLimits
+
+
+def _execCommand(request, arrfds, ifdexec):
+  '''
+  This Function executes the command of a request in the forked child process.
+  If the command cannot be executed the error number is written to the pipe `ifdexec`
+  '''
+  ierrno = errno.EINVAL
+
+  try :
+    if request.get('session') :
+      os.setsid()
+
+    for ifd, itarget in zip(arrfds, request['fds']) :
+      os.dup2(ifd, itarget)
+
+    #The received File Descriptors must not leak into the Command
+    for ifd in arrfds :
+      if ifd not in request['fds'] :
+        os.set_inheritable(ifd, False)
+
+    #The Child Process gets the default Signal Handling like with subprocess.Popen
+    for isignal in (signal.SIGINT, signal.SIGPIPE, signal.SIGXFSZ) :
+      signal.signal(isignal, signal.SIG_DFL)
+
+    os.execvpe(request['args'][0], request['args'], request.get('env', os.environ))
+  except OSError as e :
+    ierrno = e.errno or errno.EINVAL
+  except BaseException :
+    pass
+  finally :
+    try :
+      os.write(ifdexec, str(ierrno).encode())
+    finally :
+      os._exit(127)
+
+
+def _runEntryPoint(request, arrfds):
+  '''
+  This Function runs the Python entry point of a request in the forked child process
+  and exits with its Exit Code
+  '''
+  icode = 1
+
+  try :
+    if request.get('session') :
+      os.setsid()
+
+    for ifd, itarget in zip(arrfds, request['fds']) :
+      os.dup2(ifd, itarget)
+
+    #Do not keep the Socket and the received File Descriptors open like with subprocess.Popen
+    os.closerange(3, os.sysconf('SC_OPEN_MAX'))
+
+    #The Child Process gets the Signal Handling of a new Interpreter
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    sentrypoint = request['args'][0]
+
+    sys.argv = list(request['args'])
+    sys.path[:] = request.get('path', sys.path)
+
+    if 'env' in request :
+      os.environ.clear()
+      os.environ.update(request['env'])
+
+    try :
+      if ':' in sentrypoint :
+        smodule, sfunction = sentrypoint.split(':', 1)
+
+        entry = importlib.import_module(smodule)
+
+        for sattribute in sfunction.split('.') :
+          entry = getattr(entry, sattribute)
+
+        icode = entry()
+      elif sentrypoint.endswith('.py') \
+      or os.path.isfile(sentrypoint) :
+        #The Script Directory is searched first like with "python script.py"
+        sys.path.insert(0, os.path.dirname(os.path.abspath(sentrypoint)))
+
+        runpy.run_path(sentrypoint, run_name = '__main__')
+
+        icode = 0
+      else :
+        #The Working Directory is searched first like with "python -m module"
+        sys.path.insert(0, os.getcwd())
+
+        runpy.run_module(sentrypoint, run_name = '__main__', alter_sys = True)
+
+        icode = 0
+
+    except SystemExit as e :
+      icode = e.code
+
+    if icode is None :
+      icode = 0
+    elif not isinstance(icode, int) :
+      #The Exit Message is printed like by the Interpreter
+      print(icode, file = sys.stderr)
+
+      icode = 1
+
+  except BaseException :
+    traceback.print_exc()
+
+    icode = 1
+  finally :
+    for stream in (sys.stdout, sys.stderr) :
+      try :
+        stream.flush()
+      except Exception :
+        pass
+
+    os._exit(icode & 0xff)
+
+
+
+if __name__ == '__main__' :
+  if len(sys.argv) > 2 :
+    serveForks(int(sys.argv[1]), json.loads(sys.argv[2]))
+  else :
+    serveForks(int(sys.argv[1]))
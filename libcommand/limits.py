@@ -0,0 +1,192 @@
+'''
+This Module provides the Functions to restrict the resources of launched child processes.
+
+The limits are applied to the process ID of the child process
+with `resource.prlimit()`, `os.setpriority()`, `os.sched_setaffinity()`, the `ioprio_set`
+System Call and the `cgroup.procs` file of a cgroup v2 directory.
+So no `preexec_fn` is needed. The `ForkServer` applies them to its forked child process
+before the command starts, so processes created by the command inherit the limits.
+
+:version: 2026-10-18
+
+:author: Bodo Hugo Barwich
+'''
+__docformat__ = "restructuredtext en"
+
+import os
+import platform
+
+try :
+  import resource
+except ImportError :
+  #Resource Limits are not supported on this Platform
+  resource = None
+
+try :
+  import ctypes
+except ImportError :
+  #The I/O Priority cannot be changed without ctypes
+  ctypes = None
+
+
+
+#==============================================================================
+# Module Functions
+
+
+#The System Call Numbers of ioprio_set() by Architecture
+_arr_ioprio_syscalls = {'x86_64': 251, 'amd64': 251, 'i386': 289, 'i686': 289\
+, 'aarch64': 30, 'arm64': 30, 'riscv64': 30, 'armv7l': 314, 'ppc64le': 273, 's390x': 282}
+
+#The I/O Scheduling Classes like with ionice
+_arr_ioprio_classes = {'none': 0, 'realtime': 1, 'best-effort': 2, 'idle': 3}
+
+_IOPRIO_CLASS_SHIFT = 13
+_IOPRIO_WHO_PROCESS = 1
+
+_scgroup_root = '/sys/fs/cgroup'
+
+#The recognized Limits
+_arr_limits = ('rlimits', 'nice', 'ionice', 'affinity', 'cgroup')
+
+
+def applyLimits(ipid, limits):
+  '''
+  This Function applies the `limits` to the running process `ipid`.
+  The recognized keys are:
+  * `rlimits` - dictionary of resource limits by their name without the prefix "RLIMIT_",
+    like `as`, `cpu` or `nofile`, with a single value or a tuple of the soft and hard limit
+  * `nice` - the niceness of the process
+  * `ionice` - the I/O scheduling class "realtime", "best-effort" or "idle"
+    or a tuple of the class and the priority level
+  * `affinity` - the set of CPU numbers the process may run on
+  * `cgroup` - the path of a cgroup v2 directory or a dictionary with its `path`
+    and the controller files to write like `memory.max` or `cpu.max`.
+    Relative paths are located under "/sys/fs/cgroup" and missing directories are created
+
+  Limits which cannot be applied and unknown keys are reported and do not prevent the other limits
+
+  :param ipid: The process ID of the child process
+  :type ipid: integer
+  :param limits: The limits as key - value pairs
+  :type limits: dictionary
+  :returns: The error messages of the limits which could not be applied
+  :rtype: list
+  '''
+  arrerrors = []
+
+  for sname in limits :
+    if sname not in _arr_limits :
+      arrerrors.append("Limit {}: is not recognized".format(sname))
+
+  #for sname in limits
+
+  #The cgroup is joined first so its Limits cover the whole Execution
+  if limits.get('cgroup') is not None :
+    _applyLimit(arrerrors, 'cgroup', _joinCgroup, ipid, limits['cgroup'])
+
+  if not isinstance(limits.get('rlimits', {}), dict) :
+    arrerrors.append("Limit rlimits: could not be applied: the resource limits are not a dictionary")
+  else :
+    for sname, value in limits.get('rlimits', {}).items() :
+      _applyLimit(arrerrors, "rlimit '{}'".format(sname), _setResourceLimit, ipid, sname, value)
+
+  if limits.get('nice') is not None :
+    _applyLimit(arrerrors, 'nice', _setNiceness, ipid, limits['nice'])
+
+  if limits.get('ionice') is not None :
+    _applyLimit(arrerrors, 'ionice', _setIOPriority, ipid, limits['ionice'])
+
+  if limits.get('affinity') is not None :
+    _applyLimit(arrerrors, 'affinity', _setAffinity, ipid, limits['affinity'])
+
+  return arrerrors
+
+
+def _applyLimit(arrerrors, sname, fn, *args):
+  try :
+    fn(*args)
+  except (OSError, ValueError, TypeError, LookupError, AttributeError) as e :
+    arrerrors.append("Limit {}: could not be applied: {}".format(sname, str(e)))
+
+
+def _setResourceLimit(ipid, sname, value):
+  if resource is None \
+  or not hasattr(resource, 'prlimit') :
+    raise OSError("Resource Limits for other Processes are not supported")
+
+  ilimit = getattr(resource, 'RLIMIT_' + sname.upper())
+
+  if isinstance(value, (tuple, list)) :
+    arrlimits = (int(value[0]), int(value[1]))
+  else :
+    arrlimits = (int(value), int(value))
+
+  resource.prlimit(ipid, ilimit, arrlimits)
+
+
+def _setNiceness(ipid, value):
+  os.setpriority(os.PRIO_PROCESS, ipid, int(value))
+
+
+def _setAffinity(ipid, arrcpus):
+  os.sched_setaffinity(ipid, {int(icpu) for icpu in arrcpus})
+
+
+def _setIOPriority(ipid, value):
+  ilevel = 0
+
+  if isinstance(value, (tuple, list)) :
+    sclass = value[0]
+    ilevel = int(value[1])
+  else :
+    sclass = value
+
+  if isinstance(sclass, str) :
+    iclass = _arr_ioprio_classes[sclass.lower()]
+  else :
+    iclass = int(sclass)
+
+  isyscall = _arr_ioprio_syscalls.get(platform.machine().lower())
+
+  if ctypes is None \
+  or isyscall is None :
+    raise OSError("The I/O Priority is not supported on this Platform")
+
+  libc = ctypes.CDLL(None, use_errno = True)
+
+  if libc.syscall(isyscall, _IOPRIO_WHO_PROCESS, ipid, (iclass << _IOPRIO_CLASS_SHIFT) | ilevel) != 0 :
+    ierrno = ctypes.get_errno()
+
+    raise OSError(ierrno, os.strerror(ierrno))
+
+  #if libc.syscall(isyscall, _IOPRIO_WHO_PROCESS, ipid, (iclass << _IOPRIO_CLASS_SHIFT) | ilevel) != 0
+
+
+def _joinCgroup(ipid, cgroup):
+  controls = {}
+
+  if isinstance(cgroup, dict) :
+    spath = cgroup['path']
+    controls = {skey: svalue for skey, svalue in cgroup.items() if skey != 'path'}
+  else :
+    spath = cgroup
+
+  spath = os.path.join(_scgroup_root, spath)
+  sparent = spath
+
+  while not os.path.isdir(sparent) :
+    sparent = os.path.dirname(sparent)
+
+  #Only Directories in a cgroup v2 Hierarchy can hold the Child Process
+  if not os.path.isfile(os.path.join(sparent, 'cgroup.controllers')) :
+    raise OSError("'{}' is not in a cgroup v2 hierarchy".format(spath))
+
+  os.makedirs(spath, exist_ok = True)
+
+  for sfile, value in controls.items() :
+    with open(os.path.join(spath, sfile), 'w') as fcontrol :
+      fcontrol.write(str(value))
+
+  with open(os.path.join(spath, 'cgroup.procs'), 'w') as fprocs :
+    fprocs.write(str(ipid))
@@ -0,0 +1,225 @@
+'''
+This Module provides the `Pipeline` Class which connects multiple `Command` objects
+like a shell pipeline.
+
+:version: 2026-10-18
+
+:author: Bodo Hugo Barwich
+'''
+__docformat__ = "restructuredtext en"
+
+import os
+
+from .command import resizePipe
+from .commandgroup import CommandGroup
+
+
+
+#==============================================================================
+# The Pipeline Class
+
+
+class Pipeline(CommandGroup):
+  '''
+  This is a Class to run `Command` objects as stages of a pipeline without a shell.
+
+  The STDOUT of each stage is connected to the STDIN of the next stage by an operating system pipe,
+  so the data passes directly between the child processes and never through the Python process.
+  The STDIN of the first stage and the STDOUT of the last stage are used as configured
+  in their `Command` objects. The STDERR of each stage is captured by its own `Command` object.
+
+  All stages are launched together and monitored like the `Command` objects of a `CommandGroup`.
+  The Results of each stage are available individually
+  '''
+
+
+
+  #----------------------------------------------------------------------------
+  #Constructors
+
+  def __init__(self, options = {}):
+    '''
+    A `Pipeline` Object can be instantiated with a set of initial options `options`
+
+    :param options: Additional options for the execution as key - value pairs
+    :type options: dictionary
+
+    :see: `Pipeline.setDictOptions`
+    '''
+    self._pipe_size = -1
+    self._arr_overrides = {}
+
+    super().__init__(options)
+
+
+
+  #----------------------------------------------------------------------------
+  #Administration Methods
+
+
+  def setDictOptions(self, options = {}):
+    '''
+    This Method configures the `Pipeline` object from a dictionary in the parameter `options`.
+    Additionally to the options of the `CommandGroup` Class the recognized keys are:
+    * `pipesize` - the size in bytes of the kernel buffers of the pipes between the stages
+
+    :param options: Additional options for the execution as key - value pairs
+    :type options: dictionary
+    '''
+    super().setDictOptions(options)
+
+    if 'pipesize' in options :
+      self.setPipeSize(options['pipesize'])
+
+
+  def setPipeSize(self, ipipesize = -1):
+    try :
+      self._pipe_size = int(ipipesize)
+    except :
+      #The Parameter is not a Number
+      self._pipe_size = -1
+
+    if self._pipe_size < 1 :
+      #Keep the System Pipe Size
+      self._pipe_size = -1
+
+
+  def Launch(self):
+    '''
+    This Method connects the stages with pipes and launches all of them.
+    The STDIN of each stage after the first one and the STDOUT of each stage
+    before the last one are connected to the pipes for this launch only.
+    The stages keep their configured input and targets
+
+    :returns: The count of launched child processes
+    :rtype: integer
+    '''
+    arrindices = [icmdidx for icmdidx, cmd in enumerate(self._arr_commands) if cmd is not None]
+    arrfds = []
+
+    self._arr_overrides = {}
+
+    try :
+      for istage in range(0, len(arrindices) - 1) :
+        ifdread, ifdwrite = os.pipe()
+
+        arrfds.extend((ifdread, ifdwrite))
+
+        if self._pipe_size > 0 :
+          resizePipe(ifdwrite, self._pipe_size, self._arr_rpt if self._bdebug else None)
+
+        #The Child Processes use the Pipe directly
+        self._arr_overrides.setdefault(arrindices[istage], {})['stdout'] = ifdwrite
+        self._arr_overrides.setdefault(arrindices[istage + 1], {})['stdin'] = ifdread
+
+      #for istage in range(0, len(arrindices) - 1)
+
+      irs = super().Launch()
+    finally :
+      self._arr_overrides = {}
+
+      #Only the Child Processes keep the Pipes open
+      for ifd in arrfds :
+        os.close(ifd)
+
+    return irs
+
+
+  def _getLaunchOverrides(self, icmdidx, cmd):
+    '''
+    This Method connects the stage at the position `icmdidx` to its pipes for the launch
+
+    :see: `CommandGroup._getLaunchOverrides()`
+    '''
+    overrides = super()._getLaunchOverrides(icmdidx, cmd)
+
+    overrides.update(self._arr_overrides.get(icmdidx, {}))
+
+    return overrides
+
+
+
+  #----------------------------------------------------------------------------
+  #Consultation Methods
+
+
+  def getPipeSize(self):
+    return self._pipe_size
+
+
+  def getOutputString(self):
+    '''
+    Pipeline.output Property which represents the STDOUT output of the last stage
+
+    :returns: The STDOUT output of the last stage
+    :rtype: string
+    '''
+    sout = ''
+    arrcmds = [cmd for cmd in self._arr_commands if cmd is not None]
+
+    if len(arrcmds) > 0 :
+      sout = arrcmds[-1].getReportString()
+
+    return sout
+
+
+  def getStatusList(self):
+    '''
+    Pipeline.statuses Property which holds the Exit Codes of all stages in their order.
+    Stages which were not launched or have not finished yet have the Exit Code "-1"
+
+    :returns: The Exit Codes of the stages
+    :rtype: list
+    '''
+    return [cmd.getProcessStatus() for cmd in self._arr_commands if cmd is not None]
+
+
+  def getCodeList(self):
+    '''
+    Pipeline.codes Property which holds the Error Codes of all stages in their order
+
+    :returns: The Error Codes of the stages
+    :rtype: list
+    '''
+    return [cmd.getErrorCode() for cmd in self._arr_commands if cmd is not None]
+
+
+  def getErrorList(self):
+    '''
+    Pipeline.errors Property which holds the STDERR output of all stages in their order
+
+    :returns: The Error Messages of the stages
+    :rtype: list
+    '''
+    return [cmd.getErrorString() for cmd in self._arr_commands if cmd is not None]
+
+
+  def getProcessStatus(self):
+    '''
+    Pipeline.status Property which holds the Exit Code of the pipeline.
+    Like with the `pipefail` Option of the shell this is the Exit Code of the last stage
+    which failed or "0" if all stages succeeded
+
+    :returns: The Exit Code of the pipeline
+    :rtype: integer
+    '''
+    irs = 0
+
+    for istatus in self.getStatusList() :
+      if istatus != 0 :
+        irs = istatus
+
+    return irs
+
+
+
+  #-----------------------------------------------------------------------------------------
+  #Properties
+
+
+  pipe_size = property(getPipeSize, setPipeSize)
+  output = property(getOutputString)
+  statuses = property(getStatusList)
+  codes = property(getCodeList)
+  errors = property(getErrorList)
+  status = property(getProcessStatus)
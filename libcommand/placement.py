@@ -0,0 +1,224 @@
+'''
+This Module provides the `CorePlacement` Class which assigns the child processes of a group
+to CPU cores and NUMA nodes, and the Functions to read the NUMA topology of the system
+from `/sys/devices/system/node`.
+
+:version: 2026-10-18
+
+:author: Bodo Hugo Barwich
+'''
+__docformat__ = "restructuredtext en"
+
+import os
+import glob
+
+
+
+#==============================================================================
+# Module Functions
+
+
+_snode_root = '/sys/devices/system/node'
+
+
+def parseCPUList(scpulist):
+  '''
+  This Function parses a CPU list in the format of the Linux kernel like "0-3,8,10-11"
+
+  :param scpulist: The CPU list
+  :type scpulist: string
+  :returns: The CPU numbers in ascending order
+  :rtype: list
+  '''
+  arrcpus = set()
+
+  for srange in scpulist.strip().split(',') :
+    if srange == '' :
+      continue
+
+    if '-' in srange :
+      sfirst, slast = srange.split('-', 1)
+
+      arrcpus.update(range(int(sfirst), int(slast) + 1))
+    else :
+      arrcpus.add(int(srange))
+
+  #for srange in scpulist.strip().split(',')
+
+  return sorted(arrcpus)
+
+
+def readNodeTopology():
+  '''
+  This Function reads the CPUs of each NUMA node from `/sys/devices/system/node`.
+  Only the CPUs this process may run on are reported and nodes without such CPUs are left out.
+  If the topology is not available all usable CPUs are reported as node "0"
+
+  :returns: The CPU numbers by the node number
+  :rtype: dictionary
+  '''
+  topology = {}
+
+  try :
+    arrallowed = os.sched_getaffinity(0)
+  except (AttributeError, OSError) :
+    #The CPU Affinity is not supported on this Platform
+    arrallowed = set(range(os.cpu_count() or 1))
+
+  for snodedir in glob.glob(os.path.join(_snode_root, 'node[0-9]*')) :
+    try :
+      inode = int(os.path.basename(snodedir)[4:])
+
+      with open(os.path.join(snodedir, 'cpulist'), 'r') as fcpulist :
+        arrcpus = [icpu for icpu in parseCPUList(fcpulist.read()) if icpu in arrallowed]
+
+    except (OSError, ValueError) :
+      continue
+
+    if len(arrcpus) > 0 :
+      topology[inode] = arrcpus
+
+  #for snodedir in glob.glob(os.path.join(_snode_root, 'node[0-9]*'))
+
+  if len(topology) == 0 :
+    topology[0] = sorted(arrallowed)
+
+  return topology
+
+
+
+#==============================================================================
+# The CorePlacement Class
+
+
+class CorePlacement(object):
+  '''
+  This is a Class to assign each launched child process to CPU cores by a placement policy.
+  The recognized policies are:
+  * `roundrobin` - each child process is pinned to the next core in turn
+  * `pack` - each child process is pinned to the least busy core, filling the cores of
+    the first NUMA node before the cores of the next node are used
+  * `spread` - each child process is pinned to all cores of the least busy NUMA node,
+    so the child processes are distributed evenly across the nodes and each one
+    keeps its memory on its own node
+
+  The load of a core or node is the count of its assigned child processes which are still running
+  '''
+
+  #The Placement Policies
+  _arr_policies = ('roundrobin', 'pack', 'spread')
+
+
+
+  #----------------------------------------------------------------------------
+  #Constructors
+
+  def __init__(self, spolicy = 'roundrobin', topology = None):
+    '''
+    A `CorePlacement` Object is instantiated with the policy `spolicy`
+    and optionally the NUMA topology `topology`
+
+    :param spolicy: The placement policy: "roundrobin", "pack" or "spread"
+    :type spolicy: string
+    :param topology: The CPU numbers by the node number. The topology of the system is used by default
+    :type topology: dictionary
+    :raises ValueError: If the policy is unknown or the topology has no CPUs
+    '''
+    if spolicy not in self._arr_policies :
+      raise ValueError("Unknown Placement Policy '{}'".format(spolicy))
+
+    if topology is None :
+      topology = readNodeTopology()
+
+    self._spolicy = spolicy
+    self._topology = {int(inode): [int(icpu) for icpu in arrcpus]\
+      for inode, arrcpus in topology.items() if len(arrcpus) > 0}
+    self._arr_cores = [(inode, icpu) for inode in sorted(self._topology)\
+      for icpu in self._topology[inode]]
+    self._inext = 0
+    self._arr_assigned = []
+
+    if len(self._arr_cores) == 0 :
+      raise ValueError("The Placement Topology has no CPUs")
+
+
+
+  #----------------------------------------------------------------------------
+  #Administration Methods
+
+
+  def Assign(self, cmd):
+    '''
+    This Method assigns the child process of the `Command` object `cmd` to CPU cores by the policy
+
+    :param cmd: The `Command` object which is launched
+    :type cmd: Command
+    :returns: The assignment with the keys `node` and `cpus`
+    :rtype: dictionary
+    '''
+    #Only running Child Processes keep their Cores busy
+    self._arr_assigned = [(ocmd, assignment) for ocmd, assignment in self._arr_assigned\
+      if ocmd is not cmd and ocmd.isRunning()]
+
+    if self._spolicy == 'spread' :
+      arrloads = {inode: 0 for inode in self._topology}
+
+      for ocmd, assignment in self._arr_assigned :
+        arrloads[assignment['node']] += 1
+
+      inode = min(sorted(self._topology), key = lambda inode: arrloads[inode])
+
+      assignment = {'node': inode, 'cpus': list(self._topology[inode])}
+    else :
+      if self._spolicy == 'pack' :
+        arrloads = {core: 0 for core in self._arr_cores}
+
+        for ocmd, assignment in self._arr_assigned :
+          arrloads[(assignment['node'], assignment['cpus'][0])] += 1
+
+        #The first least busy Core in Node Order
+        inode, icpu = min(self._arr_cores, key = lambda core: arrloads[core])
+      else :  #Round Robin Policy
+        inode, icpu = self._arr_cores[self._inext % len(self._arr_cores)]
+
+        self._inext += 1
+
+      #if self._spolicy == 'pack'
+
+      assignment = {'node': inode, 'cpus': [icpu]}
+
+    #if self._spolicy == 'spread'
+
+    self._arr_assigned.append((cmd, assignment))
+
+    return dict(assignment)
+
+
+  def Reset(self):
+    '''
+    This Method forgets all assignments and restarts the Round Robin with the first core
+    '''
+    self._inext = 0
+    self._arr_assigned = []
+
+
+
+  #----------------------------------------------------------------------------
+  #Consultation Methods
+
+
+  def getPolicy(self):
+    return self._spolicy
+
+
+  def getTopology(self):
+    return {inode: list(arrcpus) for inode, arrcpus in self._topology.items()}
+
+
+
+  #-----------------------------------------------------------------------------------------
+  #Properties
+
+
+  policy = property(getPolicy)
+  topology = property(getTopology)
@@ -0,0 +1,153 @@
+'''
+This Module provides the Functions to collect the resource usage of child processes
+from the `os.wait4()` System Call and from the `/proc` File System.
+
+:version: 2026-10-18
+
+:author: Bodo Hugo Barwich
+'''
+__docformat__ = "restructuredtext en"
+
+import sys
+import os
+
+
+
+#==============================================================================
+# Module Functions
+
+
+#The Keys of the Resource Usage which are summed up for a group
+_arr_summed_keys = ('utime', 'stime', 'minflt', 'majflt', 'nvcsw', 'nivcsw', 'read_bytes', 'write_bytes')
+
+#The Keys of the Resource Usage which are reduced to their maximum for a group
+_arr_peak_keys = ('maxrss', 'cpu_peak', 'rss_peak')
+
+_iclock_ticks = None
+
+
+def getUsageDict(rusage):
+  '''
+  This Function converts the resource usage reported by `os.wait4()` into a dictionary
+  with the keys:
+  * `utime` - CPU time in user mode in seconds
+  * `stime` - CPU time in system mode in seconds
+  * `maxrss` - maximal resident set size in bytes
+  * `minflt` - page faults served without I/O
+  * `majflt` - page faults which required I/O
+  * `nvcsw` - voluntary context switches
+  * `nivcsw` - involuntary context switches
+
+  :param rusage: The resource usage of the child process
+  :type rusage: resource.struct_rusage
+  :returns: The resource usage as key - value pairs
+  :rtype: dictionary
+  '''
+  imaxrss = rusage.ru_maxrss
+
+  if sys.platform != 'darwin' :
+    #The Maximal Resident Set Size is reported in Kilobytes
+    imaxrss *= 1024
+
+  return {'utime': rusage.ru_utime, 'stime': rusage.ru_stime, 'maxrss': imaxrss\
+  , 'minflt': rusage.ru_minflt, 'majflt': rusage.ru_majflt\
+  , 'nvcsw': rusage.ru_nvcsw, 'nivcsw': rusage.ru_nivcsw}
+
+
+def readProcessSample(ipid):
+  '''
+  This Function reads the current resource usage of the running process `ipid`
+  from `/proc/<pid>/stat`, `/proc/<pid>/status` and `/proc/<pid>/io` with the keys:
+  * `cputime` - consumed CPU time in user and system mode in seconds
+  * `rss` - current resident set size in bytes
+  * `read_bytes` - bytes read from the storage layer
+  * `write_bytes` - bytes written to the storage layer
+
+  Values which cannot be read are missing in the result
+
+  :param ipid: The process ID
+  :type ipid: integer
+  :returns: The resource usage as key - value pairs or an empty dictionary
+    if the process does not exist or the `/proc` File System is not available
+  :rtype: dictionary
+  '''
+  global _iclock_ticks
+
+  sample = {}
+  sprocdir = "/proc/{}/".format(ipid)
+
+  try :
+    with open(sprocdir + 'stat', 'rb') as fstat :
+      sstat = fstat.read()
+
+    if _iclock_ticks is None :
+      _iclock_ticks = os.sysconf('SC_CLK_TCK')
+
+    #The Command Name might contain Spaces and Parentheses
+    arrfields = sstat[sstat.rfind(b')') + 2:].split()
+
+    sample['cputime'] = (int(arrfields[11]) + int(arrfields[12])) / _iclock_ticks
+
+    with open(sprocdir + 'status', 'rb') as fstatus :
+      for sline in fstatus :
+        if sline.startswith(b'VmRSS:') :
+          sample['rss'] = int(sline.split()[1]) * 1024
+
+          break
+
+      #for sline in fstatus
+    #with open(sprocdir + 'status', 'rb') as fstatus
+
+  except (OSError, ValueError, IndexError) :
+    #The Process has exited or the /proc File System is not available
+    return {}
+
+  try :
+    with open(sprocdir + 'io', 'rb') as fio :
+      for sline in fio :
+        skey, svalue = sline.split(b':', 1)
+
+        if skey in (b'read_bytes', b'write_bytes') :
+          sample[skey.decode()] = int(svalue)
+
+      #for sline in fio
+    #with open(sprocdir + 'io', 'rb') as fio
+
+  except (OSError, ValueError) :
+    #The I/O Accounting is not permitted or not enabled
+    pass
+
+  return sample
+
+
+def aggregateUsage(arrusages):
+  '''
+  This Function aggregates the resource usage of multiple child processes.
+  CPU times, page faults, context switches and I/O bytes are summed up
+  while the memory sizes and the CPU usage are reduced to their maximum.
+  The key `processes` holds the count of child processes with a resource usage
+
+  :param arrusages: The resource usages as returned by `Command.getResourceUsage()`
+  :type arrusages: list
+  :returns: The aggregated resource usage as key - value pairs
+  :rtype: dictionary
+  '''
+  total = {'processes': 0}
+
+  for usage in arrusages :
+    if len(usage) == 0 :
+      continue
+
+    total['processes'] += 1
+
+    for skey in _arr_summed_keys :
+      if skey in usage :
+        total[skey] = total.get(skey, 0) + usage[skey]
+
+    for skey in _arr_peak_keys :
+      if skey in usage :
+        total[skey] = max(total.get(skey, 0), usage[skey])
+
+  #for usage in arrusages
+
+  return total
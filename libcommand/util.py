@@ -1,7 +1,7 @@
 '''
 This Module provides static functions to interact with `Command` objects
 
-@version: 2021-04-17
+@version: 2026-10-18
 
 @author: Bodo Hugo Barwich
 '''
@@ -19,7 +19,8 @@ def runCommand(scommandline = '', options = {}):
   :type scommandline: string
   :param options: Additional options for the execution as key - value pairs
   :type options: dictionary
-  :returns: Returns a Tuple with the STDOUT, STDERR and EXIT Code
+  :returns: Returns a Tuple with the STDOUT, STDERR and EXIT Code.
+            With the `binary` option STDOUT and STDERR are returned as `bytes`
   :rtype: tuple
   '''
 
@@ -30,8 +31,13 @@ def runCommand(scommandline = '', options = {}):
   if(cmd.Launch()):
     cmd.Wait()
 
-  arrrs[0] = cmd.getReportString()
-  arrrs[1] = cmd.getErrorString()
+  if cmd.isBinary() :
+    arrrs[0] = cmd.getReportBytes()
+    arrrs[1] = cmd.getErrorBytes()
+  else :
+    arrrs[0] = cmd.getReportString()
+    arrrs[1] = cmd.getErrorString()
+
   arrrs[2] = cmd.getProcessStatus()
 
   if arrrs[2] == -1 :
@@ -48,11 +54,15 @@ def runCommandWithOptions(commandoptions = {}):
   This Method launches a process defined by `commandoptions['command']` in a separate child process
   Additional options in `commandoptions` are also configured before launching the child process
 
-  :returns: Returns a Tuple with the STDOUT, STDERR and EXIT Code
+  :returns: Returns a Tuple with the STDOUT, STDERR and EXIT Code.
+            With the `binary` option STDOUT and STDERR are returned as `bytes`
   :rtype: tuple
   '''
   arrrs = ['', '', 0]
 
+  if commandoptions.get('binary', False) :
+    arrrs = [b'', b'', 0]
+
   if('command' in commandoptions):
     cmd = Command()
 
@@ -61,8 +71,13 @@ def runCommandWithOptions(commandoptions = {}):
     if(cmd.Launch()):
       cmd.Wait()
 
-      arrrs[0] = cmd.getReportString()
-      arrrs[1] = cmd.getErrorString()
+      if cmd.isBinary() :
+        arrrs[0] = cmd.getReportBytes()
+        arrrs[1] = cmd.getErrorBytes()
+      else :
+        arrrs[0] = cmd.getReportString()
+        arrrs[1] = cmd.getErrorString()
+
       arrrs[2] = cmd.getProcessStatus()
 
       if arrrs[2] == -1 :
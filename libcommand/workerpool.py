@@ -0,0 +1,255 @@
+'''
+This Module provides the `WorkerPool` Class which runs Python entry points
+in pre-warmed worker processes and the `PythonCommand` Class for a single Python entry point.
+
+:version: 2026-10-18
+
+:author: Bodo Hugo Barwich
+'''
+__docformat__ = "restructuredtext en"
+
+from .command import Command
+from .commandpool import CommandPool
+from .forkserver import ForkServer, isForkServerSupported
+
+
+
+#==============================================================================
+# The PythonCommand Class
+
+
+class PythonCommand(Command):
+  '''
+  This is a Class to run a Python entry point like a `Command` without launching a new interpreter.
+
+  The first word of the `PythonCommand.command_line` is the entry point and the remaining words
+  are its arguments in `sys.argv`. The entry point is either the path of a Python script,
+  the name of a module which is run like with `python -m` or a callable in the format `module:function`.
+
+  The entry point runs in a child process forked from the helper process of a `ForkServer`.
+  The output is captured and the Exit Code is reported like for any other child process
+  through `PythonCommand.report`, `PythonCommand.error` and `PythonCommand.status`.
+  Each child process starts from the state of the helper process,
+  so modules imported by the entry point do not persist between runs
+
+  :see: `ForkServer.SpawnPython`
+  '''
+
+
+
+  #----------------------------------------------------------------------------
+  #Administration Methods
+
+
+  def _spawnProcess(self, arrcmd):
+    '''
+    This Method forks the child process for the entry point in `arrcmd`
+    from the configured `ForkServer`. The launcher setting is not used
+
+    :param arrcmd: The entry point and its arguments
+    :type arrcmd: list
+    :returns: The child process
+    :rtype: ForkServerProcess
+    :raises OSError: If the child process could not be created
+    '''
+    return self._getForkServer().SpawnPython(arrcmd[0], arrcmd[1:], self._package_size\
+    , stdin = self._openInput()\
+    , stdout = self._getTargetArgument(self._tee_rpt)\
+    , stderr = self._getTargetArgument(self._tee_err)\
+    , bsession = self._bnew_session, limits = self._getLaunchLimits())
+
+
+
+#==============================================================================
+# The WorkerPool Class
+
+
+class WorkerPool(CommandPool):
+  '''
+  This is a Class to run Python entry points with at most `WorkerPool.workers` of them
+  running at the same time.
+
+  The pool keeps a Python helper process alive which has imported the modules in `WorkerPool.preload`.
+  Each entry point runs in a copy forked from this pre-warmed process,
+  so it neither pays for the startup of the interpreter nor for the imports of the preloaded modules.
+  The helper process is launched with the first launch of the pool and is kept
+  for further launches until `WorkerPool.Stop()` is called.
+
+  The entry points are added as `PythonCommand` objects and can be run, monitored and accessed
+  like the `Command` objects of the `CommandPool` Class
+  '''
+
+
+
+  #----------------------------------------------------------------------------
+  #Constructors
+
+  def __init__(self, options = {}):
+    '''
+    A `WorkerPool` Object can be instantiated with a set of initial options `options`
+
+    :param options: Additional options for the execution as key - value pairs
+    :type options: dictionary
+
+    :see: `WorkerPool.setDictOptions`
+    '''
+    self._arr_preload = []
+    self._forkserver = None
+
+    super().__init__(options)
+
+
+  def __del__(self):
+    self.Stop()
+
+
+
+  #----------------------------------------------------------------------------
+  #Administration Methods
+
+
+  def setDictOptions(self, options = {}):
+    '''
+    This Method configures the `WorkerPool` object from a dictionary in the parameter `options`.
+    Additionally to the options of the `CommandPool` Class the recognized keys are:
+    * `preload` - list of the modules to import in the helper process
+
+    :param options: Additional options for the execution as key - value pairs
+    :type options: dictionary
+    '''
+    super().setDictOptions(options)
+
+    if 'preload' in options :
+      self.setPreload(options['preload'])
+
+
+  def setPreload(self, arrpreload = None):
+    '''
+    This Method sets the modules which the helper process imports in advance.
+    A running helper process is stopped, so the modules are imported at the next launch
+
+    :param arrpreload: The names of the modules
+    :type arrpreload: list
+    '''
+    if arrpreload is None :
+      self._arr_preload = []
+    elif isinstance(arrpreload, str) :
+      self._arr_preload = [arrpreload]
+    else :
+      self._arr_preload = [str(smodule) for smodule in arrpreload]
+
+    self.Stop()
+
+
+  def Add(self, ocommand = None):
+    '''
+    This Method adds a `PythonCommand` object to the queue of the pool.
+    If `ocommand` is not a `PythonCommand` object a new `PythonCommand` object is created
+
+    :param ocommand: The `PythonCommand` object to run in the pool
+    :type ocommand: PythonCommand
+    :returns: The queued `PythonCommand` object
+    :rtype: PythonCommand
+    '''
+    if not isinstance(ocommand, PythonCommand) :
+      #Pass the Read Timeout to the new Object
+      ocommand = PythonCommand(None, {'readtimeout': self._read_timeout})
+
+    return super().Add(ocommand)
+
+
+  def addsCommandLine(self, scommandline = '', options = {}):
+    '''
+    This Method creates a `PythonCommand` object for `scommandline` and adds it to the queue of the pool
+
+    :param scommandline: The entry point and its arguments
+    :type scommandline: string
+    :param options: Additional options for the execution as key - value pairs
+    :type options: dictionary
+    :returns: The queued `PythonCommand` object
+    :rtype: PythonCommand
+    '''
+    return self.Add(PythonCommand(scommandline, options))
+
+
+  def Launch(self):
+    '''
+    This Method launches the helper process if it is not running yet
+    and the first queued `PythonCommand` objects up to the maximal number of workers
+
+    :returns: The count of launched child processes
+    :rtype: integer
+    '''
+    forkserver = self.getForkServer()
+
+    if not isForkServerSupported() :
+      #Each Entry Point reports the failed Launch
+      self._arr_err.append("Worker Pool: The Fork Server requires Python 3.9 or newer\n")
+    elif not forkserver.Launch() :
+      self._arr_err.append("Worker Pool: Helper Process could not be launched\n")
+
+    return super().Launch()
+
+
+  def _launchCommand(self, icmdidx, cmd):
+    if not cmd.isRunning() :
+      #The Entry Points run in the pre-warmed Helper Process
+      cmd.setForkServer(self.getForkServer())
+
+    return super()._launchCommand(icmdidx, cmd)
+
+
+  def Stop(self):
+    '''
+    This Method stops the helper process. Running entry points are not affected
+    but their Exit Codes cannot be received any more
+    '''
+    if self._forkserver is not None :
+      self._forkserver.Stop()
+      self._forkserver = None
+
+    #if self._forkserver is not None
+
+
+
+  #----------------------------------------------------------------------------
+  #Consultation Methods
+
+
+  def getPreload(self):
+    return list(self._arr_preload)
+
+
+  def getForkServer(self):
+    '''
+    WorkerPool.forkserver Property which holds the `ForkServer` object of the helper process.
+    It is created on first use with the `WorkerPool.preload` modules
+
+    :returns: The `ForkServer` object of the pool
+    :rtype: ForkServer
+    '''
+    if self._forkserver is None :
+      self._forkserver = ForkServer(self._arr_preload)
+
+    return self._forkserver
+
+
+  def isWarm(self):
+    '''
+    WorkerPool.warm Property which indicates whether the helper process is running
+
+    :returns: Returns `True` if the helper process is running
+    :rtype: boolean
+    '''
+    return self._forkserver is not None \
+    and self._forkserver.isRunning()
+
+
+
+  #-----------------------------------------------------------------------------------------
+  #Properties
+
+
+  preload = property(getPreload, setPreload)
+  forkserver = property(getForkServer)
+  warm = property(isWarm)
@@ -0,0 +1,239 @@
+#!/usr/bin/python3
+'''
+Tests to verify the AsyncCommand and AsyncCommandGroup Class Functionality
+
+@version: 2026-10-18
+
+@author: Bodo Hugo Barwich
+'''
+import sys
+import os
+import time
+import re
+import asyncio
+
+sys.path.append("./")
+sys.path.append("../")
+
+from libcommand import AsyncCommand
+from libcommand import AsyncCommandGroup
+
+
+
+sdirectory = os.getcwd() + '/'
+smodule = ''
+stestscript = 'command_script.py'
+itestpause = 3
+iteststatus = 4
+
+spath = os.path.abspath(__file__);
+
+print("test script absolute path: '{}'".format(spath))
+
+slashpos = spath.rfind('/', 0)
+
+if slashpos != -1 :
+  sdirectory = spath[0 : slashpos + 1]
+  smodule = spath[slashpos + 1 : len(spath)]
+else :
+  smodule = spath
+
+print("Test Directory: '{}'".format(sdirectory))
+print("Test Module: '{}'".format(smodule))
+
+
+
+def test_AsyncCommandRun():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  stestscript = 'command_script.py'
+  itestpause = 1
+
+  cmdtest = AsyncCommand("{}{} {} {}".format(sdirectory, stestscript, itestpause, iteststatus)\
+    , {'profiling': True})
+
+  assert asyncio.run(cmdtest.Run()), "script '{}': Execution failed!".format(stestscript)
+
+  print("ERROR CODE: '{}'".format(cmdtest.code))
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("Execution Time: '{}'".format(cmdtest.execution_time))
+  print("STDOUT: '{}'".format(cmdtest.report))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.code == 0, "ERROR CODE '0' was not returned"
+  assert cmdtest.status == iteststatus, "EXIT CODE is not correct"
+  assert cmdtest.getExecutionTime() >= itestpause, "Measured Time is less than the Script Pause"
+  assert re.search("EXIT '{}'".format(iteststatus), cmdtest.report) is not None, "STDOUT was not captured"
+  assert re.search('END 1 ERROR', cmdtest.error) is not None, "STDERR was not captured"
+
+  print("")
+
+
+def test_AsyncCommandStream():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  stestscript = 'command_script.py'
+  itestpause = 1
+
+  cmdtest = AsyncCommand("{}{} {}".format(sdirectory, stestscript, itestpause))
+
+  async def streamCommand():
+    arrchunks = []
+
+    assert await cmdtest.Launch(), "script '{}': Launch failed!".format(stestscript)
+
+    async for chunk in cmdtest.Stream() :
+      arrchunks.append(chunk)
+
+    assert await cmdtest.Wait(), "script '{}': Execution failed!".format(stestscript)
+
+    return arrchunks
+
+  arrchunks = asyncio.run(streamCommand())
+
+  sstdout = ''.join([chunk[1] for chunk in arrchunks if chunk[0] == 1])
+  sstderr = ''.join([chunk[1] for chunk in arrchunks if chunk[0] == 2])
+
+  print("STREAM STDOUT: '{}'".format(sstdout))
+  print("STREAM STDERR: '{}'".format(sstderr))
+
+  assert re.search('END 1', sstdout) is not None, "STDOUT was not streamed"
+  assert re.search('END 1 ERROR', sstderr) is not None, "STDERR was not streamed"
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+
+  print("")
+
+
+def test_AsyncCommandTimeout():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  stestscript = 'command_script.py'
+  itestpause = 30
+
+  cmdtest = AsyncCommand("{}{} {}".format(sdirectory, stestscript, itestpause), {'timeout': 2})
+
+  assert not asyncio.run(cmdtest.Run()), "script '{}': Execution did not fail".format(stestscript)
+
+  print("ERROR CODE: '{}'".format(cmdtest.code))
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.code == 4, "ERROR CODE '4' was not returned"
+  assert re.search('Execution timed out', cmdtest.error) is not None\
+  , "STDERR does not report Execution Timeout"
+
+  print("")
+
+
+def test_AsyncCommandGroupRun():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  stestscript = 'command_script.py'
+
+  cmdgrp = AsyncCommandGroup()
+  imaxpause = 3
+
+  for ipause in (2, 3, 1) :
+    cmdgrp.addsCommandLine("{}{} {}".format(sdirectory, stestscript, ipause)\
+    , {'name': "command-script:{}s".format(ipause)})
+
+  itmstrt = time.time()
+
+  assert asyncio.run(cmdgrp.Run()), "Command Group Execution: Execution was not correct"
+
+  itm = int(time.time() - itmstrt)
+
+  print("Command Group Execution Time '{} / {}' s".format(itm, imaxpause))
+  print("Command Group STDOUT:\n'{}'".format(cmdgrp.report))
+
+  assert itm == imaxpause, "Command Group Execution longer than maximal Execution Time '{}' s"\
+  .format(imaxpause)
+
+  for icmd in range(0, cmdgrp.len) :
+    cmd = cmdgrp.getiCommand(icmd)
+
+    assert cmd.status == 0, "Command {}: EXIT CODE is not correct".format(cmd.getNameComplete())
+    assert re.search('END 1', cmd.report) is not None\
+    , "Command {}: STDOUT was not captured".format(cmd.getNameComplete())
+
+  #for icmd in range(0, cmdgrp.len)
+
+  print("")
+
+
+
+def test_AsyncCommandTarget(tmp_path):
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  rptpath = tmp_path / 'report.log'
+  errpath = tmp_path / 'error.log'
+
+  cmdtest = AsyncCommand("{} -c \"import sys; sys.stdout.write('x' * 100 + 'end'); sys.stderr.write('failed')\""\
+    .format(sys.executable), {'stdout': str(rptpath), 'stderr': str(errpath), 'tee': 10})
+
+  assert asyncio.run(cmdtest.Run()), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("STDOUT: '{}'".format(cmdtest.report))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report.endswith('xxxxxxxend'), "STDOUT Tail is not correct"
+  assert cmdtest.error == 'failed', "STDERR Tail is not correct"
+  assert rptpath.read_text() == 'x' * 100 + 'end', "STDOUT File is not correct"
+  assert errpath.read_text() == 'failed', "STDERR File is not correct"
+
+  print("")
+
+
+
+def test_AsyncCommandInput():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  ichunksize = 65536
+  ichunkcount = 64
+
+  cmdtest = AsyncCommand("{} -c \"import sys, shutil; shutil.copyfileobj(sys.stdin.buffer, sys.stdout.buffer)\""\
+    .format(sys.executable), {'binary': True, 'stdin': (b'x' * ichunksize for i in range(ichunkcount))})
+
+  assert asyncio.run(cmdtest.Run()), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report_bytes == b'x' * ichunksize * ichunkcount, "STDOUT is not correct"
+
+  print("")
+
+
+
+
+
+
+def test_AsyncCommandGroupPlacement():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdgrp = AsyncCommandGroup({'placement': 'pack'})
+
+  arrcpus = sorted(os.sched_getaffinity(0))
+
+  for icmdidx in range(0, 2) :
+    #The Child Process reads its Affinity only after it was launched
+    cmdgrp.addsCommandLine("sh -c 'read x; grep Cpus_allowed_list /proc/self/status'"\
+    , {'stdin': b'go\n'})
+
+  assert asyncio.run(cmdgrp.Run()), "Command Group Execution: Execution was not correct"
+
+  print("STDOUT: '{}'".format(cmdgrp.report))
+  print("STDERR: '{}'".format(cmdgrp.error))
+
+  for icmdidx in range(0, 2) :
+    assignment = cmdgrp.getiPlacement(icmdidx)
+
+    assert assignment is not None, "Child Process No. '{}' was not placed".format(icmdidx)
+    assert cmdgrp.getiCommand(icmdidx).report.split()[-1] == str(assignment['cpus'][0])\
+    , "Child Process No. '{}' was not pinned".format(icmdidx)
+    assert cmdgrp.getiCommand(icmdidx).getLimits() == {}, "Placement was kept in the Limits"
+
+  #for icmdidx in range(0, 2)
+
+  print("")
@@ -9,6 +9,8 @@ Tests to verify the Command Class Functionality
 import sys
 import os
 import re
+import time
+import signal
 from re import IGNORECASE
 
 sys.path.append("./")
@@ -16,6 +18,7 @@ sys.path.append("../")
 
 from libcommand import Command
 from libcommand import runCommand
+from libcommand import runCommandWithOptions
 
 
 
@@ -328,3 +331,692 @@ def test_PythonException():
 
   print('')
 
+def test_BlockingWait():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  stestscript = 'quiet_script.py'
+  itestpause = 2
+
+  cmdtest = Command("{}{} {}".format(sdirectory, stestscript, itestpause)\
+    , {'profiling': True})
+
+  assert cmdtest.isBlocking(), 'Blocking Wait Mode is not enabled'
+
+  itmcpu = time.process_time()
+
+  assert cmdtest.Launch(), "script '{}': Launch failed!".format(stestscript)
+  assert cmdtest.Wait(), "script '{}': Execution failed!".format(stestscript)
+
+  itmcpu = time.process_time() - itmcpu
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("Execution Time: '{}'".format(cmdtest.execution_time))
+  print("CPU Time: '{}'".format(itmcpu))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.getExecutionTime() >= itestpause\
+  , "Measured Time is less than the Script Pause"
+  assert itmcpu < itestpause / 4\
+  , "Waiting for the Child Process consumed too much CPU Time"
+
+  print("")
+
+
+
+def test_ExitNotification():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  itestpause = 3
+
+  #The Background Process keeps the Pipes open after the Child Process has exited
+  cmdtest = Command("sh -c 'sleep {} & echo background launched'".format(itestpause)\
+    , {'profiling': True})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("Execution Time: '{}'".format(cmdtest.execution_time))
+  print("STDOUT: '{}'".format(cmdtest.report))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert re.search('background launched', cmdtest.report) is not None, "STDOUT was not captured"
+
+  if hasattr(os, 'pidfd_open') :
+    assert cmdtest.getExecutionTime() < itestpause\
+    , "Exit was not notified before the Background Process finished"
+
+  cmdtest.freeResources()
+
+  print("")
+
+
+
+def test_BinaryCapture():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  #Output which is not valid in any Text Encoding
+  bdata = bytes(range(256)) * 64
+
+  cmdtest = Command("{} -c \"import sys; sys.stdout.buffer.write(bytes(range(256)) * 64)\""\
+    .format(sys.executable), {'binary': True})
+
+  assert cmdtest.isBinary(), 'Binary Capture Mode is not enabled'
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("STDOUT: '{}' bytes".format(len(cmdtest.report_bytes)))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert isinstance(cmdtest.report_bytes, bytes), "STDOUT was not captured as bytes"
+  assert cmdtest.report_bytes == bdata, "STDOUT was not captured unchanged"
+  assert isinstance(cmdtest.report, str), "STDOUT could not be decoded"
+
+  arrrs = runCommand("{}{} {} {}".format(sdirectory, 'command_script.py', 0, iteststatus)\
+    , {'binary': True})
+
+  assert isinstance(arrrs[0], bytes), "runCommand(): STDOUT was not returned as bytes"
+  assert isinstance(arrrs[1], bytes), "runCommand(): STDERR was not returned as bytes"
+  assert re.search(b'END 1 ERROR', arrrs[1]) is not None, "runCommand(): STDERR was not captured"
+  assert arrrs[2] == iteststatus, "runCommand(): EXIT CODE is not correct"
+
+  print("")
+
+
+
+def test_IncrementalDecoding():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  #Multi-Byte Characters which are split across the Read Packages
+  stext = 'x' + 'ä€' * 20000
+
+  cmdtest = Command("{} -c \"import sys; sys.stdout.buffer.write(('x' + '\\u00e4\\u20ac' * 20000).encode('utf-8'))\""\
+    .format(sys.executable), {'encoding': 'utf-8', 'errors': 'strict'})
+
+  assert cmdtest.encoding == 'utf-8', 'Encoding is not set'
+  assert cmdtest.encoding_errors == 'strict', 'Error Handler is not set'
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("STDOUT: '{}' characters".format(len(cmdtest.report)))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report == stext, "STDOUT was not decoded correctly"
+
+  print("")
+
+
+
+def test_BigOutput():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  #Bulk Output of 32 MiB
+  ioutputsize = 32 * 1048576
+
+  cmdtest = Command("{} -c \"import sys; sys.stdout.buffer.write(b'x' * {})\""\
+    .format(sys.executable, ioutputsize)\
+    , {'binary': True, 'maxpackagesize': 1048576, 'pipesize': 1048576, 'profiling': True})
+
+  assert cmdtest.max_package_size == 1048576, 'Maximal Package Size is not set'
+  assert cmdtest.pipe_size == 1048576, 'Pipe Size is not set'
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("Execution Time: '{}'".format(cmdtest.execution_time))
+  print("STDOUT: '{}' bytes".format(len(cmdtest.report_bytes)))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert len(cmdtest.report_bytes) == ioutputsize, "STDOUT was not captured completely"
+
+  print("")
+
+
+
+def test_OutputRetention():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  ioutputsize = 1048576
+
+  cmdtest = Command("{} -c \"import sys; sys.stdout.buffer.write(b'h' * 100 + b'x' * {} + b't' * 100)\""\
+    .format(sys.executable, ioutputsize)\
+    , {'binary': True, 'reportretention': {'policy': 'headtail', 'head': 100, 'tail': 100}})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("STDOUT: '{}'".format(cmdtest.report))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report_size == ioutputsize + 200, "STDOUT Size was not counted exactly"
+  assert cmdtest.report_bytes == b'h' * 100 \
+    + "\n[... truncated {} bytes ...]\n".format(ioutputsize).encode() + b't' * 100\
+  , "STDOUT was not retained correctly"
+
+  cmdtest = Command("{} -c \"import sys; sys.stdout.write('x' * {} + 'end')\""\
+    .format(sys.executable, ioutputsize), {'retention': {'policy': 'tail', 'tail': 10}})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("STDOUT: '{}'".format(cmdtest.report))
+
+  assert cmdtest.report_size == ioutputsize + 3, "STDOUT Size was not counted exactly"
+  assert cmdtest.report == "\n[... truncated {} characters ...]\n".format(ioutputsize - 7)\
+    + 'xxxxxxxend', "STDOUT was not retained correctly"
+
+  #The Messages about the Timeout are not truncated
+  cmdtest = Command("{} -c \"import sys, time; sys.stderr.write('e' * {}); sys.stderr.flush(); time.sleep(30)\""\
+    .format(sys.executable, ioutputsize), {'errorretention': {'policy': 'tail', 'tail': 10}, 'timeout': 1})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+  #The Retention Policy cannot be changed while the Child Process is running
+  cmdtest.setErrorRetention('all')
+  cmdtest.setDictOptions({'retention': {'policy': 'all'}})
+
+  assert not cmdtest.Wait(), "command '{}': Timeout was not applied!".format(cmdtest.command_line)
+
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.error.startswith("\n[... truncated {} characters ...]\n".format(ioutputsize - 10)\
+    + 'e' * 10), "STDERR was not retained correctly"
+  assert re.search("Execution timed out!\nExecution Time '[^']+'\nProcess will be terminated.\n"\
+  , cmdtest.error) is not None, "STDERR does not report the Timeout"
+
+  #The Messages keep their Order within the STDERR Output
+  cmdtest = Command("{} -c \"import sys, time, signal; signal.signal(signal.SIGTERM, lambda *args : (sys.stderr.write('after'), sys.exit(1))); sys.stderr.write('before'); sys.stderr.flush(); time.sleep(30)\""\
+    .format(sys.executable), {'errorretention': {'policy': 'tail', 'tail': 20}, 'timeout': 1})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert not cmdtest.Wait(), "command '{}': Timeout was not applied!".format(cmdtest.command_line)
+
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.error.startswith("beforeSub Process"), "Timeout was not reported after the STDERR Output"
+  assert cmdtest.error.endswith("Process terminating ...\nafter"), "Timeout was not reported before the STDERR Output"
+  assert cmdtest.error is cmdtest.error, "STDERR was joined again"
+
+  print("")
+
+
+
+def test_OutputSpool(tmp_path):
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  ioutputsize = 1048576
+
+  cmdtest = Command("{} -c \"import sys; sys.stdout.buffer.write(b'x' * {} + b'end')\""\
+    .format(sys.executable, ioutputsize)\
+    , {'binary': True, 'reportspool': {'threshold': 65536}})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report_spooled, "STDOUT was not spooled"
+  assert not cmdtest.error_spooled, "STDERR was spooled"
+  assert cmdtest.report_bytes == b'x' * ioutputsize + b'end', "STDOUT is not correct"
+
+  mreport = cmdtest.getReportMap()
+
+  assert len(mreport) == ioutputsize + 3, "STDOUT Map Size is not correct"
+  assert mreport[-3:] == b'end', "STDOUT Map is not correct"
+
+  mreport.close()
+
+  with cmdtest.getReportFile() as freport :
+    assert freport.read(4) == b'xxxx', "STDOUT File is not correct"
+
+    #Each Reader has its own File Position
+    with cmdtest.getReportFile() as fsecond :
+      assert fsecond.read(4) == b'xxxx', "STDOUT File Position is shared"
+
+      fsecond.seek(-3, os.SEEK_END)
+
+      assert fsecond.read() == b'end', "STDOUT File is not correct"
+      assert os.lseek(freport.fileno(), 0, os.SEEK_CUR) < ioutputsize, "STDOUT File Position is shared"
+
+  spoolpath = tmp_path / 'report.spool'
+
+  cmdtest = Command("{} -c \"import sys; sys.stdout.buffer.write('\\u00e4'.encode('utf-8') * {})\""\
+    .format(sys.executable, ioutputsize)\
+    , {'encoding': 'utf-8', 'reportspool': {'threshold': 1000, 'path': str(spoolpath)}})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  assert cmdtest.report_spooled, "STDOUT was not spooled"
+  assert cmdtest.report == 'ä' * ioutputsize, "STDOUT is not correct"
+  assert spoolpath.stat().st_size == ioutputsize * 2, "STDOUT Spool File is not correct"
+
+  print("")
+
+
+
+def test_OutputTarget(tmp_path):
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  ioutputsize = 1048576
+  rptpath = tmp_path / 'report.log'
+  errpath = tmp_path / 'error.log'
+
+  cmdtest = Command("{} -c \"import sys; sys.stdout.write('x' * {} + 'end'); sys.stderr.write('failed')\""\
+    .format(sys.executable, ioutputsize)\
+    , {'stdout': str(rptpath), 'stderr': str(errpath)})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report == '', "STDOUT was captured"
+  assert cmdtest.error == '', "STDERR was captured"
+  assert rptpath.read_text() == 'x' * ioutputsize + 'end', "STDOUT File is not correct"
+  assert errpath.read_text() == 'failed', "STDERR File is not correct"
+
+  with open(str(errpath), 'wb') as ferror :
+    cmdtest = Command("{} -c \"import sys; sys.stdout.write('x' * {} + 'end'); sys.stderr.write('failed')\""\
+      .format(sys.executable, ioutputsize)\
+      , {'stdout': str(rptpath), 'stderr': ferror.fileno(), 'tee': 16})
+
+    assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+    assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("STDOUT: '{}'".format(cmdtest.report))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report_size == ioutputsize + 3, "STDOUT Size was not counted exactly"
+  assert cmdtest.report.endswith('x' * 13 + 'end'), "STDOUT Tail is not correct"
+  assert len(cmdtest.report) < 64, "STDOUT was not limited to the Tail"
+  assert cmdtest.error == 'failed', "STDERR Tail is not correct"
+  assert rptpath.read_text() == 'x' * ioutputsize + 'end', "STDOUT File is not correct"
+  assert errpath.read_text() == 'failed', "STDERR File is not correct"
+
+  #The Retention Policy is only limited for the Launch in Tee Mode
+  cmdtest.setReportTarget(None)
+  cmdtest.setErrorTarget(None)
+  cmdtest.setTee(False)
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  assert cmdtest.report.endswith('x' * ioutputsize + 'end'), "STDOUT Retention Policy was not restored"
+
+  #The Tail starts within a Multi-Byte Character
+  cmdtest = Command("printf 'x\\303\\251\\303\\251'"\
+    , {'stdout': str(rptpath), 'tee': 3, 'errors': 'strict'})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("STDOUT: '{}'".format(cmdtest.report))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report == '\u00e9', "STDOUT Tail is not correct"
+  assert rptpath.read_text() == 'x\u00e9\u00e9', "STDOUT File is not correct"
+
+  print("")
+
+
+
+def test_StreamingOutput():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  arrhandled = []
+
+  cmdtest = Command("{} -c \"import sys, time; sys.stdout.write('first li'); sys.stdout.flush();"\
+    " time.sleep(0.2); sys.stdout.write('ne\\nsecond line\\nla'); sys.stdout.flush(); time.sleep(0.2);"\
+    " sys.stderr.write('error\\n'); sys.stdout.write('st')\"".format(sys.executable)\
+    , {'onstderr': arrhandled.append})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+  arrlines = list(cmdtest.iterLines())
+
+  print("LINES: '{}'".format(arrlines))
+  print("HANDLED: '{}'".format(arrhandled))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert [sln for ifd, sln in arrlines if ifd == 1] == ['first line\n', 'second line\n', 'last']\
+  , "STDOUT Lines are not correct"
+  assert [sln for ifd, sln in arrlines if ifd == 2] == ['error\n'], "STDERR Lines are not correct"
+  assert ''.join(arrhandled) == 'error\n', "STDERR Handler was not called"
+  assert cmdtest.report == 'first line\nsecond line\nlast', "STDOUT is not correct"
+
+  cmdtest = Command("{} -c \"import sys; sys.stdout.buffer.write(b'x' * 100000)\"".format(sys.executable)\
+    , {'binary': True})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+  arrchunks = [scnk for ifd, scnk in cmdtest.iterChunks()]
+
+  assert b''.join(arrchunks) == b'x' * 100000, "STDOUT Chunks are not correct"
+
+  print("")
+
+
+
+def test_ReportCache():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  arrreports = []
+
+  cmdtest = Command("{} -c \"import sys, time; sys.stdout.buffer.write(b'first \\xc3'); sys.stdout.flush();"\
+    " time.sleep(0.2); sys.stdout.buffer.write(b'\\xa4 second'); sys.stdout.flush()\"".format(sys.executable)\
+    , {'binary': True, 'encoding': 'utf-8'})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+  for ifd, scnk in cmdtest.iterChunks() :
+    arrreports.append(cmdtest.report)
+
+  print("REPORTS: '{}'".format(arrreports))
+
+  assert cmdtest.report is cmdtest.report, "STDOUT was joined again without new Output"
+  assert arrreports[0] in ('first ', 'first �'), "STDOUT is not correct while running"
+  assert cmdtest.report == 'first ä second', "STDOUT is not correct"
+  assert cmdtest.report_bytes == 'first ä second'.encode('utf-8'), "STDOUT Bytes are not correct"
+
+  cmdtest.clearErrors()
+
+  assert cmdtest.report == '', "STDOUT was not cleared"
+
+  print("")
+
+
+
+def test_InputFeed(tmp_path):
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  ichunksize = 65536
+  ichunkcount = 128
+  scopy = "{} -c \"import sys, shutil; shutil.copyfileobj(sys.stdin.buffer, sys.stdout.buffer)\""\
+    .format(sys.executable)
+
+  #The Input is larger than the Pipe Buffers in both Directions
+  rs = runCommandWithOptions({'command': scopy, 'binary': True\
+    , 'stdin': (b'x' * ichunksize for i in range(ichunkcount))})
+
+  print("EXIT CODE: '{}'".format(rs[2]))
+
+  assert rs[2] == 0, "EXIT CODE is not correct"
+  assert rs[0] == b'x' * ichunksize * ichunkcount, "STDOUT is not correct"
+
+  rs = runCommand(scopy, {'stdin': 'input text'})
+
+  assert rs[0] == 'input text', "STDOUT is not correct"
+
+  inputpath = tmp_path / 'input.txt'
+
+  inputpath.write_text('input file')
+
+  with open(str(inputpath), 'rb') as finput :
+    rs = runCommand(scopy, {'stdin': finput})
+
+  assert rs[0] == 'input file', "STDOUT is not correct"
+
+  #The Child Process does not read its Input
+  cmdtest = Command("{} -c \"print('done')\"".format(sys.executable)\
+    , {'stdin': (b'x' * ichunksize for i in range(ichunkcount))})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report == 'done\n', "STDOUT is not correct"
+
+  print("")
+
+
+
+def test_SpawnLauncher():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  rs = runCommand("{} -c \"import sys; sys.stdout.write(sys.stdin.read())\"".format(sys.executable)\
+    , {'launcher': 'spawn', 'stdin': 'spawned'})
+
+  print("EXIT CODE: '{}'".format(rs[2]))
+
+  assert rs[2] == 0, "EXIT CODE is not correct"
+  assert rs[0] == 'spawned', "STDOUT is not correct"
+
+  cmdtest = Command("{}noexec_script.py".format(sdirectory), {'launcher': 'spawn'})
+
+  assert not cmdtest.Launch(), "script 'noexec_script.py': Launch succeeded!"
+
+  print("ERROR CODE: '{}'".format(cmdtest.code))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.code == 1, "ERROR CODE is not correct"
+  assert re.search('permission denied', cmdtest.error, re.IGNORECASE) is not None\
+  , "STDERR does not report the Launch Error"
+
+  print("")
+
+
+
+
+
+def test_MonotonicProfiling():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdtest = Command("sleep 0.2", {'profiling': True, 'timeout': 5})
+
+  itmstrt = time.time()
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+  assert cmdtest.deadline - time.monotonic_ns() > 4000000000, "Deadline is not on the Monotonic Clock"
+
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("Execution Time: '{}' ns".format(cmdtest.execution_time_ns))
+  print("Start Time: '{}'; End Time: '{}'".format(cmdtest.start_time, cmdtest.end_time))
+
+  assert isinstance(cmdtest.execution_time_ns, int), "Execution Time is not in Nanoseconds"
+  assert cmdtest.execution_time_ns >= 200000000, "Measured Time is less than the Pause"
+  assert cmdtest.execution_time == cmdtest.execution_time_ns / 1000000000\
+  , "Execution Time in Seconds is not correct"
+  assert itmstrt <= cmdtest.start_time <= cmdtest.end_time, "Wall Clock Times are not correct"
+
+  print("")
+
+
+def test_ResourceUsage():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdtest = Command("{} -c \"import time; x = bytearray(32 * 1048576); t = time.time()\nwhile time.time() - t < 0.5 : pass\""\
+    .format(sys.executable), {'sampling': 0.1})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  usage = cmdtest.resource_usage
+
+  print("Resource Usage: '{}'".format(usage))
+  print("Last Sample: '{}'".format(cmdtest.sample))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert usage['utime'] + usage['stime'] > 0.2, "CPU Time was not recorded"
+  assert usage['maxrss'] >= 32 * 1048576, "Maximal Resident Set Size was not recorded"
+  assert usage['minflt'] > 0, "Page Faults were not recorded"
+
+  if os.path.isdir('/proc/self') :
+    assert usage['rss_peak'] >= 32 * 1048576, "Resident Set Size was not sampled"
+    assert usage['cpu_peak'] > 10, "CPU Usage was not sampled"
+    assert 'cputime' in cmdtest.sample, "Sample is not correct"
+
+  print("")
+
+
+def test_ResourceLimits():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  #The Limits are applied before the Command starts
+  cmdtest = Command("sh -c 'ulimit -n; ulimit -t; nice'"\
+    , {'limits': {'rlimits': {'nofile': 64, 'cpu': (10, 20)}, 'nice': 5, 'affinity': {0}, 'ionice': 'unknown'\
+    , 'nofile': 64}})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+  assert os.sched_getaffinity(cmdtest.getProcessID()) == {0}, "CPU Affinity was not applied"
+
+  assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+  print("STDOUT: '{}'".format(cmdtest.report))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report.split() == ['64', '10', '5'], "Resource Limits were not applied"
+  assert re.search("Limit ionice: could not be applied", cmdtest.error) is not None\
+  , "STDERR does not report the invalid Limit"
+  assert re.search("Limit nofile: is not recognized", cmdtest.error) is not None\
+  , "STDERR does not report the unknown Limit"
+
+  cmdtest = Command("no_such_command", {'limits': {'nice': 5}})
+
+  assert not cmdtest.Launch(), "command '{}': Launch did not fail!".format(cmdtest.command_line)
+
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.code == 1, "ERROR CODE is not correct"
+  assert re.search("Launch failed with FileNotFoundError", cmdtest.error) is not None\
+  , "STDERR does not report the failed Launch"
+
+  print("")
+
+
+def _isProcessAlive(ipid):
+  try :
+    with open("/proc/{}/stat".format(ipid), 'r') as fstat :
+      #Zombie Processes have already finished
+      return fstat.read().rsplit(')', 1)[1].split()[0] != 'Z'
+
+  except OSError :
+    return False
+
+
+def test_SessionTimeout():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  for slauncher in ('popen', 'forkserver') :
+    cmdtest = Command("sh -c 'sleep 30 & echo $!; wait'"\
+    , {'session': True, 'timeout': 1, 'launcher': slauncher})
+
+    assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+    assert not cmdtest.Wait(), "command '{}': Timeout was not applied!".format(cmdtest.command_line)
+
+    print("STDOUT: '{}'".format(cmdtest.report))
+    print("STDERR: '{}'".format(cmdtest.error))
+
+    itmend = time.monotonic() + 2
+
+    while _isProcessAlive(int(cmdtest.report)) \
+    and time.monotonic() < itmend :
+      time.sleep(0.05)
+
+    assert not _isProcessAlive(int(cmdtest.report))\
+    , "launcher '{}': Forked Process survived the Timeout".format(slauncher)
+
+    cmdtest.freeResources()
+
+  #for slauncher in ('popen', 'forkserver')
+
+  print("")
+
+
+def test_SessionStraggler():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  for slauncher in ('popen', 'forkserver') :
+    cmdtest = Command("sh -c 'sleep 30 > /dev/null 2>&1 & echo $!'"\
+    , {'session': True, 'launcher': slauncher})
+
+    assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+    assert cmdtest.Wait(), "command '{}': Execution failed!".format(cmdtest.command_line)
+
+    print("STDOUT: '{}'".format(cmdtest.report))
+    print("STDERR: '{}'".format(cmdtest.error))
+
+    assert cmdtest.status == 0, "EXIT CODE is not correct"
+
+    itmend = time.monotonic() + 2
+
+    while _isProcessAlive(int(cmdtest.report)) \
+    and time.monotonic() < itmend :
+      time.sleep(0.05)
+
+    assert not _isProcessAlive(int(cmdtest.report))\
+    , "launcher '{}': Forked Process survived the Child Process".format(slauncher)
+
+    cmdtest.freeResources()
+
+  #for slauncher in ('popen', 'forkserver')
+
+  print("")
+
+
+def test_GracePeriod():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdtest = Command("sh -c 'trap \"\" TERM; sleep 30'", {'timeout': 1, 'grace': 0.5})
+
+  itmstart = time.monotonic()
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+  assert not cmdtest.Wait(), "command '{}': Timeout was not applied!".format(cmdtest.command_line)
+
+  itmrng = time.monotonic() - itmstart
+
+  print("STDERR: '{}'".format(cmdtest.error))
+  print("Execution Time: '{}'".format(itmrng))
+
+  assert itmrng >= 1.5, "Process was killed before the Grace Period"
+  assert itmrng < 5, "Process was not killed after the Grace Period"
+  assert re.search("Process killing", cmdtest.error) is not None, "Process was not killed"
+  #The killed Process was reaped with its real Exit Status
+  assert cmdtest.status == -signal.SIGKILL, "EXIT CODE of the killed Process is not correct"
+  assert cmdtest.resource_usage != {}, "Killed Process was not reaped"
+
+  print("")
+
+
+def test_GracePeriodTerminated():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  for options in ({}, {'readtimeout': 1}, {'session': True}, {'blocking': True}) :
+    options.update({'timeout': 0.5, 'grace': 2})
+
+    cmdtest = Command("sleep 10", options)
+
+    assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+    assert not cmdtest.Wait(), "command '{}': Timeout was not applied!".format(cmdtest.command_line)
+
+    print("STDERR: '{}'".format(cmdtest.error))
+
+    #The Child Process exits on SIGTERM within the Grace Period
+    assert cmdtest.status == -15, "options {}: Process was not terminated".format(options)
+    assert re.search("Process killing", cmdtest.error) is None\
+    , "options {}: Process was killed".format(options)
+
+  #for options in ({}, {'readtimeout': 1}, {'session': True}, {'blocking': True})
+
+  print("")
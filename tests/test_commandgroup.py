@@ -10,6 +10,7 @@ import sys
 import os
 import time
 import re
+import signal
 from re import IGNORECASE
 
 sys.path.append("./")
@@ -17,6 +18,7 @@ sys.path.append("../")
 
 from libcommand import Command
 from libcommand import CommandGroup
+from libcommand import CorePlacement
 
 
 
@@ -123,3 +125,307 @@ def test_CommandGroupRun():
 
 
 
+def test_CommandGroupSharedSelector():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  stestscript = 'command_script.py'
+
+  cmdgrp = CommandGroup();
+  icmdcnt = 10
+  imaxpause = 1
+
+  for icmd in range(0, icmdcnt) :
+    cmdgrp.addsCommandLine("{}{} {}".format(sdirectory, stestscript, imaxpause)\
+    , {'name': "command-script:{}".format(icmd)})
+
+  assert cmdgrp.len == icmdcnt, "scripts (count: '{}'): were not added correctly".format(cmdgrp.len)
+
+  itmstrt = time.time()
+
+  assert cmdgrp.Run(), "Command Group Execution: Execution was not correct"
+
+  itm = int(time.time() - itmstrt)
+
+  print("Command Group Execution Time '{} / {}' s".format(itm, imaxpause))
+
+  assert itm == imaxpause, "Command Group Execution longer than maximal Execution Time '{}' s"\
+  .format(imaxpause)
+
+  for icmd in range(0, icmdcnt) :
+    cmd = cmdgrp.getiCommand(icmd)
+
+    assert cmd.isSharedSelector(), "Command {}: Selector is not shared".format(cmd.getNameComplete())
+    assert cmd.status == 0, "Command {}: EXIT CODE is not correct".format(cmd.getNameComplete())
+    assert re.search("END 1", cmd.report) is not None\
+    , "Command {}: STDOUT was not captured".format(cmd.getNameComplete())
+    assert re.search("END 1 ERROR", cmd.error) is not None\
+    , "Command {}: STDERR was not captured".format(cmd.getNameComplete())
+
+  #for icmd in range(0, icmdcnt)
+
+  cmdgrp.freeResources()
+
+  print("")
+
+
+
+
+
+
+def test_CommandGroupCommandTimeout():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdgrp = CommandGroup()
+  icmdcnt = 4
+
+  for icmd in range(0, icmdcnt) :
+    #Every second Command has its own Execution Timeout
+    cmdgrp.addsCommandLine("sleep {}".format(1 + icmd % 2 * 9)\
+    , {'name': "sleep:{}".format(icmd), 'timeout': 1 if icmd % 2 == 1 else -1})
+
+  itmstrt = time.monotonic()
+
+  assert not cmdgrp.Run(), "Command Group Execution: Timeouts were not reported"
+
+  itm = time.monotonic() - itmstrt
+
+  print("Command Group Execution Time '{:.3f}' s".format(itm))
+  print("STDERR: '{}'".format(cmdgrp.error))
+
+  assert itm < 3, "Command Group did not terminate the Commands at their Execution Timeout"
+  assert cmdgrp.timeouts == icmdcnt // 2, "Count of timed out Commands is not correct"
+  assert cmdgrp.code == 4, "ERROR CODE is not correct"
+
+  for icmd in range(0, icmdcnt) :
+    cmd = cmdgrp.getiCommand(icmd)
+
+    if icmd % 2 == 1 :
+      assert cmd.code == 4, "Command {}: ERROR CODE is not correct".format(cmd.getNameComplete())
+      assert cmd.status != 0, "Command {}: was not terminated".format(cmd.getNameComplete())
+      assert re.search("Execution timed out", cmd.error) is not None\
+      , "Command {}: STDERR does not report the Timeout".format(cmd.getNameComplete())
+    else :
+      assert cmd.status == 0, "Command {}: EXIT CODE is not correct".format(cmd.getNameComplete())
+
+  #for icmd in range(0, icmdcnt)
+
+  cmdgrp.freeResources()
+
+  print("")
+
+
+
+def test_CommandGroupChangedTimeout():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdgrp = CommandGroup()
+
+  cmdgrp.addsCommandLine("sleep 10", {'name': "sleep:first", 'timeout': 4})
+  cmdgrp.addsCommandLine("sleep 10", {'name': "sleep:lowered", 'timeout': 8, 'profiling': True})
+
+  assert cmdgrp.Launch() == 2, "Command Group Launch failed"
+
+  #The lowered Execution Timeout is reached before the nearest Deadline of the Heap
+  cmdgrp.getiCommand(1).setTimeout(1)
+
+  assert not cmdgrp.Wait(), "Command Group Execution: Timeouts were not reported"
+
+  cmd = cmdgrp.getiCommand(1)
+
+  print("Execution Time: '{}' ns".format(cmd.execution_time_ns))
+  print("STDERR: '{}'".format(cmdgrp.error))
+
+  assert cmd.execution_time_ns < 3000000000, "Lowered Execution Timeout was not enforced in time"
+  assert cmdgrp.timeouts == 2, "Count of timed out Commands is not correct"
+
+  cmdgrp.freeResources()
+
+  print("")
+
+
+
+def test_CommandGroupResourceUsage():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdgrp = CommandGroup({'sampling': 0.1})
+  icmdcnt = 3
+
+  for icmd in range(0, icmdcnt) :
+    cmdgrp.addsCommandLine("{} -c \"import time; t = time.time()\nwhile time.time() - t < 0.3 : pass\""\
+    .format(sys.executable), {'name': "busy:{}".format(icmd)})
+
+  assert cmdgrp.Run(), "Command Group Execution: Execution was not correct"
+
+  usage = cmdgrp.resource_usage
+
+  print("Resource Usage: '{}'".format(usage))
+
+  assert usage['processes'] == icmdcnt, "Count of Processes is not correct"
+  assert usage['utime'] == sum(cmdgrp.getiCommand(icmd).resource_usage['utime'] for icmd in range(0, icmdcnt))\
+  , "CPU Time was not summed up"
+  assert usage['utime'] + usage['stime'] > 0.2, "CPU Time was not recorded"
+  assert usage['maxrss'] == max(cmdgrp.getiCommand(icmd).resource_usage['maxrss'] for icmd in range(0, icmdcnt))\
+  , "Maximal Resident Set Size is not the Maximum of the Commands"
+
+  for icmd in range(0, icmdcnt) :
+    assert cmdgrp.getiCommand(icmd).sample_interval == 0.1\
+    , "Command No. {}: Sample Interval was not set".format(icmd)
+
+  cmdgrp.freeResources()
+
+  print("")
+
+
+
+def test_CommandGroupLimits():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdgrp = CommandGroup({'limits': {'nice': 3, 'rlimits': {'nofile': 128}}})
+
+  cmdgrp.addsCommandLine("sh -c 'sleep 0.1; nice; ulimit -n'")
+  cmdgrp.addsCommandLine("sh -c 'sleep 0.1; nice; ulimit -n'", {'limits': {'nice': 7}})
+
+  assert cmdgrp.Run(), "Command Group Execution: Execution was not correct"
+
+  print("STDOUT: '{}' / '{}'".format(cmdgrp.getiCommand(0).report, cmdgrp.getiCommand(1).report))
+
+  assert cmdgrp.getiCommand(0).report.split() == ['3', '128'], "Group Limits were not applied"
+  assert cmdgrp.getiCommand(1).report.split() == ['7', '128'], "Command Limits did not take Precedence"
+  assert cmdgrp.getiCommand(0).getLimits() == {}, "Group Limits were kept in the Limits"
+
+  cmdgrp.freeResources()
+
+  print("")
+
+
+
+def test_CorePlacementPolicies():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  topology = {0: [0, 1], 1: [2, 3]}
+
+  #Not launched Command Objects do not keep their Cores busy
+  arrcmds = [Command("sleep 1") for icmdidx in range(0, 5)]
+
+  placement = CorePlacement('roundrobin', topology)
+
+  assert [placement.Assign(cmd)['cpus'] for cmd in arrcmds] == [[0], [1], [2], [3], [0]]\
+  , "Round Robin Placement is not correct"
+
+  placement = CorePlacement('spread', topology)
+
+  assert placement.Assign(arrcmds[0]) == {'node': 0, 'cpus': [0, 1]}, "Spread Placement is not correct"
+
+  placement = CorePlacement('pack', topology)
+
+  assert placement.Assign(arrcmds[0]) == {'node': 0, 'cpus': [0]}, "Pack Placement is not correct"
+
+  try :
+    CorePlacement('unknown', topology)
+
+    assert False, "Unknown Placement Policy was accepted"
+  except ValueError :
+    pass
+
+  print("")
+
+
+def test_CommandGroupPlacement():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdgrp = CommandGroup({'placement': 'pack'})
+
+  arrcpus = sorted(os.sched_getaffinity(0))
+
+  for icmdidx in range(0, 3) :
+    cmdgrp.addsCommandLine("grep Cpus_allowed_list /proc/self/status")
+
+  cmdgrp.addsCommandLine("grep Cpus_allowed_list /proc/self/status", {'limits': {'affinity': arrcpus}})
+
+  assert cmdgrp.Run(), "Command Group Execution: Execution was not correct"
+
+  print("STDOUT: '{}'".format(cmdgrp.report))
+  print("STDERR: '{}'".format(cmdgrp.error))
+
+  for icmdidx in range(0, 3) :
+    assignment = cmdgrp.getiPlacement(icmdidx)
+
+    assert assignment is not None, "Child Process No. '{}' was not placed".format(icmdidx)
+    assert assignment['cpus'] == [arrcpus[icmdidx % len(arrcpus)]]\
+    , "Child Process No. '{}' was not packed".format(icmdidx)
+    assert cmdgrp.getiCommand(icmdidx).report.split()[-1] == str(assignment['cpus'][0])\
+    , "Child Process No. '{}' was not pinned".format(icmdidx)
+
+  #for icmdidx in range(0, 3)
+
+  assert cmdgrp.getiPlacement(3) is None, "Child Process with own Affinity was placed"
+  assert cmdgrp.getiCommand(0).getLimits() == {}, "Placement was kept in the Limits"
+
+  cmdgrp.freeResources()
+
+  try :
+    cmdgrp.setPlacement('round-robin')
+
+    assert False, "Unknown Placement Policy was accepted"
+  except ValueError :
+    pass
+
+  print("")
+
+
+def test_CommandGroupShutdown():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdgrp = CommandGroup({'timeout': 1, 'grace': 0.5, 'session': True})
+
+  for icmdidx in range(0, 20) :
+    cmdgrp.addsCommandLine("sh -c 'trap \"echo bye; exit 3\" TERM; echo start; sleep 30 & wait'")
+    cmdgrp.addsCommandLine("sh -c 'trap \"\" TERM; echo stuck; sleep 30'")
+
+  itmstart = time.monotonic()
+
+  assert not cmdgrp.Run(), "Command Group Execution: Timeout was not applied"
+
+  itmrng = time.monotonic() - itmstart
+
+  print("Execution Time: '{}'".format(itmrng))
+  print("STDERR: '{}'".format(cmdgrp.error))
+
+  #The Grace Period runs for all Child Processes at once
+  assert itmrng < 4, "Command Group Shutdown was not concurrent"
+  assert cmdgrp.getRunningCount() == 0, "Child Processes are still running"
+
+  for icmdidx in range(0, 40, 2) :
+    cmd = cmdgrp.getiCommand(icmdidx)
+
+    assert cmd.report == "start\nbye\n", "Final Output of No. '{}' was lost".format(icmdidx)
+    assert cmd.status == 3, "No. '{}' did not exit on SIGTERM".format(icmdidx)
+    assert cmdgrp.getiCommand(icmdidx + 1).status == -signal.SIGKILL, "No. '{}' was not killed".format(icmdidx + 1)
+    assert cmdgrp.getiCommand(icmdidx + 1).report == "stuck\n"\
+    , "Final Output of No. '{}' was lost".format(icmdidx + 1)
+    assert cmdgrp.getiCommand(icmdidx + 1).resource_usage != {}\
+    , "No. '{}' was not reaped".format(icmdidx + 1)
+
+  #for icmdidx in range(0, 40, 2)
+
+  cmdgrp.freeResources()
+
+  cmdgrp = CommandGroup()
+
+  for icmdidx in range(0, 20) :
+    cmdgrp.addsCommandLine("sh -c 'trap \"\" TERM; sleep 30'", {'timeout': 0.5, 'grace': 0.5})
+
+  itmstart = time.monotonic()
+
+  assert not cmdgrp.Run(), "Command Group Execution: Command Timeouts were not applied"
+
+  itmrng = time.monotonic() - itmstart
+
+  print("Execution Time: '{}'".format(itmrng))
+
+  assert itmrng < 4, "Command Timeouts were not escalated concurrently"
+  assert cmdgrp.timeouts == 20, "Command Timeouts were not counted"
+
+  cmdgrp.freeResources()
+
+  print("")
@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+'''
+Tests to verify the CommandPool Class Functionality
+
+@version: 2026-10-18
+
+@author: Bodo Hugo Barwich
+'''
+import sys
+import os
+import time
+import re
+
+sys.path.append("./")
+sys.path.append("../")
+
+from libcommand import Command
+from libcommand import CommandPool
+
+
+
+sdirectory = os.getcwd() + '/'
+smodule = ''
+stestscript = 'quiet_script.py'
+itestpause = 1
+
+spath = os.path.abspath(__file__);
+
+print("test script absolute path: '{}'".format(spath))
+
+slashpos = spath.rfind('/', 0)
+
+if slashpos != -1 :
+  sdirectory = spath[0 : slashpos + 1]
+  smodule = spath[slashpos + 1 : len(spath)]
+else :
+  smodule = spath
+
+print("Test Directory: '{}'".format(sdirectory))
+print("Test Module: '{}'".format(smodule))
+
+
+
+def test_CommandPoolRun():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  icmdcnt = 6
+  iworkers = 2
+  imaxpause = int(icmdcnt / iworkers) * itestpause
+
+  cmdpool = CommandPool({'workers': iworkers})
+
+  for icmd in range(0, icmdcnt) :
+    if icmd % 2 == 0 :
+      cmdpool.addsCommandLine("{}{} {} {}".format(sdirectory, stestscript, itestpause, icmd)\
+      , {'name': "quiet-script:{}".format(icmd)})
+    else :
+      cmdpool.Add(Command("{}{} {} {}".format(sdirectory, stestscript, itestpause, icmd)\
+      , {'name': "quiet-script:{}".format(icmd)}))
+
+  #for icmd in range(0, icmdcnt)
+
+  assert cmdpool.len == icmdcnt, "scripts (count: '{}'): were not added correctly".format(cmdpool.len)
+  assert cmdpool.queued == icmdcnt, "scripts (count: '{}'): were not queued".format(cmdpool.queued)
+
+  itmstrt = time.time()
+
+  assert cmdpool.Launch() == iworkers, "Command Pool: Launch did not fill the Worker Slots"
+  assert cmdpool.running == iworkers, "Command Pool: More Child Processes running than Workers"
+  assert cmdpool.queued == icmdcnt - iworkers, "Command Pool: Launched Processes are still queued"
+
+  assert cmdpool.Wait(), "Command Pool Execution: Execution was not correct"
+
+  itm = int(time.time() - itmstrt)
+
+  print("Command Pool Execution Time '{} / {}' s".format(itm, imaxpause))
+  print("Command Pool Throughput '{}' / s".format(cmdpool.throughput))
+  print("Command Pool STDOUT:\n'{}'".format(cmdpool.report))
+
+  assert itm == imaxpause, "Command Pool Execution longer than maximal Execution Time '{}' s"\
+  .format(imaxpause)
+  assert cmdpool.queued == 0, "Command Pool: Not all Commands were launched"
+  assert cmdpool.launched == icmdcnt, "Command Pool: Launched Count is not correct"
+  assert cmdpool.completed == icmdcnt, "Command Pool: Completed Count is not correct"
+  assert cmdpool.failed == 0, "Command Pool: Failed Count is not correct"
+  assert cmdpool.throughput > 0, "Command Pool: Throughput was not measured"
+
+  for icmd in range(0, icmdcnt) :
+    cmd = cmdpool.getiCommand(icmd)
+
+    assert cmd.status == icmd, "Command {}: EXIT CODE is not correct".format(cmd.getNameComplete())
+
+  #for icmd in range(0, icmdcnt)
+
+  cmdpool.freeResources()
+
+  print("")
+
+
+def test_CommandPoolLaunchFailed():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  cmdpool = CommandPool({'workers': 1})
+
+  cmdpool.addsCommandLine("{}{}".format(sdirectory, 'no_script.sh'))
+  cmdpool.addsCommandLine("{}{} {}".format(sdirectory, stestscript, 0))
+
+  assert cmdpool.Run(), "Command Pool Execution: Execution was not correct"
+
+  print("Command Pool STDERR:\n'{}'".format(cmdpool.error))
+
+  assert cmdpool.failed == 1, "Command Pool: Failed Count is not correct"
+  assert cmdpool.completed == 1, "Command Pool: Completed Count is not correct"
+  assert cmdpool.code == 1, "Command Pool: ERROR CODE '1' was not returned"
+  assert re.search('Launch failed', cmdpool.error) is not None, "STDERR does not report the Launch Error"
+
+  print("")
+
+
+
@@ -0,0 +1,175 @@
+#!/usr/bin/python3
+'''
+Tests to verify the ForkServer Class Functionality
+
+@version: 2026-10-18
+
+@author: Bodo Hugo Barwich
+'''
+import sys
+import os
+import re
+import signal
+import socket
+
+sys.path.append("./")
+sys.path.append("../")
+
+from libcommand import Command
+from libcommand import CommandGroup
+from libcommand import ForkServer
+from libcommand import WorkerPool
+from libcommand import runCommand
+from libcommand.forkserver import decodeWaitStatus
+
+
+
+sdirectory = os.path.dirname(os.path.abspath(__file__)) + '/'
+
+
+
+def test_ForkServerRun():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  forkserver = ForkServer()
+
+  cmdtest = Command("{} -c \"import sys; sys.stdout.write(sys.stdin.read()); sys.stderr.write('error'); sys.exit(3)\""\
+    .format(sys.executable), {'forkserver': forkserver, 'stdin': 'input'})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+  assert forkserver.running, "Fork Server was not launched"
+
+  cmdtest.Wait()
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("STDOUT: '{}'".format(cmdtest.report))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.status == 3, "EXIT CODE is not correct"
+  assert cmdtest.report == 'input', "STDOUT is not correct"
+  assert cmdtest.error == 'error', "STDERR is not correct"
+
+  cmdtest = Command("{}noexec_script.py".format(sdirectory), {'forkserver': forkserver})
+
+  assert not cmdtest.Launch(), "script 'noexec_script.py': Launch succeeded!"
+
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.code == 1, "ERROR CODE is not correct"
+  assert re.search('permission denied', cmdtest.error, re.IGNORECASE) is not None\
+  , "STDERR does not report the Launch Error"
+
+  #The Environment is taken at each Launch
+  os.environ['FORKSERVER_TEST'] = 'launch'
+
+  try :
+    for limits in ({}, {'nice': 1}) :
+      cmdtest = Command("sh -c 'echo $FORKSERVER_TEST'", {'forkserver': forkserver, 'limits': limits})
+
+      assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+      cmdtest.Wait()
+
+      assert cmdtest.report == "launch\n", "Environment was not passed with Limits {}".format(limits)
+
+  finally :
+    del os.environ['FORKSERVER_TEST']
+
+  forkserver.Stop()
+
+  assert not forkserver.running, "Fork Server was not stopped"
+
+  print("")
+
+
+def test_ForkServerGroup():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  icmdcnt = 4
+
+  cmdgroup = CommandGroup({'launcher': 'forkserver', 'timeout': 3})
+
+  for icmd in range(0, icmdcnt) :
+    cmdgroup.addsCommandLine("{} -c \"import sys; print({}); sys.exit({})\"".format(sys.executable, icmd, icmd))
+
+  cmdgroup.addsCommandLine("sleep 10")
+
+  assert not cmdgroup.Run(), "Group did not time out"
+
+  for icmd in range(0, icmdcnt) :
+    cmd = cmdgroup.getiCommand(icmd)
+
+    assert cmd.status == icmd, "EXIT CODE of No. {} is not correct".format(icmd)
+    assert cmd.report == "{}\n".format(icmd), "STDOUT of No. {} is not correct".format(icmd)
+
+  assert cmdgroup.getiCommand(icmdcnt).status != 0, "Timed out Command was not terminated"
+
+  rs = runCommand("echo forked", {'launcher': 'forkserver'})
+
+  assert rs == ['forked\n', '', 0], "runCommand() Result is not correct"
+
+  print("")
+
+
+
+
+
+def test_WaitStatus():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  ipid = os.fork()
+
+  if ipid == 0 :
+    os._exit(3)
+
+  assert decodeWaitStatus(os.waitpid(ipid, 0)[1]) == 3, "Exit Code is not correct"
+
+  ipid = os.fork()
+
+  if ipid == 0 :
+    os.kill(os.getpid(), signal.SIGKILL)
+
+  assert decodeWaitStatus(os.waitpid(ipid, 0)[1]) == -signal.SIGKILL, "Signal is not reported"
+
+  print("")
+
+
+
+def test_ForkServerUnsupported(monkeypatch):
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  #Python 3.8 and older cannot pass File Descriptors with socket.send_fds()
+  monkeypatch.delattr(socket, 'send_fds')
+
+  forkserver = ForkServer()
+
+  cmdtest = Command("echo forked", {'forkserver': forkserver})
+
+  assert not cmdtest.Launch(), "Launch through the Fork Server succeeded"
+
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert not forkserver.running, "Fork Server was launched"
+  assert re.search('requires Python 3.9', cmdtest.error) is not None\
+  , "STDERR does not report the missing Support"
+
+  #The Limits are applied after the Launch
+  cmdtest = Command("sh -c 'sleep 0.2; nice'", {'limits': {'nice': 2}})
+
+  assert cmdtest.Launch(), "command '{}': Launch failed!".format(cmdtest.command_line)
+
+  cmdtest.Wait()
+
+  assert cmdtest.report == "2\n", "Limits were not applied"
+
+  pool = WorkerPool()
+
+  pool.addsCommandLine("{}command_script.py".format(sdirectory))
+
+  assert pool.Launch() == 0, "Worker Pool launched an Entry Point"
+  assert re.search('requires Python 3.9', pool.error) is not None\
+  , "Worker Pool does not report the missing Support"
+
+  pool.freeResources()
+
+  print("")
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+'''
+Tests to verify the Pipeline Class Functionality
+
+@version: 2026-10-18
+
+@author: Bodo Hugo Barwich
+'''
+import sys
+import os
+
+sys.path.append("./")
+sys.path.append("../")
+
+from libcommand import Command
+from libcommand import Pipeline
+
+
+
+def test_PipelineRun():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  ioutputsize = 262144
+
+  pipeline = Pipeline({'pipesize': 1048576})
+
+  pipeline.addsCommandLine("{} -c \"import sys; sys.stdout.write('x\\n' * {})\""\
+    .format(sys.executable, ioutputsize // 2), {'name': 'producer'})
+  pipeline.addsCommandLine("{} -c \"import sys; [sys.stdout.write(sln.upper()) for sln in sys.stdin]\""\
+    .format(sys.executable), {'name': 'filter'})
+  pipeline.Add(Command("{} -c \"import sys; sys.stderr.write('consumer error'); print(len(sys.stdin.read()))\""\
+    .format(sys.executable), {'name': 'consumer'}))
+
+  assert pipeline.Run(), "Pipeline: Execution failed!"
+
+  print("STATUSES: '{}'".format(pipeline.statuses))
+  print("OUTPUT: '{}'".format(pipeline.output))
+  print("ERRORS: '{}'".format(pipeline.errors))
+
+  assert pipeline.statuses == [0, 0, 0], "EXIT CODES are not correct"
+  assert pipeline.status == 0, "EXIT CODE is not correct"
+  assert pipeline.output == "{}\n".format(ioutputsize), "STDOUT is not correct"
+  assert pipeline.getiCommand(0).report_size == 0, "STDOUT of the Producer was captured"
+  assert pipeline.errors == ['', '', 'consumer error'], "STDERR is not correct"
+  assert [cmd.getReportTarget() for cmd in (pipeline.getiCommand(0), pipeline.getiCommand(1))]\
+  == [None, None], "STDOUT Targets were not restored"
+  assert [cmd.getInput() for cmd in (pipeline.getiCommand(1), pipeline.getiCommand(2))]\
+  == [None, None], "STDIN Inputs were not restored"
+
+  print("")
+
+
+def test_PipelineFailure():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  pipeline = Pipeline()
+
+  pipeline.addsCommandLine("{} -c \"import sys; sys.stdout.write('data'); sys.exit(3)\"".format(sys.executable))
+  pipeline.addsCommandLine("{} -c \"import sys; sys.stdout.write(sys.stdin.read().upper())\"".format(sys.executable))
+
+  pipeline.Run()
+
+  print("STATUSES: '{}'".format(pipeline.statuses))
+  print("OUTPUT: '{}'".format(pipeline.output))
+
+  assert pipeline.statuses == [3, 0], "EXIT CODES are not correct"
+  assert pipeline.status == 3, "EXIT CODE is not correct"
+  assert pipeline.output == 'DATA', "STDOUT is not correct"
+
+  print("")
+
+
+
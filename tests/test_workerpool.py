@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+'''
+Tests to verify the WorkerPool Class Functionality
+
+@version: 2026-10-18
+
+@author: Bodo Hugo Barwich
+'''
+import sys
+import os
+
+sys.path.append("./")
+sys.path.append("../")
+
+from libcommand import WorkerPool
+from libcommand import PythonCommand
+from libcommand import ForkServer
+
+
+
+sdirectory = os.path.dirname(os.path.abspath(__file__)) + '/'
+
+
+
+def test_PythonCommand():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  forkserver = ForkServer(['json'])
+
+  cmdtest = PythonCommand("{}command_script.py 0 3".format(sdirectory), {'forkserver': forkserver})
+
+  assert cmdtest.Launch(), "script 'command_script.py': Launch failed!"
+
+  cmdtest.Wait()
+
+  print("EXIT CODE: '{}'".format(cmdtest.status))
+  print("STDOUT: '{}'".format(cmdtest.report))
+  print("STDERR: '{}'".format(cmdtest.error))
+
+  assert cmdtest.status == 3, "EXIT CODE is not correct"
+  assert "Argument List: ['{}command_script.py', '0', '3']".format(sdirectory) in cmdtest.report\
+  , "STDOUT does not report the Arguments"
+  assert "script 'command_script.py' START 0 ERROR" in cmdtest.error, "STDERR is not correct"
+
+  cmdtest = PythonCommand("json.tool", {'forkserver': forkserver, 'stdin': '{"worker": 1}'})
+
+  assert cmdtest.Launch(), "module 'json.tool': Launch failed!"
+
+  cmdtest.Wait()
+
+  assert cmdtest.status == 0, "EXIT CODE is not correct"
+  assert cmdtest.report == '{\n    "worker": 1\n}\n', "STDOUT is not correct"
+
+  forkserver.Stop()
+
+  print("")
+
+
+def test_WorkerPoolRun():
+  print("{} - go ...".format(sys._getframe().f_code.co_name))
+
+  icmdcnt = 6
+
+  cmdpool = WorkerPool({'workers': 2, 'preload': ['json'], 'quiet': True})
+
+  for icmd in range(0, icmdcnt) :
+    cmdpool.addsCommandLine("{}command_script.py 0 {}".format(sdirectory, icmd))
+
+  cmdpool.addsCommandLine("{}exception_script.py".format(sdirectory))
+  cmdpool.addsCommandLine("json:nothing")
+
+  assert cmdpool.Launch() == 2, "Pool did not fill the Worker Slots"
+  assert cmdpool.warm, "Helper Process was not launched"
+
+  cmdpool.Wait()
+
+  print("STDERR: '{}'".format(cmdpool.error))
+
+  for icmd in range(0, icmdcnt) :
+    cmd = cmdpool.getiCommand(icmd)
+
+    assert isinstance(cmd, PythonCommand), "No. {} is not a PythonCommand".format(icmd)
+    assert cmd.status == icmd, "EXIT CODE of No. {} is not correct".format(icmd)
+    assert "script 'command_script.py' START 0 ERROR" in cmd.error\
+    , "STDERR of No. {} is not correct".format(icmd)
+
+  cmd = cmdpool.getiCommand(icmdcnt)
+
+  assert cmd.status == 1, "EXIT CODE of the Exception is not correct"
+  assert "Exception: Script fails with a Python Exception!" in cmd.error\
+  , "STDERR does not report the Exception"
+
+  cmd = cmdpool.getiCommand(icmdcnt + 1)
+
+  assert cmd.status == 1, "EXIT CODE of the missing Callable is not correct"
+  assert "AttributeError" in cmd.error, "STDERR does not report the missing Callable"
+
+  assert cmdpool.completed == icmdcnt + 2, "Pool Completed Count is not correct"
+
+  cmdpool.Stop()
+
+  assert not cmdpool.warm, "Helper Process was not stopped"
+
+  print("")